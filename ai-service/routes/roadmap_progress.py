@@ -0,0 +1,354 @@
+"""
+ROADMAP PROGRESS STORE
+SQLite persistence of per-user roadmap progress
+
+Each user row keeps running aggregates (completed tasks, XP) and each
+phase row keeps its own completed/total counters and unlock flag. A task
+completion inserts one task row and bumps one phase row and the user row
+in a single transaction, so XP, phase progress, unlock state and health
+inputs are updated in O(1) - nothing re-walks the roadmap's tasks. A
+full recount happens only when a user's roadmap variant changes.
+
+Completed task rows are never deleted: switching variants only rebuilds
+the counters from the completions that apply to the new roadmap, so
+switching back restores everything. Completions are kept per career role,
+because task ids such as 'skill-sql' or 'portfolio-projects' recur across
+roles without the work carrying over.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_DB_PATH = 'data/roadmap_progress.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS roadmap_users (
+    user_id TEXT PRIMARY KEY,
+    variant TEXT NOT NULL,
+    career_role TEXT NOT NULL,
+    readiness_base REAL NOT NULL,
+    readiness_gain REAL NOT NULL,
+    confidence REAL NOT NULL,
+    total_tasks INTEGER NOT NULL,
+    completed_tasks INTEGER NOT NULL DEFAULT 0,
+    total_xp INTEGER NOT NULL,
+    current_xp INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS roadmap_phases (
+    user_id TEXT NOT NULL,
+    phase_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    total_tasks INTEGER NOT NULL,
+    completed_tasks INTEGER NOT NULL DEFAULT 0,
+    unlocked INTEGER NOT NULL,
+    PRIMARY KEY (user_id, phase_id)
+);
+CREATE TABLE IF NOT EXISTS roadmap_tasks (
+    user_id TEXT NOT NULL,
+    career_role TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    phase_id TEXT NOT NULL,
+    xp INTEGER NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (user_id, career_role, task_id)
+);
+"""
+
+
+class PhaseLockedError(Exception):
+    """Raised when completing a task in a phase that is still locked"""
+
+
+class RoadmapProgressStore:
+    """
+    Per-user task completions with incrementally maintained aggregates
+
+    Args:
+        db_path: SQLite file (directories are created)
+        unlock_rules: {phase_id: (prerequisite phase_id, percent complete)}
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH,
+                 unlock_rules: Optional[Dict[str, Tuple[str, float]]] = None):
+        self.db_path = db_path
+        self.unlock_rules = unlock_rules or {}
+        # Reverse lookup: phases that may unlock when a given phase progresses
+        self._unlocks_after: Dict[str, List[Tuple[str, float]]] = {}
+        for phase_id, (prerequisite, percent) in self.unlock_rules.items():
+            self._unlocks_after.setdefault(prerequisite, []).append((phase_id, percent))
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, unlock_rules: Optional[Dict[str, Tuple[str, float]]] = None) -> 'RoadmapProgressStore':
+        """Open the store at ROADMAP_PROGRESS_DB"""
+        return cls(os.getenv('ROADMAP_PROGRESS_DB', DEFAULT_DB_PATH), unlock_rules)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    # ------------------------------------------------------------------------
+    # Roadmap registration
+    # ------------------------------------------------------------------------
+
+    def start(self, user_id: str, career_role: str, variant: Sequence[Any],
+              phases: Sequence[Tuple[str, Sequence[Tuple[str, int]]]],
+              readiness_base: float, readiness_gain: float, confidence: float) -> Dict[str, Any]:
+        """
+        Register the roadmap a user is working on and return their progress
+
+        Calling again with the same variant only reads (no write transaction).
+        A different variant (new career, path or skill gaps) rebuilds the
+        phase counters and aggregates from the user's completions for that
+        career role that belong to the new roadmap; other completions are
+        kept for when the user switches back.
+
+        Args:
+            career_role: Role the completions are recorded under
+            variant: JSON-serializable key of the roadmap variant
+            phases: [(phase_id, [(task_id, xp), ...]), ...] in roadmap order
+            readiness_base: Readiness score before any task is completed
+            readiness_gain: Readiness added by completing the whole roadmap
+            confidence: Career match confidence used for health
+        """
+        variant_key = json.dumps(list(variant))
+        with self._lock:
+            row = self._conn.execute('SELECT variant FROM roadmap_users WHERE user_id = ?', (user_id,)).fetchone()
+        if row is None or row[0] != variant_key:
+            with self._transaction() as conn:
+                # Re-check: another request may have registered it meanwhile
+                row = conn.execute('SELECT variant FROM roadmap_users WHERE user_id = ?', (user_id,)).fetchone()
+                if row is None or row[0] != variant_key:
+                    self._reset(conn, user_id, career_role, variant_key, phases,
+                                readiness_base, readiness_gain, confidence)
+        return self.get_progress(user_id)
+
+    def preview(self, user_id: str, career_role: str, phases: Sequence[Tuple[str, Sequence[Tuple[str, int]]]],
+                readiness_base: float, readiness_gain: float, confidence: float) -> Dict[str, Any]:
+        """
+        A user's progress on a roadmap variant without registering it
+
+        Same result as start() but read-only, for views such as PDF export
+        that must not switch the roadmap the user is working on.
+        """
+        with self._lock:
+            counts = self._recount(self._conn, user_id, career_role, phases)
+        completed, completed_per_phase, totals, total_xp, current_xp = counts
+        summary = self._summary(readiness_base, readiness_gain, confidence,
+                                sum(totals.values()), len(completed), total_xp, current_xp)
+        return {
+            **summary,
+            'phases': {
+                phase_id: {
+                    'completedTasks': completed_per_phase.get(phase_id, 0),
+                    'totalTasks': totals[phase_id],
+                    'unlocked': self._is_unlocked(phase_id, totals, completed_per_phase)
+                }
+                for phase_id, _ in phases
+            },
+            'completedTaskIds': set(completed)
+        }
+
+    @staticmethod
+    def _recount(conn, user_id, career_role, phases):
+        """Completions of this user and role that belong to the given roadmap, and its totals"""
+        task_phase = {task_id: (phase_id, xp) for phase_id, tasks in phases for task_id, xp in tasks}
+        completed = [
+            task_id for (task_id,) in conn.execute(
+                'SELECT task_id FROM roadmap_tasks WHERE user_id = ? AND career_role = ?', (user_id, career_role)
+            )
+            if task_id in task_phase
+        ]
+        completed_per_phase: Dict[str, int] = {}
+        for task_id in completed:
+            phase_id = task_phase[task_id][0]
+            completed_per_phase[phase_id] = completed_per_phase.get(phase_id, 0) + 1
+        totals = {phase_id: len(tasks) for phase_id, tasks in phases}
+        total_xp = sum(xp for _, xp in task_phase.values())
+        current_xp = sum(task_phase[task_id][1] for task_id in completed)
+        return completed, completed_per_phase, totals, total_xp, current_xp
+
+    def _reset(self, conn, user_id, career_role, variant_key, phases,
+               readiness_base, readiness_gain, confidence) -> None:
+        # Task rows are kept as they are; only counters and aggregates are rebuilt
+        completed, completed_per_phase, totals, total_xp, current_xp = self._recount(
+            conn, user_id, career_role, phases
+        )
+
+        conn.execute('DELETE FROM roadmap_phases WHERE user_id = ?', (user_id,))
+        conn.executemany(
+            'INSERT INTO roadmap_phases (user_id, phase_id, position, total_tasks, completed_tasks, unlocked) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            [
+                (user_id, phase_id, position, totals[phase_id], completed_per_phase.get(phase_id, 0),
+                 int(self._is_unlocked(phase_id, totals, completed_per_phase)))
+                for position, (phase_id, _) in enumerate(phases)
+            ]
+        )
+        conn.execute(
+            'INSERT OR REPLACE INTO roadmap_users (user_id, variant, career_role, readiness_base, readiness_gain, '
+            'confidence, total_tasks, completed_tasks, total_xp, current_xp, updated_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (user_id, variant_key, career_role, readiness_base, readiness_gain, confidence,
+             sum(totals.values()), len(completed), total_xp, current_xp, time.time())
+        )
+
+    def _is_unlocked(self, phase_id: str, totals: Dict[str, int], completed: Dict[str, int]) -> bool:
+        rule = self.unlock_rules.get(phase_id)
+        if rule is None:
+            return True
+        prerequisite, percent = rule
+        total = totals.get(prerequisite, 0)
+        return total == 0 or completed.get(prerequisite, 0) * 100 >= percent * total
+
+    # ------------------------------------------------------------------------
+    # Task completion
+    # ------------------------------------------------------------------------
+
+    def variant(self, user_id: str) -> Optional[List[Any]]:
+        """Roadmap variant registered for a user (None if never started)"""
+        with self._lock:
+            row = self._conn.execute('SELECT variant FROM roadmap_users WHERE user_id = ?', (user_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def complete_task(self, user_id: str, task_id: str, phase_id: str, xp: int) -> Dict[str, Any]:
+        """
+        Mark a task completed, updating phase, unlock and XP aggregates
+
+        Completing an already completed task changes nothing (xpGained 0).
+
+        Raises:
+            PhaseLockedError: If the task's phase is still locked
+            KeyError: If the user has no registered roadmap
+        """
+        unlocked_phases = []
+        with self._transaction() as conn:
+            user = conn.execute('SELECT career_role FROM roadmap_users WHERE user_id = ?', (user_id,)).fetchone()
+            if user is None:
+                raise KeyError(f'No roadmap progress for user {user_id}')
+            phase = conn.execute(
+                'SELECT total_tasks, completed_tasks, unlocked FROM roadmap_phases WHERE user_id = ? AND phase_id = ?',
+                (user_id, phase_id)
+            ).fetchone()
+            if phase is None:
+                raise KeyError(f'No roadmap progress for user {user_id}')
+            total, completed, unlocked = phase
+            if not unlocked:
+                raise PhaseLockedError(f'Phase {phase_id} is locked')
+
+            inserted = conn.execute(
+                'INSERT OR IGNORE INTO roadmap_tasks (user_id, career_role, task_id, phase_id, xp, completed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (user_id, user[0], task_id, phase_id, xp, time.time())
+            ).rowcount
+            xp_gained = xp if inserted else 0
+
+            if inserted:
+                completed += 1
+                conn.execute(
+                    'UPDATE roadmap_phases SET completed_tasks = ? WHERE user_id = ? AND phase_id = ?',
+                    (completed, user_id, phase_id)
+                )
+                conn.execute(
+                    'UPDATE roadmap_users SET completed_tasks = completed_tasks + 1, '
+                    'current_xp = current_xp + ?, updated_at = ? WHERE user_id = ?',
+                    (xp, time.time(), user_id)
+                )
+                # Only phases gated on this one can change lock state
+                for next_phase, percent in self._unlocks_after.get(phase_id, []):
+                    if completed * 100 >= percent * total:
+                        changed = conn.execute(
+                            'UPDATE roadmap_phases SET unlocked = 1 WHERE user_id = ? AND phase_id = ? '
+                            'AND unlocked = 0',
+                            (user_id, next_phase)
+                        ).rowcount
+                        if changed:
+                            unlocked_phases.append(next_phase)
+
+            summary = self._user_summary(conn, user_id)
+
+        return {
+            **summary,
+            'xpGained': xp_gained,
+            'alreadyCompleted': not inserted,
+            'phase': {
+                'id': phase_id,
+                'completedTasks': completed,
+                'totalTasks': total,
+                'progressPercent': round(completed / total * 100, 1) if total else 0
+            },
+            'unlockedPhases': unlocked_phases
+        }
+
+    # ------------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def _user_summary(cls, conn, user_id: str) -> Dict[str, Any]:
+        row = conn.execute(
+            'SELECT readiness_base, readiness_gain, confidence, total_tasks, completed_tasks, total_xp, current_xp '
+            'FROM roadmap_users WHERE user_id = ?', (user_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f'No roadmap progress for user {user_id}')
+        return cls._summary(*row)
+
+    @staticmethod
+    def _summary(readiness_base: float, readiness_gain: float, confidence: float, total_tasks: int,
+                 completed_tasks: int, total_xp: int, current_xp: int) -> Dict[str, Any]:
+        # Readiness grows with the share of the roadmap's XP earned
+        readiness = readiness_base + (readiness_gain * current_xp / total_xp if total_xp else 0)
+        return {
+            'totalTasks': total_tasks,
+            'completedTasks': completed_tasks,
+            'totalXP': total_xp,
+            'currentXP': current_xp,
+            'completionPercent': round(completed_tasks / total_tasks * 100, 1) if total_tasks else 0,
+            'readinessScore': round(min(100.0, readiness), 1),
+            'confidenceScore': confidence
+        }
+
+    def get_progress(self, user_id: str) -> Dict[str, Any]:
+        """Aggregates, per-phase counters and completed task ids for a user"""
+        with self._lock:
+            summary = self._user_summary(self._conn, user_id)
+            phases = {
+                phase_id: {'completedTasks': completed, 'totalTasks': total, 'unlocked': bool(unlocked)}
+                for phase_id, total, completed, unlocked in self._conn.execute(
+                    'SELECT phase_id, total_tasks, completed_tasks, unlocked FROM roadmap_phases '
+                    'WHERE user_id = ? ORDER BY position', (user_id,)
+                )
+            }
+            completed_ids = {
+                task_id for (task_id,) in self._conn.execute(
+                    'SELECT task_id FROM roadmap_tasks t JOIN roadmap_users u USING (user_id) '
+                    'WHERE t.user_id = ? AND t.career_role = u.career_role', (user_id,)
+                )
+            }
+        return {**summary, 'phases': phases, 'completedTaskIds': completed_ids}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,134 @@
+"""
+Analysis Codec Module
+=====================
+Compact, versioned serialization for stored resume analyses.
+
+Format v2 (current):
+- the raw resume text is never stored (the report does not use it)
+- fields derivable from others (success, skills_count, keywords_count)
+  are dropped and rebuilt on read
+- known field names are replaced by short codes ('#0', '#1', ...)
+- the JSON is zlib-compressed behind a one-byte version header
+
+decode_analysis() also reads plain JSON, so analyses stored before this
+format keep loading.
+
+Author: CareerNexus AI
+"""
+
+import json
+import zlib
+from typing import Any, Dict
+
+FORMAT_VERSION = 2
+
+# Fields never written to storage
+DROPPED_FIELDS = ['text']
+
+# Field names in analyses, careers, skill gaps and score inputs.
+# Append only: a code's position is its meaning in stored payloads.
+FIELD_NAMES = [
+    'success', 'analysis_id', 'overall_score', 'ats_status', 'ats_message', 'ats_color',
+    'breakdown', 'skill_relevance', 'keywords_ats', 'projects_experience', 'structure',
+    'score', 'weight', 'contribution', 'skills', 'skills_count', 'keywords', 'keywords_count',
+    'education', 'projects', 'experience', 'primary_career', 'top_3_careers', 'alternate_roles',
+    'skill_gap', 'skill_development_plan', 'improvement_suggestions', 'stats', 'timestamp',
+    'score_inputs', 'scoring_version', 'role', 'match_percentage', 'confidence',
+    'confidence_message', 'matched_skills', 'missing_skills', 'required_skills_match',
+    'required_skills_total', 'preferred_skills_match', 'preferred_skills_total',
+    'target_role', 'missing_critical', 'missing_nice_to_have', 'strength_areas',
+    'gap_percentage', 'skill_match_percentage', 'matched_count', 'missing_count',
+    'timeline', 'total_skills_to_learn', 'recommendations', 'next_steps', 'skill',
+    'priority', 'reason', 'suggested_action', 'word_count', 'has_contact_info',
+    'projects_count', 'experience_count'
+]
+
+FIELD_CODES = {name: f"#{index}" for index, name in enumerate(FIELD_NAMES)}
+CODE_FIELDS = {code: name for name, code in FIELD_CODES.items()}
+
+_V2_HEADER = bytes([FORMAT_VERSION])
+
+
+def _shorten(value: Any) -> Any:
+    if isinstance(value, dict):
+        shortened = {}
+        for key, item in value.items():
+            if key in FIELD_CODES:
+                key = FIELD_CODES[key]
+            elif key.startswith('#'):
+                key = '#' + key  # escape keys that look like codes
+            shortened[key] = _shorten(item)
+        return shortened
+    if isinstance(value, list):
+        return [_shorten(item) for item in value]
+    return value
+
+
+def _expand(value: Any) -> Any:
+    if isinstance(value, dict):
+        expanded = {}
+        for key, item in value.items():
+            if key.startswith('##'):
+                key = key[1:]
+            else:
+                key = CODE_FIELDS.get(key, key)
+            expanded[key] = _expand(item)
+        return expanded
+    if isinstance(value, list):
+        return [_expand(item) for item in value]
+    return value
+
+
+def compact_analysis(analysis: Dict) -> Dict:
+    """Drop the raw text and derivable fields from an analysis."""
+    compact = {
+        key: value for key, value in analysis.items()
+        if key not in DROPPED_FIELDS and key not in ('success', 'skills_count', 'keywords_count')
+    }
+    if isinstance(compact.get('stats'), dict):
+        compact['stats'] = {k: v for k, v in compact['stats'].items() if k not in DROPPED_FIELDS}
+    return compact
+
+
+def restore_analysis(compact: Dict) -> Dict:
+    """Rebuild the fields compact_analysis() dropped."""
+    analysis = {'success': True, **compact}
+    if 'skills' in analysis:
+        analysis['skills_count'] = len(analysis['skills'])
+    if 'keywords' in analysis:
+        analysis['keywords_count'] = len(analysis['keywords'])
+    return analysis
+
+
+def encode_analysis(analysis: Dict, level: int = 6) -> bytes:
+    """
+    Serialize an analysis in the current compact format.
+
+    Args:
+        analysis: Complete analysis dictionary
+        level: zlib compression level
+
+    Returns:
+        Version header byte followed by compressed JSON
+    """
+    text = json.dumps(_shorten(compact_analysis(analysis)), separators=(',', ':'), ensure_ascii=False)
+    return _V2_HEADER + zlib.compress(text.encode('utf-8'), level)
+
+
+def decode_analysis(payload: bytes) -> Dict:
+    """
+    Read an analysis written in any supported format.
+
+    Raises:
+        ValueError: If the payload format is not recognized
+    """
+    if not payload:
+        raise ValueError('Empty analysis payload')
+
+    header = payload[0]
+    if header == FORMAT_VERSION:
+        return restore_analysis(_expand(json.loads(zlib.decompress(payload[1:]).decode('utf-8'))))
+    if payload[:1] == b'{':
+        return json.loads(payload.decode('utf-8'))
+
+    raise ValueError(f"Unsupported analysis payload format (header byte {header})")
@@ -0,0 +1,363 @@
+"""
+Analysis Store Module
+=====================
+Persistent storage for resume analyses used by the report download.
+
+Backends:
+- SQLiteAnalysisStore: one WAL-mode SQLite file, primary-key lookup by
+  analysis_id, compact compressed payloads (analysis_codec.py), TTL expiry
+  and a bounded connection pool shared by request threads
+- JsonFileAnalysisStore: the original uploads/analysis_<id>.json layout,
+  kept as a fallback and for reading analyses saved before the database
+
+create_analysis_store() picks the backend from the environment.
+
+Author: CareerNexus AI
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from analysis_codec import compact_analysis, decode_analysis, encode_analysis, restore_analysis
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+DEFAULT_UPLOAD_DIR = 'uploads'
+DEFAULT_DB_PATH = os.path.join(DEFAULT_UPLOAD_DIR, 'analyses.db')
+DEFAULT_TTL_HOURS = 24 * 30
+DEFAULT_POOL_SIZE = 4
+
+# Seconds between opportunistic purges of expired rows
+PURGE_INTERVAL = 3600
+
+# Ids bound per IN (...) query, under SQLite's default limit of 999 parameters
+LOAD_MANY_BATCH = 900
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    analysis_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_expires_at ON analyses (expires_at);
+"""
+
+
+class JsonFileAnalysisStore:
+    """
+    One uploads/analysis_<id>.json file per analysis (the original layout).
+    """
+
+    def __init__(self, directory: str = DEFAULT_UPLOAD_DIR, ttl_seconds: Optional[float] = None):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, analysis_id: str) -> str:
+        return os.path.join(self.directory, f"analysis_{analysis_id}.json")
+
+    def save(self, analysis_id: str, analysis: Dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(analysis_id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(compact_analysis(analysis), f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def load(self, analysis_id: str) -> Optional[Dict]:
+        path = self._path(analysis_id)
+        try:
+            if self.ttl_seconds and time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            with open(path, 'r') as f:
+                return restore_analysis(json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def delete(self, analysis_id: str) -> bool:
+        try:
+            os.remove(self._path(analysis_id))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def iter_ids(self, batch_size: int = 500) -> Iterator[List[str]]:
+        """Yield stored analysis ids in batches."""
+        batch = []
+        if not os.path.isdir(self.directory):
+            return
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('analysis_') and entry.name.endswith('.json'):
+                    batch.append(entry.name[len('analysis_'):-len('.json')])
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+        if batch:
+            yield batch
+
+    def load_many(self, analysis_ids: List[str]) -> Dict[str, Dict]:
+        found = {}
+        for analysis_id in analysis_ids:
+            analysis = self.load(analysis_id)
+            if analysis is not None:
+                found[analysis_id] = analysis
+        return found
+
+    def save_many(self, analyses: Dict[str, Dict]) -> None:
+        for analysis_id, analysis in analyses.items():
+            self.save(analysis_id, analysis)
+
+    def update_many(self, analyses: Dict[str, Dict]) -> None:
+        """Rewrite existing analyses, keeping their original age for the TTL."""
+        for analysis_id, analysis in analyses.items():
+            path = self._path(analysis_id)
+            stat = os.stat(path)
+            self.save(analysis_id, analysis)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteAnalysisStore:
+    """
+    Single-file SQLite store (WAL mode) with a bounded connection pool.
+    """
+
+    def __init__(self,
+                 db_path: str = DEFAULT_DB_PATH,
+                 ttl_seconds: Optional[float] = DEFAULT_TTL_HOURS * 3600,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 fallback: Optional[JsonFileAnalysisStore] = None):
+        """
+        Open (or create) the analysis database.
+
+        Args:
+            db_path: SQLite database file
+            ttl_seconds: Lifetime of a saved analysis (None = keep forever)
+            pool_size: Maximum open connections; callers wait for a free one
+            fallback: Store consulted on a miss (legacy JSON files)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.fallback = fallback
+        self._pool: queue.Queue = queue.Queue(maxsize=pool_size)
+        self._created = 0
+        self._pool_size = pool_size
+        self._pool_lock = threading.Lock()
+        self._last_purge = 0.0
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection, opening a new one while under pool_size."""
+        conn = None
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                if self._created < self._pool_size:
+                    self._created += 1
+                    create = True
+                else:
+                    create = False
+            if create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._pool_lock:
+                        self._created -= 1
+                    raise
+            else:
+                conn = self._pool.get(timeout=30)
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def _expiry(self, now: float) -> Optional[float]:
+        return now + self.ttl_seconds if self.ttl_seconds else None
+
+    def save(self, analysis_id: str, analysis: Dict) -> None:
+        self.save_many({analysis_id: analysis})
+
+    def save_many(self, analyses: Dict[str, Dict]) -> None:
+        """Insert or replace several analyses in one transaction."""
+        now = time.time()
+        rows = [
+            (analysis_id, now, self._expiry(now), encode_analysis(analysis))
+            for analysis_id, analysis in analyses.items()
+        ]
+        with self._connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO analyses (analysis_id, created_at, expires_at, payload) '
+                    'VALUES (?, ?, ?, ?)',
+                    rows
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+        if now - self._last_purge > PURGE_INTERVAL:
+            self._last_purge = now
+            self.purge_expired()
+
+    def update_many(self, analyses: Dict[str, Dict]) -> None:
+        """Replace payloads of existing analyses, keeping their expiry."""
+        rows = [(encode_analysis(analysis), analysis_id) for analysis_id, analysis in analyses.items()]
+        with self._connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.executemany('UPDATE analyses SET payload = ? WHERE analysis_id = ?', rows)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+    def load(self, analysis_id: str) -> Optional[Dict]:
+        with self._connection() as conn:
+            row = conn.execute(
+                'SELECT payload FROM analyses WHERE analysis_id = ? AND (expires_at IS NULL OR expires_at > ?)',
+                (analysis_id, time.time())
+            ).fetchone()
+
+        if row is not None:
+            return decode_analysis(row[0])
+        if self.fallback is not None:
+            return self.fallback.load(analysis_id)
+        return None
+
+    def load_many(self, analysis_ids: List[str]) -> Dict[str, Dict]:
+        """Like load() for several ids: unexpired rows, then the fallback for the rest."""
+        found = {}
+        now = time.time()
+        with self._connection() as conn:
+            for start in range(0, len(analysis_ids), LOAD_MANY_BATCH):
+                batch = analysis_ids[start:start + LOAD_MANY_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                rows = conn.execute(
+                    f'SELECT analysis_id, payload FROM analyses WHERE analysis_id IN ({placeholders}) '
+                    'AND (expires_at IS NULL OR expires_at > ?)',
+                    [*batch, now]
+                ).fetchall()
+                found.update((analysis_id, decode_analysis(payload)) for analysis_id, payload in rows)
+
+        if self.fallback is not None:
+            for analysis_id in analysis_ids:
+                if analysis_id not in found:
+                    analysis = self.fallback.load(analysis_id)
+                    if analysis is not None:
+                        found[analysis_id] = analysis
+        return found
+
+    def delete(self, analysis_id: str) -> bool:
+        with self._connection() as conn:
+            deleted = conn.execute('DELETE FROM analyses WHERE analysis_id = ?', (analysis_id,)).rowcount
+        if self.fallback is not None:
+            deleted += self.fallback.delete(analysis_id)
+        return deleted > 0
+
+    def iter_ids(self, batch_size: int = 500) -> Iterator[List[str]]:
+        """Yield unexpired analysis ids in batches (keyset pagination)."""
+        last_id = ''
+        while True:
+            with self._connection() as conn:
+                rows = conn.execute(
+                    'SELECT analysis_id FROM analyses WHERE analysis_id > ? '
+                    'AND (expires_at IS NULL OR expires_at > ?) ORDER BY analysis_id LIMIT ?',
+                    (last_id, time.time(), batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            batch = [row[0] for row in rows]
+            last_id = batch[-1]
+            yield batch
+
+    def purge_expired(self, batch_size: int = 1000) -> int:
+        """Delete expired analyses in small batches; returns rows removed."""
+        removed = 0
+        while True:
+            with self._connection() as conn:
+                deleted = conn.execute(
+                    'DELETE FROM analyses WHERE rowid IN ('
+                    'SELECT rowid FROM analyses WHERE expires_at <= ? LIMIT ?)',
+                    (time.time(), batch_size)
+                ).rowcount
+            removed += deleted
+            if deleted < batch_size:
+                return removed
+
+    def stats(self) -> Dict:
+        with self._connection() as conn:
+            count = conn.execute('SELECT COUNT(*) FROM analyses').fetchone()[0]
+        size = sum(
+            os.path.getsize(path) for path in (self.db_path, f"{self.db_path}-wal")
+            if os.path.exists(path)
+        )
+        return {'backend': 'sqlite', 'analyses': count, 'bytes': size, 'pool_size': self._pool_size}
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._pool_lock:
+                self._created -= 1
+
+
+def create_analysis_store() -> Tuple[object, str]:
+    """
+    Build the analysis store configured by the environment.
+
+    ANALYSIS_STORE: 'sqlite' (default) or 'json'
+    ANALYSIS_DB_PATH: SQLite file (default uploads/analyses.db)
+    ANALYSIS_TTL_HOURS: Analysis lifetime, 0 = never expire (default 720)
+    ANALYSIS_DB_POOL_SIZE: Maximum SQLite connections (default 4)
+
+    Returns:
+        (store, backend name); falls back to JSON files if SQLite can't be opened
+    """
+    ttl_hours = float(os.getenv('ANALYSIS_TTL_HOURS', DEFAULT_TTL_HOURS))
+    ttl_seconds = ttl_hours * 3600 if ttl_hours > 0 else None
+    json_store = JsonFileAnalysisStore(DEFAULT_UPLOAD_DIR, ttl_seconds)
+
+    if os.getenv('ANALYSIS_STORE', 'sqlite').lower() == 'json':
+        return json_store, 'json'
+
+    try:
+        store = SQLiteAnalysisStore(
+            os.getenv('ANALYSIS_DB_PATH', DEFAULT_DB_PATH),
+            ttl_seconds=ttl_seconds,
+            pool_size=int(os.getenv('ANALYSIS_DB_POOL_SIZE', DEFAULT_POOL_SIZE)),
+            fallback=json_store
+        )
+        return store, 'sqlite'
+    except sqlite3.Error as e:
+        print(f"❌ Could not open analysis database ({e}); using JSON files")
+        return json_store, 'json'
@@ -4,18 +4,34 @@ Main application file with all API endpoints for career guidance
 Routes: /assess, /score, /roadmap/<career>, /report
 """
 
-from flask import Flask, request, jsonify, send_file, render_template
+from flask import Flask, request, jsonify, render_template, Response
 from flask_cors import CORS
 import joblib
 import numpy as np
-import json
+import pandas as pd
 from datetime import datetime
 import os
+import time
+import atexit
 from io import BytesIO
+from typing import NamedTuple, Any
+from urllib.parse import quote
 
-# Import career roadmap and PDF generation
+# Import career roadmap data
 from career_roadmap import CAREER_ROADMAPS, get_roadmap
-from pdf_generator import generate_career_pdf
+from prediction_cache import PredictionCache, compute_model_version
+from feature_encoder import FeatureEncoder, FeatureValidationError
+from prediction_explainer import build_explainer
+from cohort_scoring import (
+    CAREER_INTERESTS, FALLBACK_INTERESTS, READINESS_BANDS, READINESS_WEIGHTS, score_cohort, iter_csv
+)
+from cohort_analytics import CohortAnalytics, METRICS
+from analysis_store import create_analysis_store
+from uploads_janitor import UploadsJanitor
+from report_cache import ReportCache
+from render_queue import RenderQueue, QueueFullError
+from bulk_export import BulkExportRegistry, stream_reports_zip
+from response_catalog import ResponseCatalog
 
 # ============================================
 # INITIALIZE FLASK APP
@@ -26,19 +42,227 @@ CORS(app)  # Enable CORS for frontend communication
 # ============================================
 # LOAD TRAINED MODELS
 # ============================================
-try:
+MODEL_DIR = 'models'
+
+# Seconds between checks for a retrained model bundle on disk
+MODEL_CHECK_INTERVAL = float(os.getenv('MODEL_CHECK_INTERVAL', 30))
+
+class ModelBundle(NamedTuple):
+    """Everything loaded from MODEL_DIR, published as one object so requests never see a mix of versions"""
+    model: Any
+    scaler: Any
+    career_classes: Any
+    feature_encoder: FeatureEncoder
+    explainer: Any
+    cache: PredictionCache
+    version: str
+
+_last_model_check = 0.0
+
+# Placeholder until the first successful load (encodes inputs, but cannot predict)
+_default_encoder = FeatureEncoder()
+model_bundle = ModelBundle(
+    model=None,
+    scaler=None,
+    career_classes=None,
+    feature_encoder=_default_encoder,
+    explainer=None,
+    cache=PredictionCache.from_env(_default_encoder.feature_names, version='missing'),
+    version='missing'
+)
+
+# ============================================
+# COHORT ANALYTICS
+# ============================================
+# Optional JSON snapshot so score distributions survive restarts
+ANALYTICS_SNAPSHOT_PATH = os.getenv('ANALYTICS_SNAPSHOT_PATH')
+
+# Distinct colleges (and careers) with their own slices; later names share 'Other'
+ANALYTICS_MAX_GROUPS = int(os.getenv('ANALYTICS_MAX_GROUPS', 500))
+
+cohort_analytics = (
+    CohortAnalytics.load(ANALYTICS_SNAPSHOT_PATH, ANALYTICS_MAX_GROUPS) if ANALYTICS_SNAPSHOT_PATH
+    else CohortAnalytics(ANALYTICS_MAX_GROUPS)
+)
+
+if ANALYTICS_SNAPSHOT_PATH:
+    atexit.register(cohort_analytics.save, ANALYTICS_SNAPSHOT_PATH)
+
+# ============================================
+# RESUME ANALYSIS STORE
+# ============================================
+analysis_store, analysis_store_backend = create_analysis_store()
+print(f"✓ Resume analysis store: {analysis_store_backend}")
+
+# Background sweeper for expired / over-quota files in uploads/
+# (the analysis database itself is never deleted by it)
+db_path = getattr(analysis_store, 'db_path', '')
+uploads_janitor = UploadsJanitor.from_env(
+    protected=[os.path.basename(db_path) + suffix for suffix in ('', '-wal', '-shm')] if db_path else []
+)
+# Render workers import this module as __mp_main__ and must not sweep as well
+if uploads_janitor.interval > 0 and __name__ != '__mp_main__':
+    uploads_janitor.start()
+
+# Rendered resume report PDFs, keyed by analysis + template version
+report_cache = ReportCache.from_env()
+
+# PDF rendering runs in worker processes so it never holds the request GIL
+render_queue = RenderQueue.from_env()
+atexit.register(render_queue.shutdown)
+
+# Seconds a download request waits for its render before returning a job id
+RENDER_SYNC_TIMEOUT = float(os.getenv('RENDER_SYNC_TIMEOUT', 30))
+
+# Cohort ZIP exports (progress is kept for the most recent exports)
+bulk_exports = BulkExportRegistry()
+BULK_EXPORT_MAX_ITEMS = int(os.getenv('BULK_EXPORT_MAX_ITEMS', 500))
+
+def pdf_response(pdf_bytes, filename, etag=None):
+    """
+    Send PDF bytes as a download, with an ETag when given.
+    
+    The bytes object is the response body as-is (no BytesIO wrapper, no
+    chunked re-reads), so Content-Length is set and the PDF isn't copied.
+    """
+    response = Response(pdf_bytes, mimetype='application/pdf')
+    try:
+        filename.encode('ascii')
+        response.headers.set('Content-Disposition', 'attachment', filename=filename)
+    except UnicodeEncodeError:
+        response.headers.set(
+            'Content-Disposition', 'attachment',
+            filename=filename.encode('ascii', 'ignore').decode('ascii') or 'report.pdf',
+            **{'filename*': f"UTF-8''{quote(filename)}"}
+        )
+    if etag:
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, max-age=86400'
+    return response
+
+def render_job_response(job, async_mode, etag=None):
+    """
+    Return the PDF if the job finishes within RENDER_SYNC_TIMEOUT (sync mode),
+    otherwise 202 with the job id and status/download URLs
+    """
+    if not async_mode and render_queue.wait(job, RENDER_SYNC_TIMEOUT):
+        # Served here, so the job doesn't hold the PDF until RENDER_RESULT_TTL
+        render_queue.discard(job)
+        return pdf_response(render_queue.result(job), job.filename, etag)
+    
+    return jsonify({
+        'success': True,
+        **job.to_dict(),
+        'status_url': f"/api/report/jobs/{job.job_id}",
+        'download_url': f"/api/report/jobs/{job.job_id}/download"
+    }), 202
+
+TRUE_FLAGS = ('1', 'true', 'yes', 'on')
+FALSE_FLAGS = ('', '0', 'false', 'no', 'off')
+
+def parse_flag(value, name):
+    """
+    Boolean from a JSON value or query string: true/false, 1/0, yes/no, on/off
+    (missing = False). Anything else raises ValueError, so "false" is never truthy
+    """
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    text = str(value).strip().lower()
+    if text in TRUE_FLAGS:
+        return True
+    if text in FALSE_FLAGS:
+        return False
+    raise ValueError(f"'{name}' must be true or false")
+
+def flag_error_response(error):
+    """400 response for a flag parse_flag rejected"""
+    return jsonify({'error': str(error), 'success': False}), 400
+
+def queue_full_response(error):
+    """429 response telling the client to retry once the render queue drains"""
+    response = jsonify({'error': str(error), 'success': False})
+    response.headers['Retry-After'] = '5'
+    return response, 429
+
+def record_analytics(metric, score, college=None, career=None):
+    """Fold a completed score into the cohort sketches; never fails the request"""
+    try:
+        cohort_analytics.record(metric, score, college=college or None, career=career or None)
+    except Exception as e:
+        print(f"❌ Analytics update failed: {e}")
+
+def load_model_bundle():
+    """
+    Load (or reload) the trained model bundle from MODEL_DIR
+    Every artifact is loaded into locals first and the module-level model_bundle is
+    replaced in a single assignment, so a failed load keeps the previous bundle
+    """
+    global model_bundle
+    
+    current = model_bundle
+    version = compute_model_version(MODEL_DIR)
+    
     # Load the trained RandomForest model
-    model = joblib.load('models/career_rf_model.pkl')
+    model = joblib.load(os.path.join(MODEL_DIR, 'career_rf_model.pkl'))
     
     # Load the feature scaler
-    scaler = joblib.load('models/scaler.pkl')
+    scaler = joblib.load(os.path.join(MODEL_DIR, 'scaler.pkl'))
     
     # Load feature names
-    feature_names = joblib.load('models/feature_names.pkl')
+    feature_names = joblib.load(os.path.join(MODEL_DIR, 'feature_names.pkl'))
     
     # Load career classes
-    career_classes = joblib.load('models/career_classes.pkl')
+    career_classes = joblib.load(os.path.join(MODEL_DIR, 'career_classes.pkl'))
+    
+    # Encode inputs in the column order the model was trained with
+    feature_encoder = FeatureEncoder(feature_names)
+    prediction_cache = current.cache
+    if prediction_cache.feature_names != feature_encoder.feature_names:
+        prediction_cache = PredictionCache.from_env(feature_encoder.feature_names, version=version)
+    
+    # Precompute per-node path attributions (None for non-tree models)
+    prediction_explainer = build_explainer(model, feature_encoder.feature_names)
+    
+    model_bundle = ModelBundle(
+        model=model,
+        scaler=scaler,
+        career_classes=career_classes,
+        feature_encoder=feature_encoder,
+        explainer=prediction_explainer,
+        cache=prediction_cache,
+        version=version
+    )
+
+def refresh_model_bundle():
+    """
+    Reload the model bundle if train_model.py has rewritten it
+    Checks at most once per MODEL_CHECK_INTERVAL seconds
+    
+    Returns:
+        The current ModelBundle; callers should use this one snapshot for the whole request
+    """
+    global _last_model_check
+    
+    now = time.monotonic()
+    if now - _last_model_check < MODEL_CHECK_INTERVAL:
+        return model_bundle
+    _last_model_check = now
+    
+    if compute_model_version(MODEL_DIR) != model_bundle.version:
+        try:
+            load_model_bundle()
+            print(f"✓ Model bundle reloaded (version {model_bundle.version})")
+        except Exception as e:
+            print(f"❌ Error reloading models: {e}")
     
+    return model_bundle
+
+try:
+    load_model_bundle()
     print("✓ Models loaded successfully!")
 except Exception as e:
     print(f"❌ Error loading models: {e}")
@@ -440,6 +664,34 @@ ROADMAP_DATA = {
     }
 }
 
+def roadmap_payload(career):
+    """Response body for GET /api/roadmap/<career> (career is a ROADMAP_DATA key)"""
+    roadmap = ROADMAP_DATA[career]
+    return {
+        'success': True,
+        'career': career,
+        'duration': roadmap['duration'],
+        'steps': roadmap['steps']
+    }
+
+# Case-insensitive career name -> ROADMAP_DATA key
+ROADMAP_CAREERS = {career.lower(): career for career in ROADMAP_DATA}
+
+# Browsers and CDNs may reuse a roadmap this long, then revalidate by ETag
+ROADMAP_MAX_AGE = int(os.getenv('ROADMAP_MAX_AGE', 3600))
+
+# Seconds allowed at startup for pre-serializing roadmap responses
+# (anything not ready in time is served via jsonify as before)
+ROADMAP_WARMUP_SECONDS = float(os.getenv('ROADMAP_WARMUP_SECONDS', 2))
+
+# Same encoding as jsonify outside debug mode (compact, trailing newline)
+roadmap_responses = ResponseCatalog.warm(
+    ((career, lambda career=career: roadmap_payload(career)) for career in ROADMAP_DATA),
+    dumps=lambda payload: app.json.dumps(payload, separators=(',', ':')),
+    budget_seconds=ROADMAP_WARMUP_SECONDS
+)
+print(f"✓ Roadmap responses pre-serialized: {len(roadmap_responses)}/{len(ROADMAP_DATA)}")
+
 # ============================================
 # CAREER CHAT RESPONSES (Rule-based + ML Fallback)
 # ============================================
@@ -490,19 +742,17 @@ def calculate_readiness_score(skills_match, academic_score, interest_alignment):
     Returns:
         Score 0-100 and color coding
     """
-    score = (skills_match * 0.40) + (academic_score * 0.30) + (interest_alignment * 0.30)
+    score = (
+        skills_match * READINESS_WEIGHTS['skills_match'] +
+        academic_score * READINESS_WEIGHTS['academic_score'] +
+        interest_alignment * READINESS_WEIGHTS['interest_alignment']
+    )
     score = min(100, max(0, score))  # Clamp to 0-100
     
-    # Color coding
-    if score < 40:
-        color = 'red'
-        status = 'Needs Improvement'
-    elif score < 70:
-        color = 'yellow'
-        status = 'On Track'
-    else:
-        color = 'green'
-        status = 'Career Ready'
+    # Color coding (first band whose limit the score is under)
+    for limit, color, status in READINESS_BANDS:
+        if limit is None or score < limit:
+            break
     
     return {
         'score': round(score, 2),
@@ -510,26 +760,67 @@ def calculate_readiness_score(skills_match, academic_score, interest_alignment):
         'status': status
     }
 
-def prepare_features(data):
+def prepare_features(data, bundle):
     """
     Prepare features from user input for ML model
-    Converts user data to feature array matching training data
+    Encodes a dict, list of dicts or DataFrame with the bundle's persisted feature schema
+    
+    Returns:
+        float32 array of shape (n_records, n_features)
+    """
+    return bundle.feature_encoder.encode(data)
+
+def predict_career(features, bundle, explain=False):
+    """
+    Predict career and class probabilities for one prepared feature row
+    Serves repeated (or quantized-identical) inputs from the prediction cache
+    
+    Args:
+        features: (1, n_features) array from prepare_features
+        bundle: ModelBundle snapshot the features were prepared with
+        explain: Also return per-feature contributions for the predicted career
+    
+    Returns:
+        (predicted career, probabilities array aligned with bundle.career_classes, explanation or None)
+    """
+    prediction_cache = bundle.cache
+    cache_key = prediction_cache.make_key(features[0])
+    version = bundle.version
+    cached = prediction_cache.get(cache_key, version)
+    
+    # Predict on the bucket representative so every hit sees the same answer
+    features_scaled = None
+    if cached is None:
+        features_scaled = bundle.scaler.transform(np.array([cache_key]))
+        prediction = bundle.model.predict(features_scaled)[0]
+        probabilities = bundle.model.predict_proba(features_scaled)[0]
+        cached = (prediction, tuple(probabilities), None)
+        prediction_cache.put(cache_key, cached, version)
+    
+    prediction, probabilities, explanation = cached
+    
+    # Explanations are computed on first request and cached next to the prediction
+    if explain and explanation is None and bundle.explainer is not None:
+        if features_scaled is None:
+            features_scaled = bundle.scaler.transform(np.array([cache_key]))
+        explanation = bundle.explainer.explain(
+            features_scaled, cache_key, int(np.argmax(probabilities))
+        )
+        prediction_cache.put(cache_key, (prediction, probabilities, explanation), version)
+    
+    return prediction, np.array(probabilities), explanation if explain else None
+
+def predict_careers(features, bundle):
+    """
+    Predict careers and class probabilities for a batch of prepared feature rows
+    
+    Returns:
+        (predicted careers array, probabilities matrix aligned with bundle.career_classes)
     """
-    features = [
-        data.get('Python', 0),
-        data.get('Java', 0),
-        data.get('SQL', 0),
-        data.get('ML', 0),
-        data.get('Communication', 0),
-        data.get('ProblemSolving', 0),
-        data.get('Data_Interest', 0),
-        data.get('Development_Interest', 0),
-        data.get('Management_Interest', 0),
-        data.get('Research_Interest', 0),
-        data.get('Design_Interest', 0),
-        data.get('CGPA', 0)
-    ]
-    return np.array([features])
+    features_scaled = bundle.scaler.transform(features)
+    probabilities = bundle.model.predict_proba(features_scaled)
+    predictions = bundle.model.classes_[np.argmax(probabilities, axis=1)]
+    return predictions, probabilities
 
 # ============================================
 # API ENDPOINTS
@@ -556,7 +847,9 @@ def health_check():
             'service': 'CareerNexus AI',
             'version': '1.0',
             'timestamp': datetime.now().isoformat(),
-            'models_loaded': True
+            'models_loaded': True,
+            'uploads_janitor': uploads_janitor.stats(),
+            'report_cache': report_cache.stats()
         }), 200
     except Exception as e:
         return jsonify({
@@ -583,7 +876,8 @@ def assess_career():
         "Data_Interest": 90, "Development_Interest": 60,
         "Management_Interest": 40, "Research_Interest": 85,
         "Design_Interest": 35, "CGPA": 8.5,
-        "name": "John Doe", "email": "john@example.com"
+        "name": "John Doe", "email": "john@example.com",
+        "explain": true  (optional, or ?explain=true)
     }
     
     Output JSON:
@@ -591,7 +885,11 @@ def assess_career():
         "primary_career": "ML Engineer",
         "confidence": 87.5,
         "top_3_careers": [...],
-        "prediction_explanation": "..."
+        "explanation": {            (only when explain is requested)
+            "career": "ML Engineer",
+            "base_value": 26.7,
+            "contributions": [{"feature": "ML", "value": 5.0, "contribution": 31.2}, ...]
+        }
     }
     """
     try:
@@ -605,19 +903,29 @@ def assess_career():
         if not data:
             return jsonify({'error': 'No input data provided'}), 400
         
+        # One bundle snapshot for the whole request, even if a reload lands mid-way
+        bundle = refresh_model_bundle()
+        
         # Prepare features
-        features = prepare_features(data)
-        features_scaled = scaler.transform(features)
+        try:
+            features = prepare_features(data, bundle)
+        except FeatureValidationError as e:
+            return jsonify({'error': str(e), 'success': False}), 400
         
-        # Get predictions
-        prediction = model.predict(features_scaled)[0]
-        probabilities = model.predict_proba(features_scaled)[0]
+        # The body's explain flag takes precedence over ?explain=
+        try:
+            explain = parse_flag(data.get('explain', request.args.get('explain')), 'explain')
+        except ValueError as e:
+            return flag_error_response(e)
+        
+        # Get predictions (cached by feature vector)
+        prediction, probabilities, explanation = predict_career(features, bundle, explain=explain)
         
         # Get top 3 careers with confidence
         top_3_indices = np.argsort(probabilities)[-3:][::-1]
         top_3_careers = [
             {
-                'career': career_classes[idx],
+                'career': bundle.career_classes[idx],
                 'confidence': round(probabilities[idx] * 100, 2)
             }
             for idx in top_3_indices
@@ -639,11 +947,76 @@ def assess_career():
             'message': f'Based on your profile, {prediction} is the best fit with {round(max(probabilities) * 100, 2)}% confidence!'
         }
         
+        if explain:
+            response['explanation'] = explanation
+        
         return jsonify(response), 200
         
     except Exception as e:
         return jsonify({'error': str(e), 'success': False}), 500
 
+@app.route('/api/assess/batch', methods=['POST'])
+def assess_career_batch():
+    """
+    POST /assess/batch
+    Predicts careers for many students in one vectorized call
+    
+    Input JSON:
+    {
+        "students": [{"Python": 4, "Java": 3, ..., "CGPA": 8.5}, ...]
+    }
+    
+    Output JSON:
+    {
+        "success": true,
+        "count": 2,
+        "results": [{"primary_career": "ML Engineer", "confidence": 87.5, "top_3_careers": [...]}, ...]
+    }
+    """
+    try:
+        data = request.get_json()
+        students = data.get('students') if isinstance(data, dict) else data
+        
+        if not students or not isinstance(students, list):
+            return jsonify({'error': 'Provide a non-empty "students" list', 'success': False}), 400
+        
+        bundle = refresh_model_bundle()
+        try:
+            features = prepare_features(students, bundle)
+        except FeatureValidationError as e:
+            return jsonify({'error': str(e), 'success': False}), 400
+        
+        predictions, probabilities = predict_careers(features, bundle)
+        top_3_indices = np.argsort(probabilities, axis=1)[:, -3:][:, ::-1]
+        
+        results = [
+            {
+                'primary_career': predictions[row],
+                'confidence': round(probabilities[row].max() * 100, 2),
+                'top_3_careers': [
+                    {
+                        'career': bundle.career_classes[idx],
+                        'confidence': round(probabilities[row, idx] * 100, 2)
+                    }
+                    for idx in top_3_indices[row]
+                ]
+            }
+            for row in range(len(students))
+        ]
+        
+        return jsonify({'success': True, 'count': len(results), 'results': results}), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e), 'success': False}), 500
+
+@app.route('/api/assess/cache', methods=['GET'])
+def assess_cache_stats():
+    """
+    GET /api/assess/cache
+    Returns prediction cache statistics (hit ratio, size, model version)
+    """
+    return jsonify({'success': True, 'cache': model_bundle.cache.stats()}), 200
+
 @app.route('/api/score', methods=['POST'])
 def calculate_score():
     """
@@ -657,7 +1030,8 @@ def calculate_score():
         "Data_Interest": 90, "Development_Interest": 60,
         "Management_Interest": 40, "Research_Interest": 85,
         "Design_Interest": 35, "CGPA": 8.5,
-        "predicted_career": "ML Engineer"
+        "predicted_career": "ML Engineer",
+        "college": "ABC Institute"  (optional, used for cohort analytics)
     }
     
     Output JSON:
@@ -686,22 +1060,13 @@ def calculate_score():
         
         # Calculate interest alignment (0-100)
         career = data.get('predicted_career', 'Data Analyst')
-        interests = {
-            'Data Analyst': ['Data_Interest'],
-            'ML Engineer': ['Research_Interest', 'Data_Interest'],
-            'Full Stack Developer': ['Development_Interest'],
-            'Data Scientist': ['Research_Interest'],
-            'Frontend Developer': ['Development_Interest', 'Design_Interest'],
-            'Business Analyst': ['Data_Interest', 'Management_Interest'],
-            'Project Manager': ['Management_Interest']
-        }
-        
-        relevant_interests = interests.get(career, ['Data_Interest'])
+        relevant_interests = CAREER_INTERESTS.get(career, FALLBACK_INTERESTS)
         interest_values = [data.get(interest, 0) for interest in relevant_interests]
         interest_alignment = sum(interest_values) / len(interest_values)
         
         # Calculate readiness score
         readiness = calculate_readiness_score(skills_match, academic_score, interest_alignment)
+        record_analytics('readiness', readiness['score'], college=data.get('college'), career=career)
         
         response = {
             'success': True,
@@ -726,12 +1091,108 @@ def calculate_score():
     except Exception as e:
         return jsonify({'error': str(e), 'success': False}), 500
 
+@app.route('/api/score/cohort', methods=['POST'])
+def calculate_cohort_scores():
+    """
+    POST /score/cohort
+    Calculates Career Readiness Scores for a whole cohort in one vectorized pass
+    
+    Input (any of):
+    - multipart upload with a CSV 'file'
+    - text/csv body
+    - JSON array of students (or {"students": [...]}), same fields as /score
+    
+    Optional columns student_id, name and email are copied to the output.
+    
+    Returns: CSV stream with predicted_career, readiness_score, status, color,
+             skills_match, academic_score, interest_alignment per student
+    """
+    try:
+        if 'file' in request.files:
+            cohort = pd.read_csv(request.files['file'].stream)
+        elif request.mimetype == 'text/csv':
+            cohort = pd.read_csv(BytesIO(request.get_data()))
+        else:
+            data = request.get_json(silent=True)
+            students = data.get('students') if isinstance(data, dict) else data
+            if not isinstance(students, list) or not all(isinstance(s, dict) for s in students):
+                return jsonify({'error': 'Provide a CSV file or a JSON array of students', 'success': False}), 400
+            cohort = pd.DataFrame.from_records(students)
+        
+        try:
+            result = score_cohort(cohort)
+        except ValueError as e:
+            return jsonify({'error': str(e), 'success': False}), 400
+        
+        return Response(
+            iter_csv(result),
+            mimetype='text/csv',
+            headers={'Content-Disposition': 'attachment; filename=cohort_readiness_scores.csv'}
+        )
+        
+    except Exception as e:
+        return jsonify({'error': str(e), 'success': False}), 500
+
+@app.route('/api/analytics/<metric>', methods=['GET'])
+def get_cohort_analytics(metric):
+    """
+    GET /api/analytics/<metric>
+    Score distribution for a cohort slice, served from streaming sketches
+    
+    metric: 'readiness' (/api/score) or 'ats' (/api/resume/analyze)
+    Query params (optional): college OR career, period (YYYY-MM)
+    
+    Output JSON:
+    {
+        "success": true,
+        "metric": "readiness",
+        "filters": {"college": "ABC Institute", "career": null, "period": "2024-06"},
+        "summary": {
+            "count": 412, "mean": 63.4, "min": 21.5, "max": 96.0,
+            "percentiles": {"p10": 41.2, "p25": 52.8, "p50": 64.1, "p75": 74.9, "p90": 83.3},
+            "histogram": {"bin_edges": [0, 5, ..., 100], "counts": [...]}
+        }
+    }
+    """
+    if metric not in METRICS:
+        return jsonify({'error': f"Unknown metric. Use one of: {', '.join(METRICS)}", 'success': False}), 404
+    
+    filters = {
+        'college': request.args.get('college') or None,
+        'career': request.args.get('career') or None,
+        'period': request.args.get('period') or None
+    }
+    
+    try:
+        summary = cohort_analytics.summary(metric, **filters)
+    except ValueError as e:
+        return jsonify({'error': str(e), 'success': False}), 400
+    
+    if summary is None:
+        summary = {'count': 0}
+    
+    return jsonify({'success': True, 'metric': metric, 'filters': filters, 'summary': summary}), 200
+
+@app.route('/api/analytics/<metric>/groups', methods=['GET'])
+def get_cohort_analytics_groups(metric):
+    """
+    GET /api/analytics/<metric>/groups
+    Lists the colleges, careers and periods with recorded scores
+    """
+    if metric not in METRICS:
+        return jsonify({'error': f"Unknown metric. Use one of: {', '.join(METRICS)}", 'success': False}), 404
+    
+    return jsonify({'success': True, 'metric': metric, **cohort_analytics.groups(metric)}), 200
+
 @app.route('/api/roadmap/<career>', methods=['GET'])
 def get_career_roadmap(career):
     """
     GET /roadmap/<career>
     Returns personalized 6-month career roadmap
     
+    Career names are case-insensitive. Responses carry a strong ETag (hash
+    of the body) and are publicly cacheable; If-None-Match gets 304.
+    
     Returns:
     {
         "career": "ML Engineer",
@@ -741,20 +1202,21 @@ def get_career_roadmap(career):
     """
     try:
         # Normalize career name
-        for key in ROADMAP_DATA.keys():
-            if key.lower() == career.lower():
-                roadmap = ROADMAP_DATA[key]
-                return jsonify({
-                    'success': True,
-                    'career': key,
-                    'duration': roadmap['duration'],
-                    'steps': roadmap['steps']
-                }), 200
+        key = ROADMAP_CAREERS.get(career.lower())
+        if key is None:
+            return jsonify({
+                'error': f'Career "{career}" not found. Available careers: {list(ROADMAP_DATA.keys())}',
+                'success': False
+            }), 404
         
-        return jsonify({
-            'error': f'Career "{career}" not found. Available careers: {list(ROADMAP_DATA.keys())}',
-            'success': False
-        }), 404
+        entry = roadmap_responses.lookup(key, lambda: roadmap_payload(key))
+        if request.if_none_match.contains_weak(entry.etag):
+            response = Response(status=304)
+        else:
+            response = Response(entry.body, mimetype='application/json')
+        response.set_etag(entry.etag)
+        response.headers['Cache-Control'] = f'public, max-age={ROADMAP_MAX_AGE}'
+        return response
         
     except Exception as e:
         return jsonify({'error': str(e), 'success': False}), 500
@@ -777,24 +1239,205 @@ def generate_report():
         "interests": {...}
     }
     
-    Returns: PDF file
+    Rendering runs on the render queue. Add ?async=true to get a job id
+    immediately (202); otherwise the request waits up to RENDER_SYNC_TIMEOUT
+    seconds for the PDF and falls back to 202 with the job id.
+    
+    Returns: PDF file (or 202 job status, 429 if the render queue is full)
     """
     try:
         data = request.get_json()
+        try:
+            async_mode = parse_flag(request.args.get('async'), 'async')
+        except ValueError as e:
+            return flag_error_response(e)
+        
+        try:
+            job = render_queue.submit(
+                'career_report', data, f"Career_Report_{data.get('name', 'Student')}.pdf"
+            )
+        except QueueFullError as e:
+            return queue_full_response(e)
+        
+        return render_job_response(job, async_mode)
+        
+    except Exception as e:
+        return jsonify({'error': str(e), 'success': False}), 500
+
+@app.route('/api/report/jobs/<job_id>', methods=['GET'])
+def get_render_job(job_id):
+    """
+    GET /api/report/jobs/<job_id>
+    Status of a queued PDF render; ?wait=<seconds> blocks until it finishes
+    
+    Output JSON:
+    {
+        "success": true,
+        "job_id": "3f9c1a2b7d4e",
+        "kind": "career_report",
+        "status": "queued" | "running" | "done" | "failed",
+        "download_url": "/api/report/jobs/3f9c1a2b7d4e/download"
+    }
+    """
+    job = render_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Render job not found or expired', 'success': False}), 404
+    
+    try:
+        wait = min(float(request.args.get('wait', 0)), RENDER_SYNC_TIMEOUT)
+    except ValueError:
+        return jsonify({'error': 'wait must be a number of seconds', 'success': False}), 400
+    if wait > 0:
+        render_queue.wait(job, wait)
+    
+    return jsonify({
+        'success': True,
+        **job.to_dict(),
+        'download_url': f"/api/report/jobs/{job.job_id}/download"
+    }), 200
+
+@app.route('/api/report/jobs/<job_id>/download', methods=['GET'])
+def download_render_job(job_id):
+    """
+    GET /api/report/jobs/<job_id>/download
+    Downloads the PDF of a finished render job (202 while still rendering)
+    """
+    job = render_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Render job not found or expired', 'success': False}), 404
+    
+    status = job.status
+    if status == 'failed':
+        return jsonify({'success': False, **job.to_dict()}), 500
+    if status != 'done':
+        return jsonify({'success': True, **job.to_dict()}), 202
+    
+    return pdf_response(render_queue.result(job), job.filename)
+
+@app.route('/api/report/bulk', methods=['POST'])
+def export_reports_bulk():
+    """
+    POST /api/report/bulk
+    Streams a ZIP with one PDF report per student
+    
+    Input JSON (one of):
+    {
+        "students": [{"name": "John Doe", "primary_career": "ML Engineer", ...}, ...]
+    }
+    {
+        "analysis_ids": ["A1B2C3D4", ...]
+    }
+    
+    "students" entries take the /api/report payload and produce career
+    reports; "analysis_ids" produce resume analysis reports (served from the
+    report cache when possible). PDFs are rendered on the render queue and
+    written into the ZIP as each finishes. The archive ends with
+    manifest.json listing each item's status and error. The X-Export-Id
+    response header identifies the export for
+    GET /api/report/bulk/<export_id> progress polling.
+    
+    Returns: application/zip stream
+    """
+    from werkzeug.utils import secure_filename
+    from resume_report_generator import REPORT_TEMPLATE_VERSION
+    
+    try:
+        data = request.get_json(silent=True) or {}
+        students = data.get('students')
+        analysis_ids = data.get('analysis_ids')
+        
+        if (students is None) == (analysis_ids is None):
+            return jsonify({'error': 'Provide either "students" or "analysis_ids"', 'success': False}), 400
+        entries = students if students is not None else analysis_ids
+        if not isinstance(entries, list) or not entries:
+            return jsonify({'error': 'Expected a non-empty list', 'success': False}), 400
+        if len(entries) > BULK_EXPORT_MAX_ITEMS:
+            return jsonify({
+                'error': f'At most {BULK_EXPORT_MAX_ITEMS} reports per export',
+                'success': False
+            }), 400
         
-        # Generate PDF
-        pdf_buffer = generate_career_pdf(data)
+        items = []
+        if students is not None:
+            kind = 'career_report'
+            for i, student in enumerate(students, 1):
+                if not isinstance(student, dict):
+                    items.append({'id': i, 'filename': f"{i:04d}_invalid.pdf",
+                                  'error': 'Student entry must be a JSON object'})
+                    continue
+                name = str(student.get('name') or 'Student')
+                items.append({
+                    'id': student.get('email') or name,
+                    'filename': f"{i:04d}_Career_Report_{secure_filename(name) or 'Student'}.pdf",
+                    'kind': kind,
+                    'payload': student
+                })
+        else:
+            kind = 'resume_report'
+            ids = [str(analysis_id) for analysis_id in analysis_ids]
+            analyses = analysis_store.load_many(list(dict.fromkeys(ids)))
+            for i, analysis_id in enumerate(ids, 1):
+                filename = f"{i:04d}_Resume_Analysis_Report_{secure_filename(analysis_id) or 'unknown'}.pdf"
+                analysis_data = analyses.get(analysis_id)
+                if analysis_data is None:
+                    items.append({'id': analysis_id, 'filename': filename, 'error': 'Analysis not found'})
+                    continue
+                items.append({
+                    'id': analysis_id,
+                    'filename': filename,
+                    'kind': kind,
+                    'payload': analysis_data,
+                    'cache_key': report_cache.make_key(
+                        analysis_id, REPORT_TEMPLATE_VERSION, analysis_data.get('scoring_version', '')
+                    )
+                })
         
-        return send_file(
-            BytesIO(pdf_buffer),
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=f"Career_Report_{data.get('name', 'Student')}.pdf"
+        export = bulk_exports.create(kind, len(items))
+        print(f"Streaming bulk export {export.export_id} ({len(items)} {kind}s)...")
+        
+        return Response(
+            stream_reports_zip(export, items, render_queue, report_cache),
+            mimetype='application/zip',
+            headers={
+                'Content-Disposition': f'attachment; filename=CareerNexus_Reports_{export.export_id}.zip',
+                'X-Export-Id': export.export_id,
+                'Cache-Control': 'no-store'
+            }
         )
         
     except Exception as e:
         return jsonify({'error': str(e), 'success': False}), 500
 
+@app.route('/api/report/bulk/<export_id>', methods=['GET'])
+def get_bulk_export(export_id):
+    """
+    GET /api/report/bulk/<export_id>
+    Progress of a bulk export
+    
+    Output JSON:
+    {
+        "success": true,
+        "export_id": "5be0c2f19a7d",
+        "status": "running" | "done" | "aborted",
+        "total": 120,
+        "completed": 87,
+        "failed": 2,
+        "progress": 74.2
+    }
+    """
+    export = bulk_exports.get(export_id)
+    if export is None:
+        return jsonify({'error': 'Export not found', 'success': False}), 404
+    return jsonify({'success': True, **export.to_dict()}), 200
+
+@app.route('/api/report/queue', methods=['GET'])
+def render_queue_stats():
+    """
+    GET /api/report/queue
+    Render queue metrics: depth, counters, render time and queue wait percentiles
+    """
+    return jsonify({'success': True, 'queue': render_queue.stats()}), 200
+
 @app.route('/api/chat', methods=['POST'])
 def career_chat():
     """
@@ -854,7 +1497,7 @@ def analyze_resume():
     POST /api/resume/analyze
     Analyzes uploaded resume PDF
     
-    Input: FormData with 'resume' file (PDF)
+    Input: FormData with 'resume' file (PDF) and optional 'college'
     
     Output JSON:
     {
@@ -869,7 +1512,7 @@ def analyze_resume():
     """
     from werkzeug.utils import secure_filename
     from resume_parser import ResumeParser
-    from resume_scorer import ResumeScorer
+    from resume_scorer import ResumeScorer, get_score_inputs, get_scoring_version
     from career_matcher import CareerMatcher
     from skill_gap_analyzer import SkillGapAnalyzer
     import uuid
@@ -961,20 +1604,29 @@ def analyze_resume():
             'skill_development_plan': skill_dev_plan,
             'improvement_suggestions': improvement_suggestions,
             'stats': parsed_data['stats'],
+            'score_inputs': get_score_inputs(
+                parsed_data['skills'],
+                parsed_data['keywords'],
+                parsed_data['projects'],
+                parsed_data['experience'],
+                parsed_data['stats']
+            ),
+            'scoring_version': get_scoring_version(),
             'timestamp': datetime.now().isoformat()
         }
         
-        # Store analysis in session/cache for report generation
-        # For now, we'll store it as a temporary file
-        analysis_file_path = os.path.join('uploads', f"analysis_{analysis_id}.json")
-        with open(analysis_file_path, 'w') as f:
-            json.dump(complete_analysis, f)
+        # Store analysis for report generation
+        analysis_store.save(analysis_id, complete_analysis)
         
         # Clean up uploaded resume file
         try:
             os.remove(temp_path)
-        except:
-            pass
+        except OSError as e:
+            # Left for the uploads janitor to expire
+            print(f"❌ Could not remove {temp_path}: {e}")
+        
+        record_analytics('ats', score_result['overall_score'],
+                         college=request.form.get('college'), career=primary_career.get('role'))
         
         print(f"Resume analysis complete! ID: {analysis_id}")
         
@@ -992,31 +1644,52 @@ def download_resume_report(analysis_id):
     GET /api/resume/report/<analysis_id>
     Downloads PDF report for resume analysis
     
+    Rendered PDFs are cached; responses carry an ETag and a matching
+    If-None-Match request gets 304 Not Modified. Uncached reports render on
+    the render queue (?async=true returns a job id, as for /api/report).
+    
     Returns: PDF file
     """
-    from resume_report_generator import generate_resume_analysis_report
+    from resume_report_generator import REPORT_TEMPLATE_VERSION
     
     try:
-        # Load analysis data from file
-        analysis_file_path = os.path.join('uploads', f"analysis_{analysis_id}.json")
+        try:
+            async_mode = parse_flag(request.args.get('async'), 'async')
+        except ValueError as e:
+            return flag_error_response(e)
+        
+        # Load stored analysis data
+        analysis_data = analysis_store.load(analysis_id)
         
-        if not os.path.exists(analysis_file_path):
+        if analysis_data is None:
             return jsonify({'error': 'Analysis not found. Please analyze resume first.', 'success': False}), 404
         
-        with open(analysis_file_path, 'r') as f:
-            analysis_data = json.load(f)
+        # Rescoring changes the report, so the scoring version is part of the key
+        cache_key = report_cache.make_key(
+            analysis_id, REPORT_TEMPLATE_VERSION, analysis_data.get('scoring_version', '')
+        )
         
-        # Generate PDF report
+        if request.if_none_match.contains(cache_key):
+            response = Response(status=304)
+            response.set_etag(cache_key)
+            return response
+        
+        filename = f"Resume_Analysis_Report_{analysis_id}.pdf"
+        pdf_bytes = report_cache.get(cache_key)
+        if pdf_bytes is not None:
+            return pdf_response(pdf_bytes, filename, cache_key)
+        
+        # Generate PDF report on the render queue
         print(f"Generating PDF report for analysis {analysis_id}...")
-        pdf_bytes = generate_resume_analysis_report(analysis_data)
-        
-        # Return PDF file
-        return send_file(
-            BytesIO(pdf_bytes),
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=f"Resume_Analysis_Report_{analysis_id}.pdf"
-        )
+        try:
+            job = render_queue.submit(
+                'resume_report', analysis_data, filename,
+                on_success=lambda pdf: report_cache.put(cache_key, pdf)
+            )
+        except QueueFullError as e:
+            return queue_full_response(e)
+        
+        return render_job_response(job, async_mode, cache_key)
         
     except Exception as e:
         print(f"Error generating report: {str(e)}")
@@ -1045,9 +1718,16 @@ if __name__ == '__main__':
     print("Starting server on http://127.0.0.1:5002")
     print("Endpoints:")
     print("  POST /assess - Career prediction")
+    print("  POST /api/assess/batch - Batch career prediction")
+    print("  GET  /api/assess/cache - Prediction cache statistics")
     print("  POST /score - Readiness score calculation")
+    print("  POST /api/score/cohort - Cohort readiness scores (CSV)")
+    print("  GET  /api/analytics/<metric> - Readiness/ATS score distributions")
     print("  GET  /roadmap/<career> - Career roadmap")
     print("  POST /report - Generate PDF report")
+    print("  GET  /api/report/jobs/<id> - PDF render job status")
+    print("  POST /api/report/bulk - Cohort PDF reports as a streamed ZIP")
+    print("  GET  /api/report/queue - PDF render queue metrics")
     print("  POST /chat - Career chat assistant")
     print("  POST /api/resume/analyze - Resume analyzer (NEW)")
     print("  GET  /api/resume/report/<id> - Download resume report (NEW)")
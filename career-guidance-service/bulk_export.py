@@ -0,0 +1,183 @@
+"""
+Bulk Report Export Module
+=========================
+Streams a ZIP of PDF reports for a whole cohort.
+
+Reports are rendered on the render queue's worker processes and each PDF
+is written into the archive as soon as it finishes, then flushed to the
+client - only the renders in flight are ever held in memory. The archive
+ends with manifest.json listing every item with its status, so one bad
+payload never fails the whole export. Progress of a running export can be
+polled through its export id.
+
+Author: CareerNexus AI
+"""
+
+import json
+import threading
+import time
+import uuid
+import zipfile
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional
+
+# Finished exports kept for progress lookups
+DEFAULT_MAX_EXPORTS = 100
+
+
+class BulkExport:
+    """
+    Progress of one bulk export.
+    """
+
+    def __init__(self, kind: str, total: int):
+        self.export_id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.bytes_written = 0
+        self.status = 'running'
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        done = self.completed + self.failed
+        return {
+            'export_id': self.export_id,
+            'kind': self.kind,
+            'status': self.status,
+            'total': self.total,
+            'completed': self.completed,
+            'failed': self.failed,
+            'progress': round(done / self.total * 100, 1) if self.total else 100.0,
+            'bytes_written': self.bytes_written,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+
+
+class BulkExportRegistry:
+    """
+    Recent exports by id, oldest dropped first.
+    """
+
+    def __init__(self, max_exports: int = DEFAULT_MAX_EXPORTS):
+        self.max_exports = max_exports
+        self._exports: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, kind: str, total: int) -> BulkExport:
+        export = BulkExport(kind, total)
+        with self._lock:
+            self._exports[export.export_id] = export
+            while len(self._exports) > self.max_exports:
+                self._exports.popitem(last=False)
+        return export
+
+    def get(self, export_id: str) -> Optional[BulkExport]:
+        with self._lock:
+            return self._exports.get(export_id)
+
+
+class _ZipStream:
+    """
+    Write-only sink for zipfile; drain() hands back what was written since
+    the last call. It has no seek()/tell(), so zipfile writes data
+    descriptors instead of going back to patch local headers.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_reports_zip(export: BulkExport, items: List[Dict], render_queue,
+                       report_cache=None, window: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Render the items and yield the ZIP archive in chunks.
+
+    Args:
+        export: Progress record updated as items finish
+        items: One dict per report with 'id' and 'filename', plus either
+               'kind' and 'payload' to render or 'error' for an item that
+               was rejected up front. An optional 'cache_key' serves the
+               PDF from report_cache and stores fresh renders in it.
+        render_queue: RenderQueue whose workers render the PDFs
+        report_cache: ReportCache used for items with a cache_key
+        window: Renders in flight at once (default: one per worker)
+
+    Yields:
+        ZIP bytes, one chunk per finished report plus the central directory
+    """
+    stream = _ZipStream()
+    manifest = [None] * len(items)
+    renders = []
+
+    def record(index, pdf_bytes=None, error=None, cached=False):
+        item = items[index]
+        entry = {'id': item['id'], 'filename': item['filename']}
+        if error is None:
+            archive.writestr(item['filename'], pdf_bytes)
+            entry.update({'status': 'ok', 'bytes': len(pdf_bytes), 'cached': cached})
+            export.completed += 1
+        else:
+            entry.update({'status': 'failed', 'error': error})
+            export.failed += 1
+        manifest[index] = entry
+        chunk = stream.drain()
+        export.bytes_written += len(chunk)
+        return chunk
+
+    try:
+        # PDFs are already compressed internally; level 1 keeps CPU low
+        with zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+            for index, item in enumerate(items):
+                if 'error' in item:
+                    yield record(index, error=item['error'])
+                    continue
+                cached = None
+                if report_cache is not None and item.get('cache_key'):
+                    cached = report_cache.get(item['cache_key'])
+                if cached is not None:
+                    yield record(index, cached, cached=True)
+                else:
+                    renders.append(index)
+
+            for position, pdf_bytes, error in render_queue.map_unordered(
+                    ((items[index]['kind'], items[index]['payload']) for index in renders), window):
+                index = renders[position]
+                if error is None and report_cache is not None and items[index].get('cache_key'):
+                    report_cache.put(items[index]['cache_key'], pdf_bytes)
+                yield record(index, pdf_bytes, error)
+
+            export.status = 'done'
+            export.finished_at = time.time()
+            archive.writestr('manifest.json', json.dumps({
+                'export_id': export.export_id,
+                'kind': export.kind,
+                'generated_at': export.finished_at,
+                'total': export.total,
+                'completed': export.completed,
+                'failed': export.failed,
+                'items': manifest
+            }, indent=2))
+        chunk = stream.drain()
+        export.bytes_written += len(chunk)
+        yield chunk
+    finally:
+        if export.status != 'done':
+            # Client disconnected mid-stream
+            export.status = 'aborted'
+            export.finished_at = time.time()
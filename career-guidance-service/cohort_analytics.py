@@ -0,0 +1,416 @@
+"""
+Cohort Analytics Module
+=======================
+Streaming distribution summaries for placement dashboards.
+
+Readiness scores (calculate_readiness_score) and ATS overall scores
+(ResumeScorer.calculate_overall_score) are folded into mergeable sketches
+as each assessment or resume analysis completes:
+- FixedHistogram: fixed-width bins over the 0-100 score range
+- TDigest: merging t-digest for percentiles with bounded memory
+
+Sketches are kept per metric for the whole platform, per college, per
+career and per month (and college/career × month), so a dashboard query is
+a dictionary lookup plus an O(compression) summary - it never rescans
+stored analyses. Every sketch can be merged with another of its kind, so
+per-process or per-day sketches can be combined.
+
+College and career names come from clients, so they are trimmed and, past
+max_groups distinct names per dimension, folded into an 'Other' slice.
+
+Author: CareerNexus AI
+"""
+
+import json
+import math
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+METRICS = ['readiness', 'ats']
+
+SCORE_RANGE = (0.0, 100.0)
+HISTOGRAM_BINS = 20
+TDIGEST_COMPRESSION = 100
+SUMMARY_QUANTILES = [0.10, 0.25, 0.50, 0.75, 0.90]
+
+# Distinct colleges (and careers) tracked before new names share OTHER_GROUP;
+# each name costs 6 sketches per metric
+DEFAULT_MAX_GROUPS = 500
+MAX_GROUP_NAME_LENGTH = 100
+OTHER_GROUP = 'Other'
+
+# (college, career, period), None meaning "all"
+GroupKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+class FixedHistogram:
+    """
+    Fixed-bin histogram over a closed range; values outside are clamped.
+    """
+
+    def __init__(self, low: float = SCORE_RANGE[0], high: float = SCORE_RANGE[1], bins: int = HISTOGRAM_BINS):
+        self.low = low
+        self.high = high
+        self.counts = [0] * bins
+
+    def add(self, value: float) -> None:
+        bins = len(self.counts)
+        index = int((value - self.low) / (self.high - self.low) * bins)
+        self.counts[min(bins - 1, max(0, index))] += 1
+
+    def merge(self, other: 'FixedHistogram') -> None:
+        if (other.low, other.high, len(other.counts)) != (self.low, self.high, len(self.counts)):
+            raise ValueError('Cannot merge histograms with different bins')
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+
+    def to_dict(self) -> Dict:
+        width = (self.high - self.low) / len(self.counts)
+        return {
+            'bin_edges': [round(self.low + i * width, 4) for i in range(len(self.counts) + 1)],
+            'counts': list(self.counts)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FixedHistogram':
+        edges = data['bin_edges']
+        histogram = cls(edges[0], edges[-1], len(data['counts']))
+        histogram.counts = list(data['counts'])
+        return histogram
+
+
+class TDigest:
+    """
+    Merging t-digest (Dunning & Ertl) for streaming quantile estimates.
+
+    Incoming values are buffered and periodically merged into at most
+    ~compression centroids using the k1 (arcsine) scale function, which
+    keeps centroids small near the tails where accuracy matters most.
+    """
+
+    def __init__(self, compression: int = TDIGEST_COMPRESSION):
+        self.compression = compression
+        self.means: List[float] = []
+        self.weights: List[float] = []
+        self._buffer: List[Tuple[float, float]] = []
+        self.count = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _k(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _k_inverse(self, k: float) -> float:
+        return (math.sin(min(k * 2 * math.pi / self.compression, math.pi / 2)) + 1) / 2
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self.compression * 5:
+            self._compress()
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+
+        points = sorted(list(zip(self.means, self.weights)) + self._buffer)
+        self._buffer = []
+        total = sum(weight for _, weight in points)
+
+        means, weights = [], []
+        cur_mean, cur_weight = points[0]
+        weight_so_far = 0.0
+        q_limit = self._k_inverse(self._k(0.0) + 1) * total
+
+        for mean, weight in points[1:]:
+            if weight_so_far + cur_weight + weight <= q_limit:
+                # Merge into the current centroid (running weighted mean)
+                cur_weight += weight
+                cur_mean += (mean - cur_mean) * weight / cur_weight
+            else:
+                means.append(cur_mean)
+                weights.append(cur_weight)
+                weight_so_far += cur_weight
+                q_limit = self._k_inverse(self._k(weight_so_far / total) + 1) * total
+                cur_mean, cur_weight = mean, weight
+
+        means.append(cur_mean)
+        weights.append(cur_weight)
+        self.means, self.weights = means, weights
+
+    def merge(self, other: 'TDigest') -> None:
+        other._compress()
+        for mean, weight in zip(other.means, other.weights):
+            self._buffer.append((mean, weight))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-th quantile (0-1); None if no values were added."""
+        self._compress()
+        if not self.means:
+            return None
+        if len(self.means) == 1:
+            return self.means[0]
+
+        target = q * self.count
+        if target <= self.weights[0] / 2:
+            # Interpolate between the minimum and the first centroid
+            return self.min + (self.means[0] - self.min) * target / (self.weights[0] / 2)
+
+        cumulative = self.weights[0] / 2
+        for i in range(len(self.means) - 1):
+            step = (self.weights[i] + self.weights[i + 1]) / 2
+            if cumulative + step >= target:
+                fraction = (target - cumulative) / step
+                return self.means[i] + (self.means[i + 1] - self.means[i]) * fraction
+            cumulative += step
+
+        # Interpolate between the last centroid and the maximum
+        remaining = self.weights[-1] / 2
+        fraction = min(1.0, (target - cumulative) / remaining)
+        return self.means[-1] + (self.max - self.means[-1]) * fraction
+
+    def to_dict(self) -> Dict:
+        self._compress()
+        return {
+            'compression': self.compression,
+            'means': list(self.means),
+            'weights': list(self.weights),
+            'count': self.count,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TDigest':
+        digest = cls(data['compression'])
+        digest.means = list(data['means'])
+        digest.weights = list(data['weights'])
+        digest.count = data['count']
+        digest.min = data['min'] if data['min'] is not None else math.inf
+        digest.max = data['max'] if data['max'] is not None else -math.inf
+        return digest
+
+
+class ScoreSketch:
+    """
+    Count, mean, histogram and t-digest for one stream of scores.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.histogram = FixedHistogram()
+        self.digest = TDigest()
+
+    def add(self, score: float) -> None:
+        self.count += 1
+        self.total += score
+        self.histogram.add(score)
+        self.digest.add(score)
+
+    def merge(self, other: 'ScoreSketch') -> None:
+        self.count += other.count
+        self.total += other.total
+        self.histogram.merge(other.histogram)
+        self.digest.merge(other.digest)
+
+    def summary(self) -> Dict:
+        percentiles = {}
+        for q in SUMMARY_QUANTILES:
+            value = self.digest.quantile(q)
+            percentiles[f"p{int(q * 100)}"] = round(value, 2) if value is not None else None
+
+        return {
+            'count': self.count,
+            'mean': round(self.total / self.count, 2) if self.count else None,
+            'min': round(self.digest.min, 2) if self.count else None,
+            'max': round(self.digest.max, 2) if self.count else None,
+            'percentiles': percentiles,
+            'histogram': self.histogram.to_dict()
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'total': self.total,
+            'histogram': self.histogram.to_dict(),
+            'digest': self.digest.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ScoreSketch':
+        sketch = cls()
+        sketch.count = data['count']
+        sketch.total = data['total']
+        sketch.histogram = FixedHistogram.from_dict(data['histogram'])
+        sketch.digest = TDigest.from_dict(data['digest'])
+        return sketch
+
+
+def _clean_name(name: Optional[str]) -> Optional[str]:
+    """Collapse whitespace and truncate a college/career name (None if empty)."""
+    if not name:
+        return None
+    return ' '.join(str(name).split())[:MAX_GROUP_NAME_LENGTH] or None
+
+
+class CohortAnalytics:
+    """
+    Thread-safe registry of score sketches per metric and cohort slice.
+    """
+
+    def __init__(self, max_groups: int = DEFAULT_MAX_GROUPS):
+        """
+        Args:
+            max_groups: Distinct colleges, and distinct careers, kept as their own slices
+        """
+        self.max_groups = max_groups
+        self._sketches: Dict[str, Dict[GroupKey, ScoreSketch]] = {metric: {} for metric in METRICS}
+        self._colleges = set()
+        self._careers = set()
+        self._lock = threading.Lock()
+
+    def _admit(self, name: Optional[str], known: set) -> Optional[str]:
+        """Clean a name and fold it into OTHER_GROUP once max_groups names are known (lock held)."""
+        name = _clean_name(name)
+        if name is None or name in known:
+            return name
+        if len(known) >= self.max_groups:
+            return OTHER_GROUP
+        known.add(name)
+        return name
+
+    def _admit_key(self, key: GroupKey) -> GroupKey:
+        """Apply _admit to the college and career of a slice key (lock held)."""
+        college, career, period = key
+        return self._admit(college, self._colleges), self._admit(career, self._careers), period
+
+    def record(self, metric: str, score: float,
+               college: Optional[str] = None,
+               career: Optional[str] = None,
+               timestamp: Optional[datetime] = None) -> None:
+        """
+        Fold one completed score into every slice it belongs to.
+
+        Args:
+            metric: 'readiness' or 'ats'
+            score: Score on the 0-100 scale
+            college: College / institution name, if known
+            career: Predicted or matched career
+            timestamp: When the analysis completed (default: now)
+        """
+        if metric not in self._sketches:
+            raise ValueError(f"Unknown metric '{metric}'. Expected one of {METRICS}")
+
+        period = (timestamp or datetime.now()).strftime('%Y-%m')
+
+        with self._lock:
+            college = self._admit(college, self._colleges)
+            career = self._admit(career, self._careers)
+            slices = {
+                (None, None, None),
+                (None, None, period),
+                (college, None, None),
+                (college, None, period),
+                (None, career, None),
+                (None, career, period)
+            }
+            sketches = self._sketches[metric]
+            for key in slices:
+                sketch = sketches.get(key)
+                if sketch is None:
+                    sketch = sketches[key] = ScoreSketch()
+                sketch.add(float(score))
+
+    def summary(self, metric: str,
+                college: Optional[str] = None,
+                career: Optional[str] = None,
+                period: Optional[str] = None) -> Optional[Dict]:
+        """
+        Return the distribution summary for one slice (None if nothing recorded).
+
+        Supported slices: overall, per college, per career, and each of those per
+        period ('YYYY-MM'). College and career cannot be combined.
+        """
+        if metric not in self._sketches:
+            raise ValueError(f"Unknown metric '{metric}'. Expected one of {METRICS}")
+        if college and career:
+            raise ValueError('Filter by college or by career, not both')
+
+        with self._lock:
+            sketch = self._sketches[metric].get((_clean_name(college), _clean_name(career), period or None))
+            return sketch.summary() if sketch else None
+
+    def groups(self, metric: str) -> Dict[str, List[str]]:
+        """List the colleges, careers and periods that have data for a metric."""
+        colleges, careers, periods = set(), set(), set()
+        with self._lock:
+            for college, career, period in self._sketches[metric]:
+                if college is not None:
+                    colleges.add(college)
+                if career is not None:
+                    careers.add(career)
+                if period is not None:
+                    periods.add(period)
+        return {
+            'colleges': sorted(colleges),
+            'careers': sorted(careers),
+            'periods': sorted(periods)
+        }
+
+    def merge(self, other: 'CohortAnalytics') -> None:
+        """Merge another registry (e.g. from another worker) into this one."""
+        with self._lock, other._lock:
+            for metric, sketches in other._sketches.items():
+                target = self._sketches.setdefault(metric, {})
+                for key, sketch in sketches.items():
+                    key = self._admit_key(key)
+                    if key in target:
+                        target[key].merge(sketch)
+                    else:
+                        target[key] = ScoreSketch.from_dict(sketch.to_dict())
+
+    def save(self, path: str) -> None:
+        """Write a JSON snapshot of every sketch (atomically)."""
+        with self._lock:
+            data = {
+                metric: [
+                    {'college': college, 'career': career, 'period': period, 'sketch': sketch.to_dict()}
+                    for (college, career, period), sketch in sketches.items()
+                ]
+                for metric, sketches in self._sketches.items()
+            }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, max_groups: int = DEFAULT_MAX_GROUPS) -> 'CohortAnalytics':
+        """Load a snapshot written by save(); returns an empty registry if missing."""
+        analytics = cls(max_groups)
+        if not os.path.exists(path):
+            return analytics
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+        snapshot = cls(max_groups)
+        for metric, entries in data.items():
+            snapshot._sketches[metric] = {
+                (entry['college'], entry['career'], entry['period']): ScoreSketch.from_dict(entry['sketch'])
+                for entry in entries
+            }
+        # Merging applies the name rules and max_groups to the loaded slices
+        analytics.merge(snapshot)
+        return analytics
@@ -0,0 +1,167 @@
+"""
+Feature Encoder Module
+======================
+Turns assessment payloads into the model's input matrix.
+
+The column order comes from the persisted schema (models/feature_names.pkl),
+so a retrained model with different columns always receives aligned inputs.
+Dicts, lists of dicts and DataFrames are encoded into a float32 matrix in one
+vectorized step, with per-column defaults, range clipping and validation.
+
+Author: CareerNexus AI
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# FEATURE SCHEMA DEFAULTS
+# ============================================
+
+# Column order used by train_model.py (fallback when no schema is persisted)
+DEFAULT_FEATURE_NAMES = [
+    'Python', 'Java', 'SQL', 'ML', 'Communication', 'ProblemSolving',
+    'Data_Interest', 'Development_Interest', 'Management_Interest',
+    'Research_Interest', 'Design_Interest', 'CGPA'
+]
+
+# Per-column default value and valid (min, max) range
+SKILL_SPEC = {'default': 0.0, 'range': (0.0, 5.0)}
+INTEREST_SPEC = {'default': 0.0, 'range': (0.0, 100.0)}
+CGPA_SPEC = {'default': 0.0, 'range': (0.0, 10.0)}
+
+# Spec for columns the encoder doesn't know (e.g. added by a retrain)
+UNKNOWN_SPEC = {'default': 0.0, 'range': (-np.inf, np.inf)}
+
+FEATURE_SPECS = {
+    'Python': SKILL_SPEC,
+    'Java': SKILL_SPEC,
+    'SQL': SKILL_SPEC,
+    'ML': SKILL_SPEC,
+    'Communication': SKILL_SPEC,
+    'ProblemSolving': SKILL_SPEC,
+    'Data_Interest': INTEREST_SPEC,
+    'Development_Interest': INTEREST_SPEC,
+    'Management_Interest': INTEREST_SPEC,
+    'Research_Interest': INTEREST_SPEC,
+    'Design_Interest': INTEREST_SPEC,
+    'CGPA': CGPA_SPEC
+}
+
+
+class FeatureValidationError(ValueError):
+    """Raised when an input value cannot be encoded as a model feature."""
+
+
+class FeatureEncoder:
+    """
+    Schema-driven encoder from assessment payloads to a float32 feature matrix.
+    """
+
+    def __init__(self,
+                 feature_names: Optional[Sequence[str]] = None,
+                 specs: Optional[Dict[str, Dict]] = None,
+                 clip: bool = True):
+        """
+        Initialize the encoder.
+
+        Args:
+            feature_names: Column order from the persisted schema
+            specs: Per-column {'default', 'range'} overrides
+            clip: Clip out-of-range values (False raises FeatureValidationError)
+        """
+        all_specs = dict(FEATURE_SPECS)
+        all_specs.update(specs or {})
+
+        self.feature_names = list(DEFAULT_FEATURE_NAMES if feature_names is None else feature_names)
+        self.clip = clip
+
+        column_specs = [all_specs.get(name, UNKNOWN_SPEC) for name in self.feature_names]
+        self.defaults = np.array([spec['default'] for spec in column_specs], dtype=np.float32)
+        self.minimums = np.array([spec['range'][0] for spec in column_specs], dtype=np.float32)
+        self.maximums = np.array([spec['range'][1] for spec in column_specs], dtype=np.float32)
+
+    def _to_matrix(self, records) -> np.ndarray:
+        """Lay out records as a float64 matrix in schema order (NaN = missing)."""
+        if isinstance(records, pd.DataFrame):
+            frame = records.reindex(columns=self.feature_names)
+            try:
+                return frame.to_numpy(dtype=np.float64, na_value=np.nan)
+            except (TypeError, ValueError):
+                rows = frame.to_numpy(dtype=object)
+        else:
+            if isinstance(records, dict):
+                records = [records]
+            if not all(isinstance(record, dict) for record in records):
+                raise FeatureValidationError('Each record must be a JSON object of feature values')
+            rows = [[record.get(name) for name in self.feature_names] for record in records]
+
+        try:
+            return np.array(rows, dtype=np.float64).reshape(len(rows), len(self.feature_names))
+        except (TypeError, ValueError):
+            self._raise_invalid(rows)
+
+    def _raise_invalid(self, rows) -> None:
+        """Locate the first non-numeric value and raise a descriptive error."""
+        for row_index, row in enumerate(rows):
+            for name, value in zip(self.feature_names, row):
+                try:
+                    float(np.nan if value is None else value)
+                except (TypeError, ValueError):
+                    raise FeatureValidationError(
+                        f"Invalid value for '{name}' in row {row_index}: {value!r} is not a number"
+                    )
+        raise FeatureValidationError('Input could not be encoded as a feature matrix')
+
+    def encode(self, records) -> np.ndarray:
+        """
+        Encode one or many records into the model input matrix.
+
+        Args:
+            records: A dict, a list of dicts or a DataFrame
+
+        Returns:
+            float32 array of shape (n_records, n_features)
+        """
+        matrix = self._to_matrix(records)
+
+        if np.isinf(matrix).any():
+            row_index, col_index = np.argwhere(np.isinf(matrix))[0]
+            raise FeatureValidationError(
+                f"Invalid value for '{self.feature_names[col_index]}' in row {row_index}: must be finite"
+            )
+
+        # Fill missing values with per-column defaults
+        matrix = np.where(np.isnan(matrix), self.defaults, matrix)
+
+        out_of_range = (matrix < self.minimums) | (matrix > self.maximums)
+        if out_of_range.any():
+            if not self.clip:
+                row_index, col_index = np.argwhere(out_of_range)[0]
+                low, high = self.minimums[col_index], self.maximums[col_index]
+                raise FeatureValidationError(
+                    f"Value for '{self.feature_names[col_index]}' in row {row_index} "
+                    f"is outside the range {low:g}-{high:g}"
+                )
+            matrix = np.clip(matrix, self.minimums, self.maximums)
+
+        return matrix.astype(np.float32)
+
+    def describe(self) -> List[Dict]:
+        """Return the schema as a list of column descriptions."""
+        return [
+            {
+                'name': name,
+                'default': float(default),
+                'range': [
+                    float(low) if np.isfinite(low) else None,
+                    float(high) if np.isfinite(high) else None
+                ]
+            }
+            for name, default, low, high in zip(
+                self.feature_names, self.defaults, self.minimums, self.maximums
+            )
+        ]
+
@@ -0,0 +1,217 @@
+"""
+Synthetic Assessment Data Generator
+===================================
+Generates realistic /api/assess rows for training benchmarks, load tests
+and cache-sizing experiments without sharing real student data.
+
+Per-career distributions are fitted from the seed dataset in train_model.py:
+each career gets its own mean vector, and a pooled within-career covariance
+(the seed data has too few rows per career for its own) captures how skills
+and interests move together. Rows are sampled in fixed-size chunks and
+streamed to CSV or Parquet, so memory stays bounded for any row count.
+
+Usage:
+    python generate_synthetic_data.py --rows 1000000 --output data/assessments.parquet
+    python generate_synthetic_data.py --rows 50000 --output data/sample.csv --seed 7
+
+Author: CareerNexus AI
+"""
+
+import argparse
+import os
+import time
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from train_model import FEATURE_COLUMNS, TARGET_COLUMN, SEED_TRAINING_DATA
+
+# ============================================
+# VALUE CONSTRAINTS
+# ============================================
+
+SKILL_COLUMNS = ['Python', 'Java', 'SQL', 'ML', 'Communication', 'ProblemSolving']
+INTEREST_COLUMNS = [
+    'Data_Interest', 'Development_Interest', 'Management_Interest',
+    'Research_Interest', 'Design_Interest'
+]
+
+# (min, max, decimals) per feature group, matching the UI sliders
+COLUMN_LIMITS = {}
+COLUMN_LIMITS.update({column: (1, 5, 0) for column in SKILL_COLUMNS})
+COLUMN_LIMITS.update({column: (0, 100, 0) for column in INTEREST_COLUMNS})
+COLUMN_LIMITS['CGPA'] = (4.0, 10.0, 1)
+
+# Variance floor (in each column's units) so single-row careers still vary
+MIN_STD = {column: 0.5 for column in SKILL_COLUMNS}
+MIN_STD.update({column: 6.0 for column in INTEREST_COLUMNS})
+MIN_STD['CGPA'] = 0.4
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+class CareerDistributions:
+    """
+    Per-career multivariate normal distributions fitted from seed data.
+    """
+
+    def __init__(self, seed_df: pd.DataFrame, balanced: bool = False):
+        """
+        Fit distributions from a seed DataFrame.
+
+        Args:
+            seed_df: Rows with FEATURE_COLUMNS and TARGET_COLUMN
+            balanced: Sample careers uniformly instead of by seed frequency
+        """
+        features = seed_df[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+        labels = seed_df[TARGET_COLUMN].astype(str).to_numpy()
+
+        self.careers = np.array(sorted(set(labels)))
+        self.means = np.array([features[labels == career].mean(axis=0) for career in self.careers])
+
+        counts = np.array([(labels == career).sum() for career in self.careers], dtype=np.float64)
+        self.priors = np.full(len(self.careers), 1 / len(self.careers)) if balanced else counts / counts.sum()
+
+        # Pooled within-career covariance, with a diagonal floor
+        career_index = np.searchsorted(self.careers, labels)
+        residuals = features - self.means[career_index]
+        dof = max(1, len(features) - len(self.careers))
+        covariance = residuals.T @ residuals / dof
+        floor = np.array([MIN_STD[column] ** 2 for column in FEATURE_COLUMNS])
+        covariance += np.diag(np.maximum(floor - np.diag(covariance), 0))
+
+        self.cholesky = np.linalg.cholesky(covariance + np.eye(len(FEATURE_COLUMNS)) * 1e-9)
+
+        limits = [COLUMN_LIMITS[column] for column in FEATURE_COLUMNS]
+        self.minimums = np.array([limit[0] for limit in limits], dtype=np.float64)
+        self.maximums = np.array([limit[1] for limit in limits], dtype=np.float64)
+        self.decimals = [limit[2] for limit in limits]
+
+    def sample(self, n_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+        """
+        Draw n_rows synthetic assessments.
+
+        Args:
+            n_rows: Number of rows to generate
+            rng: NumPy random generator (controls reproducibility)
+
+        Returns:
+            DataFrame with FEATURE_COLUMNS (float32) and TARGET_COLUMN (category)
+        """
+        career_index = rng.choice(len(self.careers), size=n_rows, p=self.priors)
+        noise = rng.standard_normal((n_rows, len(FEATURE_COLUMNS))) @ self.cholesky.T
+        values = np.clip(self.means[career_index] + noise, self.minimums, self.maximums)
+
+        data = {}
+        for col_index, column in enumerate(FEATURE_COLUMNS):
+            data[column] = np.round(values[:, col_index], self.decimals[col_index]).astype(np.float32)
+        data[TARGET_COLUMN] = pd.Categorical.from_codes(career_index, categories=self.careers)
+
+        return pd.DataFrame(data)
+
+
+def generate_chunks(distributions: CareerDistributions,
+                    n_rows: int,
+                    seed: int,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Yield synthetic rows in chunks of at most chunk_size.
+
+    Each chunk uses its own generator spawned from the seed, so output is
+    reproducible for a given (seed, chunk_size).
+    """
+    n_chunks = (n_rows + chunk_size - 1) // chunk_size
+    child_seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+
+    for chunk_index, child_seed in enumerate(child_seeds):
+        size = min(chunk_size, n_rows - chunk_index * chunk_size)
+        yield distributions.sample(size, np.random.default_rng(child_seed))
+
+
+def write_dataset(chunks: Iterator[pd.DataFrame], output_path: str) -> int:
+    """
+    Stream chunks to a CSV (.csv/.csv.gz) or Parquet (.parquet) file.
+
+    Returns:
+        Number of rows written
+    """
+    lower = output_path.lower()
+    rows_written = 0
+
+    if lower.endswith('.parquet') or lower.endswith('.pq'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer: Optional[pq.ParquetWriter] = None
+        try:
+            for chunk in chunks:
+                # Plain strings keep the schema identical across chunks
+                table = pa.Table.from_pandas(
+                    chunk.astype({TARGET_COLUMN: str}), preserve_index=False
+                )
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema, compression='snappy')
+                writer.write_table(table)
+                rows_written += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    elif lower.endswith('.csv') or lower.endswith('.csv.gz'):
+        compression = 'gzip' if lower.endswith('.gz') else None
+        for chunk_index, chunk in enumerate(chunks):
+            chunk.to_csv(
+                output_path,
+                mode='w' if chunk_index == 0 else 'a',
+                header=chunk_index == 0,
+                index=False,
+                compression=compression
+            )
+            rows_written += len(chunk)
+    else:
+        raise ValueError(f"Unsupported output file (expected .csv or .parquet): {output_path}")
+
+    return rows_written
+
+
+def parse_args(argv=None):
+    """Parse command-line options for the generator"""
+    parser = argparse.ArgumentParser(description='Generate synthetic CareerNexus AI assessment data')
+    parser.add_argument('--rows', type=int, required=True, help='Number of rows to generate')
+    parser.add_argument('--output', required=True, help='Output .csv, .csv.gz or .parquet file')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for reproducible output')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Rows generated per chunk')
+    parser.add_argument('--balanced', action='store_true', help='Sample careers uniformly instead of by seed frequency')
+    args = parser.parse_args(argv)
+    if args.rows <= 0 or args.chunk_size <= 0:
+        parser.error('--rows and --chunk-size must be positive')
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    seed_df = pd.DataFrame(SEED_TRAINING_DATA)
+    distributions = CareerDistributions(seed_df, balanced=args.balanced)
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    print("=" * 60)
+    print("CareerNexus AI - Synthetic Data Generator")
+    print("=" * 60)
+    print(f"Careers: {len(distributions.careers)} | Rows: {args.rows:,} | Seed: {args.seed}")
+
+    start = time.perf_counter()
+    chunks = generate_chunks(distributions, args.rows, args.seed, args.chunk_size)
+    rows_written = write_dataset(chunks, args.output)
+    elapsed = time.perf_counter() - start
+
+    size_mb = os.path.getsize(args.output) / 1024 / 1024
+    print(f"✓ Wrote {rows_written:,} rows to {args.output} ({size_mb:.1f} MB) in {elapsed:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
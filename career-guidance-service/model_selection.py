@@ -0,0 +1,237 @@
+"""
+Model Selection Module
+======================
+Latency-budgeted model comparison for the career prediction model.
+
+A 100-tree forest is a lot of model for 12 features. This harness trains
+cheaper candidates next to the baseline forest:
+- smaller random forests
+- gradient-boosted trees
+- logistic regression
+- a shallow decision tree distilled from the forest's predictions
+
+Candidates are fitted on part of the training data and compared on a
+validation split carved from the rest, recording validation accuracy,
+p50/p99 single-row latency (the way /api/assess calls the model) and
+serialized artifact size. The fastest candidate that meets the accuracy
+floor is refitted on the full training data and becomes the serving model;
+the held-out test set is used only to report its final accuracy.
+
+Author: CareerNexus AI
+"""
+
+import time
+from io import BytesIO
+from typing import Callable, Dict, List, Optional, Tuple
+
+import joblib
+import numpy as np
+from sklearn.base import clone
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+from sklearn.tree import DecisionTreeClassifier
+
+# ============================================
+# MEASUREMENT HELPERS
+# ============================================
+
+def measure_latency(model, X_sample, n_rows: int = 200) -> Dict:
+    """
+    Measure single-row inference latency of predict_proba.
+
+    Returns:
+        Dictionary with p50/p99/mean latency in milliseconds
+    """
+    rows = X_sample[:n_rows]
+    timings = []
+
+    for i in range(len(rows)):
+        row = rows[i:i + 1]
+        start = time.perf_counter()
+        model.predict_proba(row)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings = np.array(timings)
+    return {
+        'rows': len(timings),
+        'p50_ms': round(float(np.percentile(timings, 50)), 3),
+        'p99_ms': round(float(np.percentile(timings, 99)), 3),
+        'mean_ms': round(float(timings.mean()), 3)
+    }
+
+
+def artifact_size_bytes(model) -> int:
+    """Return the size of the model as joblib would write it to disk."""
+    buffer = BytesIO()
+    joblib.dump(model, buffer)
+    return buffer.getbuffer().nbytes
+
+
+# ============================================
+# CANDIDATE MODELS
+# ============================================
+
+def build_candidates(random_state: int, n_jobs: int) -> Dict[str, Callable]:
+    """
+    Return candidate builders keyed by name.
+
+    Each builder takes (X_train, y_train, teacher) and returns a fitted model;
+    teacher is the baseline forest, used only by the distilled tree.
+    """
+    def forest(n_estimators, max_depth):
+        def fit(X, y, teacher):
+            return RandomForestClassifier(
+                n_estimators=n_estimators,
+                max_depth=max_depth,
+                random_state=random_state,
+                n_jobs=n_jobs
+            ).fit(X, y)
+        return fit
+
+    def gradient_boosting(X, y, teacher):
+        return HistGradientBoostingClassifier(
+            max_iter=100,
+            max_depth=6,
+            random_state=random_state
+        ).fit(X, y)
+
+    def logistic_regression(X, y, teacher):
+        return LogisticRegression(max_iter=1000).fit(X, y)
+
+    def distilled_tree(X, y, teacher):
+        # Learn the forest's decision function, not the raw labels
+        return DecisionTreeClassifier(
+            max_depth=8,
+            random_state=random_state
+        ).fit(X, teacher.predict(X))
+
+    return {
+        'random_forest_25x8': forest(25, 8),
+        'random_forest_10x6': forest(10, 6),
+        'gradient_boosting': gradient_boosting,
+        'logistic_regression': logistic_regression,
+        'distilled_tree': distilled_tree
+    }
+
+
+def validation_split(X_train, y_train, validation_size: float, random_state: int):
+    """
+    Carve a validation split out of the training data for model selection.
+
+    Stratified by career when every class has at least 2 rows; otherwise a
+    plain random split, as with the train/test split.
+    """
+    _, class_counts = np.unique(np.asarray(y_train), return_counts=True)
+    n_val = int(np.ceil(len(y_train) * validation_size))
+    can_stratify = class_counts.min() >= 2 and n_val >= len(class_counts)
+    return train_test_split(
+        X_train, y_train,
+        test_size=validation_size,
+        random_state=random_state,
+        stratify=y_train if can_stratify else None
+    )
+
+
+def evaluate_model(name: str, model, X_val, y_val, latency_rows: int,
+                   train_seconds: Optional[float] = None) -> Dict:
+    """Collect validation accuracy, latency and size metrics for one fitted model."""
+    latency = measure_latency(model, X_val, latency_rows)
+    return {
+        'name': name,
+        'model_type': type(model).__name__,
+        'val_accuracy': round(float(accuracy_score(y_val, model.predict(X_val))), 4),
+        'p50_ms': latency['p50_ms'],
+        'p99_ms': latency['p99_ms'],
+        'artifact_bytes': artifact_size_bytes(model),
+        'train_seconds': round(train_seconds, 3) if train_seconds is not None else None
+    }
+
+
+def compare_models(baseline, X_train, y_train, X_test, y_test,
+                   accuracy_floor: Optional[float] = None,
+                   validation_size: float = 0.2,
+                   random_state: int = 42,
+                   n_jobs: int = 1,
+                   latency_rows: int = 200,
+                   baseline_name: str = 'random_forest_100x10') -> Tuple[object, List[Dict], Dict]:
+    """
+    Compare candidates against the baseline forest and pick the serving model.
+
+    Selection only looks at a validation split of the training data; the test
+    set is touched once, to report the accuracy of the model that was picked.
+
+    Args:
+        baseline: Baseline RandomForestClassifier, fitted on all of X_train
+        X_train, y_train: Training data (scaled)
+        X_test, y_test: Held-out data (scaled), never used for selection
+        accuracy_floor: Minimum validation accuracy (default: baseline accuracy - 0.01)
+        validation_size: Fraction of the training data held out for selection
+        random_state: Seed for the validation split and candidate models
+        n_jobs: Worker processes for forest candidates
+        latency_rows: Rows used to measure single-row latency
+        baseline_name: Name reported for the baseline
+
+    Returns:
+        (selected model fitted on all of X_train, per-candidate results, selection summary)
+    """
+    X_fit, X_val, y_fit, y_val = validation_split(X_train, y_train, validation_size, random_state)
+
+    # The baseline is refitted on the same rows as the candidates so they compare fairly
+    start = time.perf_counter()
+    teacher = clone(baseline).fit(X_fit, y_fit)
+    results = [evaluate_model(baseline_name, teacher, X_val, y_val, latency_rows,
+                              time.perf_counter() - start)]
+
+    if accuracy_floor is None:
+        accuracy_floor = max(0.0, results[0]['val_accuracy'] - 0.01)
+
+    candidates = build_candidates(random_state, n_jobs)
+    for name, fit in candidates.items():
+        start = time.perf_counter()
+        try:
+            model = fit(X_fit, y_fit, teacher)
+        except ValueError as e:
+            # e.g. too few samples per class for a candidate on tiny datasets
+            print(f"⚠ Skipping {name}: {e}")
+            continue
+        train_seconds = time.perf_counter() - start
+
+        results.append(evaluate_model(name, model, X_val, y_val, latency_rows, train_seconds))
+
+    eligible = [r for r in results if r['val_accuracy'] >= accuracy_floor]
+    if eligible:
+        selected = min(eligible, key=lambda r: (r['p50_ms'], r['p99_ms'], -r['val_accuracy']))
+        reason = f"fastest model with validation accuracy >= {accuracy_floor:.4f}"
+    else:
+        selected = max(results, key=lambda r: r['val_accuracy'])
+        reason = f"no model reached the {accuracy_floor:.4f} floor; using the most accurate"
+
+    # Refit the winner on all of the training data (the baseline already is)
+    if selected['name'] == baseline_name:
+        serving_model = baseline
+    else:
+        serving_model = candidates[selected['name']](X_train, y_train, baseline)
+
+    summary = {
+        'selected': selected['name'],
+        'accuracy_floor': round(accuracy_floor, 4),
+        'validation_rows': int(len(y_val)),
+        'test_accuracy': round(float(accuracy_score(y_test, serving_model.predict(X_test))), 4),
+        'reason': reason
+    }
+    return serving_model, results, summary
+
+
+def format_results_table(results: List[Dict], selected_name: str) -> str:
+    """Format comparison results as a fixed-width text table."""
+    header = f"{'Model':<24}{'Val acc':>10}{'p50 ms':>10}{'p99 ms':>10}{'Size KB':>10}"
+    lines = [header, '-' * len(header)]
+    for r in results:
+        marker = ' ✓' if r['name'] == selected_name else ''
+        lines.append(
+            f"{r['name']:<24}{r['val_accuracy']:>10.2%}{r['p50_ms']:>10.3f}"
+            f"{r['p99_ms']:>10.3f}{r['artifact_bytes'] / 1024:>10.1f}{marker}"
+        )
+    return '\n'.join(lines)
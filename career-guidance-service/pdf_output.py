@@ -0,0 +1,41 @@
+"""
+PDF Output Module
+=================
+Write targets for the PDF generators.
+
+ReportLab assembles the finished document as one bytes object and hands
+it to the output's write() in a single call. Writing that into a BytesIO
+copies it, and getvalue() / BytesIO(pdf_bytes) around send_file copy it
+again. PDFBuffer keeps a reference to what was written instead, so the
+bytes ReportLab produced are the bytes that reach the response (or the
+worker pipe). Anything with a write() method works as a generator output -
+a SpooledTemporaryFile for large documents or a response stream.
+
+Author: CareerNexus AI
+"""
+
+from typing import List
+
+
+class PDFBuffer:
+    """
+    Append-only output that stores written chunks by reference.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def write(self, data) -> int:
+        self._chunks.append(data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> bytes:
+        """The written bytes; the very object written when there was a single write."""
+        if len(self._chunks) == 1 and isinstance(self._chunks[0], bytes):
+            return self._chunks[0]
+        return b''.join(self._chunks)
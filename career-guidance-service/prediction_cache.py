@@ -0,0 +1,224 @@
+"""
+Prediction Cache Module
+=======================
+LRU cache for /api/assess career predictions.
+
+The model inputs are coarse (skills 0-5, interests 0-100, CGPA 0-10) and
+many students submit identical slider positions, so predictions are cached
+by the feature tuple produced by prepare_features. Each feature group can
+optionally be quantized to a coarser step so near-identical vectors share
+an entry. Entries are tied to the model bundle version and are dropped as
+soon as a different bundle is loaded.
+
+Author: CareerNexus AI
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+# ============================================
+# DEFAULT CONFIGURATION
+# ============================================
+
+DEFAULT_MAX_SIZE = 4096
+
+# Quantization step per feature group (0 = exact match)
+DEFAULT_QUANTIZATION = {
+    'skills': 0,
+    'interests': 0,
+    'cgpa': 0
+}
+
+# Files that make up the model bundle
+MODEL_BUNDLE_FILES = [
+    'career_rf_model.pkl',
+    'scaler.pkl',
+    'feature_names.pkl',
+    'career_classes.pkl'
+]
+
+# Written by train_model.py after every artifact is in place
+MODEL_MANIFEST_FILE = 'bundle_manifest.json'
+
+
+def compute_model_version(model_dir: str = 'models',
+                          filenames: Sequence[str] = MODEL_BUNDLE_FILES) -> str:
+    """
+    Compute a short version fingerprint for the model bundle.
+
+    Uses file name, size and modification time so it is cheap to compute.
+    When the bundle has a manifest only the manifest is fingerprinted: it is
+    written last, so the version changes once the whole bundle is in place
+    rather than after each artifact. Bundles trained before manifests existed
+    fall back to fingerprinting every artifact.
+
+    Args:
+        model_dir: Directory containing the model artifacts
+        filenames: Artifact file names that make up the bundle
+
+    Returns:
+        12-character hex fingerprint ('missing' if no artifact exists)
+    """
+    digest = hashlib.sha1()
+    found = False
+
+    if os.path.exists(os.path.join(model_dir, MODEL_MANIFEST_FILE)):
+        filenames = [MODEL_MANIFEST_FILE]
+
+    for name in filenames:
+        path = os.path.join(model_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        found = True
+        digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+
+    return digest.hexdigest()[:12] if found else 'missing'
+
+
+def feature_group(feature_name: str) -> str:
+    """Map a feature column name to its quantization group."""
+    if feature_name == 'CGPA':
+        return 'cgpa'
+    if feature_name.endswith('_Interest'):
+        return 'interests'
+    return 'skills'
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU cache of model predictions keyed by feature tuples.
+    """
+
+    def __init__(self,
+                 feature_names: Sequence[str],
+                 max_size: int = DEFAULT_MAX_SIZE,
+                 quantization: Optional[Dict[str, float]] = None,
+                 version: str = ''):
+        """
+        Initialize the prediction cache.
+
+        Args:
+            feature_names: Column order of the feature vector
+            max_size: Maximum number of cached predictions (0 disables caching)
+            quantization: Step per feature group ('skills', 'interests', 'cgpa')
+            version: Model bundle version the cached entries belong to
+        """
+        steps = dict(DEFAULT_QUANTIZATION)
+        steps.update(quantization or {})
+
+        self.feature_names = list(feature_names)
+        self.steps = [float(steps[feature_group(name)]) for name in self.feature_names]
+        self.quantization = steps
+        self.max_size = max(0, int(max_size))
+        self.version = version
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_env(cls, feature_names: Sequence[str], version: str = '') -> 'PredictionCache':
+        """
+        Build a cache configured from environment variables.
+
+        PREDICTION_CACHE_SIZE, PREDICTION_CACHE_SKILL_STEP,
+        PREDICTION_CACHE_INTEREST_STEP and PREDICTION_CACHE_CGPA_STEP
+        override the defaults.
+        """
+        quantization = {
+            'skills': float(os.getenv('PREDICTION_CACHE_SKILL_STEP', DEFAULT_QUANTIZATION['skills'])),
+            'interests': float(os.getenv('PREDICTION_CACHE_INTEREST_STEP', DEFAULT_QUANTIZATION['interests'])),
+            'cgpa': float(os.getenv('PREDICTION_CACHE_CGPA_STEP', DEFAULT_QUANTIZATION['cgpa']))
+        }
+        max_size = int(os.getenv('PREDICTION_CACHE_SIZE', DEFAULT_MAX_SIZE))
+        return cls(feature_names, max_size=max_size, quantization=quantization, version=version)
+
+    def make_key(self, features: Sequence[float]) -> Tuple[float, ...]:
+        """
+        Build the cache key for one feature vector.
+
+        Each value is snapped to the nearest multiple of its group's step,
+        so the key doubles as the representative vector for the bucket.
+        Values are rounded to 6 decimals so float32 and float64 inputs agree.
+        """
+        key = []
+        for value, step in zip(features, self.steps):
+            value = float(value)
+            if step > 0:
+                value = round(value / step) * step
+            key.append(round(value, 6))
+        return tuple(key)
+
+    def set_version(self, version: str) -> None:
+        """Bind the cache to a model bundle version, dropping stale entries."""
+        with self._lock:
+            if version != self.version:
+                self._entries.clear()
+                self.version = version
+                self.invalidations += 1
+
+    def get(self, key: Tuple[float, ...], version: str):
+        """
+        Look up a cached prediction.
+
+        Args:
+            key: Key produced by make_key
+            version: Version of the model bundle currently serving
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        if version != self.version:
+            self.set_version(version)
+
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Tuple[float, ...], value, version: str) -> None:
+        """Store a prediction computed by the given model bundle version."""
+        if self.max_size == 0:
+            return
+
+        with self._lock:
+            if version != self.version:
+                return  # Bundle changed while predicting; don't cache stale output
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        """Return cache statistics for sizing."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'invalidations': self.invalidations,
+                'quantization': dict(self.quantization),
+                'model_version': self.version
+            }
+
@@ -0,0 +1,144 @@
+"""
+Prediction Explainer Module
+===========================
+Per-feature explanations for tree-based career predictions.
+
+Uses Saabas-style path attribution: walking a tree from root to leaf, every
+split moves the class probability from the parent node's value to the
+child's, and that change is credited to the parent's split feature. Summed
+over the path (and averaged over the forest) the contributions plus the
+root value reproduce predict_proba exactly.
+
+All per-node deltas are precomputed once per model on the flattened tree
+arrays, so explaining a prediction is one decision_path call plus a
+bincount - well under a few milliseconds for a 100-tree forest.
+
+Author: CareerNexus AI
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier, ExtraTreesClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+
+class PathExplainer:
+    """
+    Saabas path-attribution explainer for tree classifiers.
+    """
+
+    def __init__(self, model, feature_names: Sequence[str]):
+        """
+        Precompute node deltas for a fitted tree model.
+
+        Args:
+            model: Fitted RandomForestClassifier, ExtraTreesClassifier or DecisionTreeClassifier
+            feature_names: Column order of the model input
+        """
+        if not is_explainable(model):
+            raise TypeError(f"{type(model).__name__} is not supported by PathExplainer")
+
+        self.model = model
+        self.feature_names = list(feature_names)
+        self.is_forest = hasattr(model, 'estimators_')
+
+        trees = [estimator.tree_ for estimator in model.estimators_] if self.is_forest else [model.tree_]
+        self.n_trees = len(trees)
+
+        deltas = []
+        parent_features = []
+        root_values = []
+
+        for tree in trees:
+            values = tree.value[:, 0, :]
+            values = values / values.sum(axis=1, keepdims=True)
+
+            parents = np.full(tree.node_count, -1, dtype=np.int64)
+            internal = np.flatnonzero(tree.children_left >= 0)
+            parents[tree.children_left[internal]] = internal
+            parents[tree.children_right[internal]] = internal
+
+            delta = np.zeros_like(values)
+            has_parent = parents >= 0
+            delta[has_parent] = values[has_parent] - values[parents[has_parent]]
+
+            # Root nodes get a sentinel feature (dropped after the bincount)
+            parent_feature = np.full(tree.node_count, len(self.feature_names), dtype=np.int64)
+            parent_feature[has_parent] = tree.feature[parents[has_parent]]
+
+            deltas.append(delta)
+            parent_features.append(parent_feature)
+            root_values.append(values[0])
+
+        # Node ids from decision_path index straight into these flat arrays
+        self.node_deltas = np.concatenate(deltas)
+        self.node_parent_features = np.concatenate(parent_features)
+        self.base_values = np.mean(root_values, axis=0)
+
+    def _path_nodes(self, row) -> np.ndarray:
+        """Return the flat ids of every node visited by one input row."""
+        if self.is_forest:
+            indicator, _ = self.model.decision_path(row)
+        else:
+            indicator = self.model.decision_path(row)
+        return indicator.indices
+
+    def contributions(self, row, class_index: int) -> np.ndarray:
+        """
+        Compute per-feature probability contributions for one class.
+
+        Args:
+            row: (1, n_features) model input (already scaled)
+            class_index: Index into model.classes_
+
+        Returns:
+            Array of shape (n_features,) in probability units
+        """
+        nodes = self._path_nodes(row)
+        totals = np.bincount(
+            self.node_parent_features[nodes],
+            weights=self.node_deltas[nodes, class_index],
+            minlength=len(self.feature_names) + 1
+        )
+        return totals[:len(self.feature_names)] / self.n_trees
+
+    def explain(self, row, raw_values: Sequence[float], class_index: int) -> Dict:
+        """
+        Build a JSON-ready explanation for one predicted class.
+
+        Args:
+            row: (1, n_features) scaled model input
+            raw_values: Unscaled input values, shown next to each feature
+            class_index: Index into model.classes_
+
+        Returns:
+            {'career', 'base_value', 'contributions': [{'feature', 'value', 'contribution'}]}
+        """
+        contributions = self.contributions(row, class_index)
+        order = np.argsort(-np.abs(contributions))
+
+        return {
+            'career': str(self.model.classes_[class_index]),
+            'base_value': round(float(self.base_values[class_index]) * 100, 2),
+            'contributions': [
+                {
+                    'feature': self.feature_names[i],
+                    'value': float(raw_values[i]),
+                    'contribution': round(float(contributions[i]) * 100, 2)
+                }
+                for i in order
+            ]
+        }
+
+
+def is_explainable(model) -> bool:
+    """Return True if PathExplainer supports the model type."""
+    return isinstance(model, (RandomForestClassifier, ExtraTreesClassifier, DecisionTreeClassifier))
+
+
+def build_explainer(model, feature_names: Sequence[str]) -> Optional[PathExplainer]:
+    """Build an explainer for the model, or None if the model type isn't a tree ensemble."""
+    if not is_explainable(model):
+        return None
+    return PathExplainer(model, feature_names)
@@ -0,0 +1,318 @@
+"""
+Render Queue Module
+===================
+Asynchronous PDF rendering on a process pool.
+
+ReportLab rendering is CPU-bound and holds the GIL, so rendering inside a
+request thread stalls every other endpoint. RenderQueue hands each render
+to a worker process and returns a job id immediately:
+- callers poll the job status, or block on it with a timeout
+- submissions are rejected (QueueFullError) once too many jobs are pending
+- queue depth, render time and queue wait time are tracked for metrics
+- map_unordered() streams bulk renders through the same workers with a
+  bounded number in flight
+- finished PDFs are kept for result_ttl seconds, within a byte budget
+
+Workers are started on the first render with forkserver (spawn on Windows),
+never forked from the threaded server process.
+
+Author: CareerNexus AI
+"""
+
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_PENDING = 32
+# Seconds finished jobs (and their PDFs) stay available for download
+DEFAULT_RESULT_TTL = 600
+# Total bytes of finished PDFs kept for download; oldest are dropped first
+DEFAULT_RESULT_MAX_MB = 64
+# Render timings kept for percentile metrics
+TIMING_WINDOW = 500
+
+
+class QueueFullError(Exception):
+    """Raised when the render queue has no room for another job."""
+
+
+def _render(kind: str, payload: Dict):
+    """
+    Render one PDF in a worker process.
+
+    Returns:
+        (pdf bytes, render seconds, time the render started)
+    """
+    started_at = time.time()
+    start = time.perf_counter()
+
+    if kind == 'career_report':
+        from pdf_generator import generate_career_pdf
+        pdf_bytes = generate_career_pdf(payload)
+    elif kind == 'resume_report':
+        from resume_report_generator import generate_resume_analysis_report
+        pdf_bytes = generate_resume_analysis_report(payload)
+    else:
+        raise ValueError(f"Unknown render kind: {kind}")
+
+    return pdf_bytes, time.perf_counter() - start, started_at
+
+
+class RenderJob:
+    """
+    One submitted render and its outcome.
+    """
+
+    def __init__(self, kind: str, filename: str, future):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.filename = filename
+        self.future = future
+        self.submitted_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.result_bytes = 0
+
+    @property
+    def status(self) -> str:
+        if self.future.done():
+            return 'failed' if self.future.cancelled() or self.future.exception() is not None else 'done'
+        return 'running' if self.future.running() else 'queued'
+
+    def to_dict(self) -> Dict:
+        info = {
+            'job_id': self.job_id,
+            'kind': self.kind,
+            'status': self.status,
+            'filename': self.filename,
+            'submitted_at': self.submitted_at,
+            'finished_at': self.finished_at
+        }
+        if info['status'] == 'failed':
+            info['error'] = 'cancelled' if self.future.cancelled() else str(self.future.exception())
+        return info
+
+
+class RenderQueue:
+    """
+    Bounded queue of PDF renders executed by a process pool.
+    """
+
+    def __init__(self,
+                 max_workers: int = DEFAULT_WORKERS,
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 result_ttl: float = DEFAULT_RESULT_TTL,
+                 max_result_bytes: int = DEFAULT_RESULT_MAX_MB * 1024 * 1024):
+        """
+        Args:
+            max_workers: Worker processes rendering PDFs
+            max_pending: Queued + running jobs allowed before rejecting submissions
+            result_ttl: Seconds a finished job is kept for status/download
+            max_result_bytes: Total PDF bytes kept by finished jobs
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.max_result_bytes = max_result_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._jobs: Dict[str, RenderJob] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._render_seconds = deque(maxlen=TIMING_WINDOW)
+        self._wait_seconds = deque(maxlen=TIMING_WINDOW)
+        self.counters = {'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0}
+
+    @classmethod
+    def from_env(cls) -> 'RenderQueue':
+        """
+        Build a queue from RENDER_WORKERS, RENDER_MAX_PENDING, RENDER_RESULT_TTL
+        and RENDER_RESULT_MAX_MB.
+        """
+        return cls(
+            max_workers=int(os.getenv('RENDER_WORKERS', DEFAULT_WORKERS)),
+            max_pending=int(os.getenv('RENDER_MAX_PENDING', DEFAULT_MAX_PENDING)),
+            result_ttl=float(os.getenv('RENDER_RESULT_TTL', DEFAULT_RESULT_TTL)),
+            max_result_bytes=int(float(os.getenv('RENDER_RESULT_MAX_MB', DEFAULT_RESULT_MAX_MB)) * 1024 * 1024)
+        )
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """The worker pool, started on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            return self._executor
+
+    def _expire(self) -> None:
+        """Drop finished jobs older than result_ttl, then the oldest over max_result_bytes (lock held)."""
+        cutoff = time.time() - self.result_ttl
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished_at is not None),
+            key=lambda job: job.finished_at
+        )
+        retained = sum(job.result_bytes for job in finished)
+        for job in finished:
+            if job.finished_at >= cutoff and retained <= self.max_result_bytes:
+                break
+            retained -= job.result_bytes
+            del self._jobs[job.job_id]
+
+    def discard(self, job: RenderJob) -> None:
+        """Forget a job whose PDF has already been served."""
+        with self._lock:
+            self._jobs.pop(job.job_id, None)
+
+    def submit(self, kind: str, payload: Dict, filename: str,
+               on_success: Optional[Callable[[bytes], None]] = None) -> RenderJob:
+        """
+        Queue a render.
+
+        Args:
+            kind: 'career_report' or 'resume_report'
+            payload: Data passed to the PDF generator
+            filename: Download name for the finished PDF
+            on_success: Called with the PDF bytes when the render succeeds
+
+        Raises:
+            QueueFullError: If max_pending jobs are already queued or running
+        """
+        with self._lock:
+            self._expire()
+            if self._pending >= self.max_pending:
+                self.counters['rejected'] += 1
+                raise QueueFullError(f"Render queue is full ({self.max_pending} jobs pending)")
+            self._pending += 1
+            self.counters['submitted'] += 1
+            future = self._pool().submit(_render, kind, payload)
+            job = RenderJob(kind, filename, future)
+            self._jobs[job.job_id] = job
+
+        def finished(done_future):
+            with self._lock:
+                self._pending -= 1
+                job.finished_at = time.time()
+                if done_future.cancelled() or done_future.exception() is not None:
+                    self.counters['failed'] += 1
+                    return
+                pdf_bytes, render_seconds, started_at = done_future.result()
+                job.result_bytes = len(pdf_bytes)
+                self._record_render(render_seconds, started_at - job.submitted_at)
+                self._expire()
+            if on_success is not None:
+                on_success(done_future.result()[0])
+
+        future.add_done_callback(finished)
+        return job
+
+    def _record_render(self, render_seconds: float, wait_seconds: float) -> None:
+        """Count a successful render in the metrics (lock held)."""
+        self.counters['completed'] += 1
+        self._render_seconds.append(render_seconds)
+        self._wait_seconds.append(max(0.0, wait_seconds))
+
+    def map_unordered(self, renders: Iterable[Tuple[str, Dict]],
+                      window: Optional[int] = None) -> Iterator[Tuple[int, Optional[bytes], Optional[str]]]:
+        """
+        Render many PDFs, yielding each as soon as it finishes.
+
+        At most `window` renders are in flight (default: one per worker), so
+        interactive jobs are never queued behind a whole bulk export and only
+        a handful of PDFs are held in memory. Bulk renders are not subject to
+        max_pending.
+
+        Args:
+            renders: (kind, payload) pairs
+            window: Maximum renders submitted at once
+
+        Yields:
+            (index into renders, pdf bytes or None, error message or None)
+        """
+        window = window or self.max_workers
+        pending = iter(enumerate(renders))
+        in_flight = {}
+
+        def submit_next(count):
+            for index, (kind, payload) in itertools.islice(pending, count):
+                with self._lock:
+                    self.counters['submitted'] += 1
+                in_flight[self._pool().submit(_render, kind, payload)] = (index, time.time())
+
+        try:
+            submit_next(window)
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, submitted_at = in_flight.pop(future)
+                    try:
+                        pdf_bytes, render_seconds, started_at = future.result()
+                    except Exception as e:
+                        with self._lock:
+                            self.counters['failed'] += 1
+                        yield index, None, str(e)
+                    else:
+                        with self._lock:
+                            self._record_render(render_seconds, started_at - submitted_at)
+                        yield index, pdf_bytes, None
+                submit_next(len(done))
+        finally:
+            # Consumer stopped early (e.g. client disconnected)
+            for future in in_flight:
+                future.cancel()
+
+    def get(self, job_id: str) -> Optional[RenderJob]:
+        with self._lock:
+            self._expire()
+            return self._jobs.get(job_id)
+
+    def wait(self, job: RenderJob, timeout: Optional[float]) -> bool:
+        """Block until the job finishes or timeout passes; returns True if finished."""
+        try:
+            job.future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return False
+        except Exception:
+            pass
+        return True
+
+    @staticmethod
+    def result(job: RenderJob) -> bytes:
+        """PDF bytes of a finished job (re-raises the render error if it failed)."""
+        return job.future.result(timeout=0)[0]
+
+    def stats(self) -> Dict:
+        def percentiles(values):
+            if not values:
+                return {'p50_ms': None, 'p95_ms': None}
+            array = np.array(values) * 1000
+            return {
+                'p50_ms': round(float(np.percentile(array, 50)), 1),
+                'p95_ms': round(float(np.percentile(array, 95)), 1)
+            }
+
+        with self._lock:
+            running = sum(1 for job in self._jobs.values() if job.status == 'running')
+            return {
+                'workers': self.max_workers,
+                'max_pending': self.max_pending,
+                'pending': self._pending,
+                'running': running,
+                'queued': self._pending - running,
+                **self.counters,
+                'render_time': percentiles(list(self._render_seconds)),
+                'queue_wait': percentiles(list(self._wait_seconds))
+            }
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,195 @@
+"""
+Report Cache Module
+===================
+Cache of rendered resume report PDFs.
+
+Entries are keyed by analysis id, report template version and the
+analysis' scoring version (rescoring changes the report), hashed into a
+short key that doubles as the HTTP ETag. The in-memory tier is an LRU
+bounded by total bytes; an optional disk tier keeps PDFs across restarts
+and is consulted on memory misses. The disk tier has its own byte budget
+and drops the least recently used files (by mtime) when it is exceeded.
+
+Author: CareerNexus AI
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+DEFAULT_MAX_MB = 64
+DEFAULT_DISK_MAX_MB = 512
+
+
+class ReportCache:
+    """
+    Byte-budgeted LRU cache of PDF bytes with optional disk persistence.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024, disk_dir: Optional[str] = None,
+                 max_disk_bytes: int = DEFAULT_DISK_MAX_MB * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Memory budget for cached PDFs
+            disk_dir: Directory for persisted PDFs (None = memory only)
+            max_disk_bytes: Budget for the PDFs in disk_dir
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            with self._disk_lock:
+                self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+                self._trim_disk()
+
+    @classmethod
+    def from_env(cls) -> 'ReportCache':
+        """Build a cache from REPORT_CACHE_MB, REPORT_CACHE_DIR and REPORT_CACHE_DISK_MB."""
+        max_mb = float(os.getenv('REPORT_CACHE_MB', DEFAULT_MAX_MB))
+        disk_mb = float(os.getenv('REPORT_CACHE_DISK_MB', DEFAULT_DISK_MAX_MB))
+        return cls(int(max_mb * 1024 * 1024), os.getenv('REPORT_CACHE_DIR') or None, int(disk_mb * 1024 * 1024))
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Hash the identifying parts into a short key (safe as a filename and ETag)."""
+        return hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()[:24]
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.pdf")
+
+    def _disk_files(self):
+        """(mtime, size, path) of every cached PDF on disk."""
+        files = []
+        with os.scandir(self.disk_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.pdf'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def _trim_disk(self) -> None:
+        """Delete the oldest PDFs on disk until they fit max_disk_bytes (disk lock held)."""
+        if self._disk_bytes <= self.max_disk_bytes:
+            return
+        files = sorted(self._disk_files())
+        # Re-count from the listing so files removed by hand don't skew the total
+        self._disk_bytes = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"❌ Could not evict cached report {path}: {e}")
+                continue
+            self._disk_bytes -= size
+            self.disk_evictions += 1
+
+    def _store(self, key: str, pdf_bytes: bytes) -> None:
+        """Insert into the memory tier and evict LRU entries over budget (lock held)."""
+        if len(pdf_bytes) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._bytes -= len(self._entries.pop(key))
+        self._entries[key] = pdf_bytes
+        self._bytes += len(pdf_bytes)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            pdf_bytes = self._entries.get(key)
+            if pdf_bytes is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return pdf_bytes
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            # Any read error (missing, evicted mid-read, permissions) is a miss
+            try:
+                with open(path, 'rb') as f:
+                    pdf_bytes = f.read()
+            except OSError:
+                pdf_bytes = None
+            if pdf_bytes is not None:
+                # Mark as recently used for disk eviction; the bytes are still good if this fails
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                with self._lock:
+                    self._store(key, pdf_bytes)
+                    self.disk_hits += 1
+                return pdf_bytes
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, pdf_bytes: bytes) -> None:
+        with self._lock:
+            self._store(key, pdf_bytes)
+
+        if self.disk_dir and len(pdf_bytes) <= self.max_disk_bytes:
+            path = self._disk_path(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with self._disk_lock:
+                try:
+                    replaced = os.path.getsize(path)
+                except OSError:
+                    replaced = 0
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        f.write(pdf_bytes)
+                    os.replace(tmp_path, path)
+                except OSError as e:
+                    print(f"❌ Could not persist cached report {key}: {e}")
+                    return
+                self._disk_bytes += len(pdf_bytes) - replaced
+                self._trim_disk()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_ratio': round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'disk_dir': self.disk_dir,
+                'disk_bytes': self._disk_bytes,
+                'max_disk_bytes': self.max_disk_bytes,
+                'disk_evictions': self.disk_evictions
+            }
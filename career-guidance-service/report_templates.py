@@ -0,0 +1,203 @@
+"""
+Report Templates Module
+=======================
+Styles and static content shared by the PDF report generators.
+
+getSampleStyleSheet(), the custom ParagraphStyles and the TableStyles are
+built once per process instead of on every report. Static text blocks
+(section headings, score interpretation, action plans, footers) are parsed
+once as well: StaticParagraph keeps ReportLab's parsed fragments and hands
+out a fresh Paragraph sharing them, so only data-dependent sections pay
+for markup parsing per request.
+
+Author: CareerNexus AI
+"""
+
+from functools import lru_cache
+from typing import Dict
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
+from reportlab.platypus import Paragraph, TableStyle
+
+
+@lru_cache(maxsize=None)
+def sample_styles() -> StyleSheet1:
+    """ReportLab's sample stylesheet, built once (treat as read-only)."""
+    return getSampleStyleSheet()
+
+
+# ============================================
+# CAREER REPORT (pdf_generator.py)
+# ============================================
+
+@lru_cache(maxsize=None)
+def career_report_styles() -> Dict[str, ParagraphStyle]:
+    """Paragraph styles for the career guidance report."""
+    styles = sample_styles()
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=28,
+            textColor=colors.HexColor('#4F46E5'),
+            spaceAfter=6,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#2D3748'),
+            spaceAfter=10,
+            spaceBefore=10,
+            fontName='Helvetica-Bold'
+        ),
+        'body': ParagraphStyle(
+            'CustomBody',
+            parent=styles['BodyText'],
+            fontSize=11,
+            alignment=TA_JUSTIFY,
+            spaceAfter=8
+        ),
+        'normal': styles['Normal'],
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=9,
+            alignment=TA_CENTER,
+            textColor=colors.grey
+        )
+    }
+
+
+@lru_cache(maxsize=None)
+def career_table_styles() -> Dict[str, TableStyle]:
+    """Table styles for the career guidance report."""
+    return {
+        'info': TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F3F4F6')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB'))
+        ]),
+        'skills': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4F46E5')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F9F5FF')])
+        ])
+    }
+
+
+# ============================================
+# RESUME REPORT (resume_report_generator.py)
+# ============================================
+
+@lru_cache(maxsize=None)
+def resume_report_styles() -> Dict[str, ParagraphStyle]:
+    """Paragraph styles for the resume analysis report."""
+    styles = sample_styles()
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#1a56db'),
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'subtitle': styles['Heading3'],
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#1e40af'),
+            spaceAfter=12,
+            spaceBefore=12,
+            fontName='Helvetica-Bold'
+        ),
+        'normal': ParagraphStyle(
+            'ResumeBody',
+            parent=styles['BodyText'],
+            fontSize=11,
+            spaceAfter=6
+        ),
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        )
+    }
+
+
+@lru_cache(maxsize=None)
+def resume_table_styles() -> Dict[str, TableStyle]:
+    """Table styles for the resume analysis report."""
+    return {
+        'breakdown': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e40af')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f3f4f6')),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+        ])
+    }
+
+
+# ============================================
+# STATIC PARAGRAPHS
+# ============================================
+
+class StaticParagraph:
+    """
+    Paragraph markup parsed once; flowable() returns a new Paragraph that
+    reuses the parsed fragments (layout state stays per document).
+    """
+
+    def __init__(self, text: str, style: ParagraphStyle):
+        prototype = Paragraph(text, style)
+        self.text = prototype.text
+        self.style = prototype.style
+        self.frags = prototype.frags
+
+    def flowable(self) -> Paragraph:
+        return Paragraph(self.text, self.style, frags=self.frags)
+
+
+@lru_cache(maxsize=512)
+def _static_paragraph(text: str, style: ParagraphStyle) -> StaticParagraph:
+    return StaticParagraph(text, style)
+
+
+def static_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """
+    Paragraph for text that repeats across reports (parsed once per process).
+
+    Use only for text with a small set of variants (headings, fixed blocks,
+    per-career text) - per-student values belong in a plain Paragraph.
+    """
+    return _static_paragraph(text, style).flowable()
+
+
+def clear_template_caches() -> None:
+    """Drop every cached style and parsed paragraph (used by the benchmark)."""
+    for cached in (sample_styles, career_report_styles, career_table_styles,
+                   resume_report_styles, resume_table_styles, _static_paragraph):
+        cached.cache_clear()
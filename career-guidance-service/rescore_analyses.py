@@ -0,0 +1,184 @@
+"""
+Analysis Rescoring Job
+======================
+Brings stored resume analyses up to date after WEIGHTS, MIN_* or ATS
+thresholds change in resume_scorer.py.
+
+Each analysis stores its raw scoring inputs (score_inputs) and the
+scoring_version it was scored with. This job recomputes only
+overall_score, ats_status/message/color and breakdown for analyses whose
+version is stale, using ResumeScorer.calculate_overall_scores_batch on
+chunks of analyses in parallel worker processes. PDFs are never touched
+and resumes are not re-parsed; older analyses without score_inputs are
+scored from their stored skills, keywords, projects, experience and stats.
+
+Works on the configured analysis store (analysis_store.py); use
+--store json to rescore legacy uploads/analysis_<id>.json files.
+
+Usage:
+    python rescore_analyses.py
+    python rescore_analyses.py --chunk-size 500 --workers 4
+    python rescore_analyses.py --store json   # legacy JSON files
+    python rescore_analyses.py --force        # rescore even if already current
+
+Author: CareerNexus AI
+"""
+
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from analysis_store import create_analysis_store
+from resume_scorer import (
+    ResumeScorer, SCORE_INPUT_FIELDS, build_breakdown, get_ats_band, get_score_inputs, get_scoring_version
+)
+
+DEFAULT_CHUNK_SIZE = 500
+
+COMPONENTS = ['skill_relevance', 'keywords_ats', 'projects_experience', 'structure']
+
+
+def extract_score_inputs(analysis: Dict) -> Dict:
+    """Return stored score_inputs, or rebuild them from the saved analysis fields."""
+    inputs = analysis.get('score_inputs')
+    if inputs and all(field in inputs for field in SCORE_INPUT_FIELDS):
+        return inputs
+
+    return get_score_inputs(
+        analysis.get('skills', []),
+        analysis.get('keywords', []),
+        analysis.get('projects', []),
+        analysis.get('experience', []),
+        analysis.get('stats', {})
+    )
+
+
+def apply_scores(analysis: Dict, scores: Dict, index: int, version: str) -> None:
+    """Overwrite the scoring fields of one analysis with batch result #index."""
+    overall_score = float(scores['overall_score'][index])
+    ats_status, ats_message, ats_color = get_ats_band(overall_score)
+
+    analysis['overall_score'] = overall_score
+    analysis['ats_status'] = ats_status
+    analysis['ats_message'] = ats_message
+    analysis['ats_color'] = ats_color
+    analysis['breakdown'] = build_breakdown(*[float(scores[name][index]) for name in COMPONENTS])
+    analysis['scoring_version'] = version
+
+
+def rescore_analyses(analyses: List[Dict], force: bool = False) -> List[Dict]:
+    """
+    Rescore stale analyses in place with one batch call.
+
+    Args:
+        analyses: Loaded analysis dictionaries
+        force: Rescore even if scoring_version is current
+
+    Returns:
+        The analyses that were rescored
+    """
+    version = get_scoring_version()
+    stale = [a for a in analyses if force or a.get('scoring_version') != version]
+    if not stale:
+        return []
+
+    inputs = [extract_score_inputs(a) for a in stale]
+    scores = ResumeScorer().calculate_overall_scores_batch(
+        *[[row[field] for row in inputs] for field in SCORE_INPUT_FIELDS]
+    )
+
+    for index, analysis in enumerate(stale):
+        analysis['score_inputs'] = inputs[index]
+        apply_scores(analysis, scores, index, version)
+
+    return stale
+
+
+# Store opened once per worker process
+_worker_store = None
+
+
+def _init_worker() -> None:
+    global _worker_store
+    _worker_store, _ = create_analysis_store()
+
+
+def rescore_chunk(analysis_ids: List[str], force: bool = False) -> Dict:
+    """
+    Rescore one chunk of stored analyses (runs in a worker process).
+
+    Returns:
+        {'rescored': n, 'current': n, 'errors': [{'id', 'error'}]}
+    """
+    try:
+        loaded = _worker_store.load_many(analysis_ids)
+        rescored = rescore_analyses(list(loaded.values()), force)
+        rescored_ids = {id(analysis) for analysis in rescored}
+        _worker_store.update_many({
+            analysis_id: analysis for analysis_id, analysis in loaded.items()
+            if id(analysis) in rescored_ids
+        })
+    except Exception as e:
+        chunk_label = f"{analysis_ids[0]}..{analysis_ids[-1]}"
+        return {'rescored': 0, 'current': 0, 'errors': [{'id': chunk_label, 'error': str(e)}]}
+
+    return {'rescored': len(rescored), 'current': len(loaded) - len(rescored), 'errors': []}
+
+
+def parse_args(argv=None):
+    """Parse command-line options for the rescoring job"""
+    parser = argparse.ArgumentParser(description='Rescore stored resume analyses with the current scoring config')
+    parser.add_argument('--store', choices=['sqlite', 'json'], help='Analysis store (default: ANALYSIS_STORE or sqlite)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Analyses per batch')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Worker processes')
+    parser.add_argument('--force', action='store_true', help='Rescore analyses that are already current')
+    args = parser.parse_args(argv)
+    if args.chunk_size <= 0 or args.workers <= 0:
+        parser.error('--chunk-size and --workers must be positive')
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("CareerNexus AI - Resume Analysis Rescoring")
+    print("=" * 60)
+    if args.store:
+        # Inherited by the worker processes
+        os.environ['ANALYSIS_STORE'] = args.store
+
+    store, backend = create_analysis_store()
+    print(f"Scoring version: {get_scoring_version()} | Store: {backend}")
+
+    start = time.perf_counter()
+    totals = {'rescored': 0, 'current': 0, 'errors': []}
+    chunks = store.iter_ids(args.chunk_size)
+
+    def collect(result):
+        totals['rescored'] += result['rescored']
+        totals['current'] += result['current']
+        totals['errors'].extend(result['errors'])
+
+    if args.workers == 1:
+        _init_worker()
+        for chunk in chunks:
+            collect(rescore_chunk(chunk, args.force))
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as executor:
+            for result in executor.map(rescore_chunk, chunks, itertools.repeat(args.force)):
+                collect(result)
+
+    elapsed = time.perf_counter() - start
+    print(f"✓ Rescored {totals['rescored']:,} analyses ({totals['current']:,} already current) in {elapsed:.1f}s")
+    for error in totals['errors']:
+        print(f"❌ {error['id']}: {error['error']}")
+
+    return 1 if totals['errors'] else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+"""
+Response Catalog Module
+=======================
+Pre-serialized JSON responses with strong ETags, built at startup.
+
+Warming and the read-only catalog come from roadmap_engine.warmup (shared
+with the roadmap blueprints); this module adds the encoding: each entry is
+the response body as bytes plus a hash of those bytes for conditional
+requests. Keys that were not warmed are encoded per request by lookup().
+
+Author: CareerNexus AI
+"""
+
+import hashlib
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, NamedTuple, Optional, Tuple
+
+# The shared roadmap engine package lives at the repository root
+REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from roadmap_engine.warmup import WarmCatalog, warm_catalog
+
+
+class CatalogEntry(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def encode_entry(payload: Any, dumps: Callable[[Any], str]) -> CatalogEntry:
+    """Serialize a payload (trailing newline, like jsonify) and hash it into an ETag."""
+    body = f"{dumps(payload)}\n".encode('utf-8')
+    return CatalogEntry(body, hashlib.sha256(body).hexdigest()[:32])
+
+
+class ResponseCatalog:
+    """
+    Warm catalog of key -> CatalogEntry plus the encoder used for misses.
+    """
+
+    def __init__(self, catalog: WarmCatalog, dumps: Callable[[Any], str]):
+        self.catalog = catalog
+        self.dumps = dumps
+
+    @classmethod
+    def warm(cls, items: Iterable[Tuple[Hashable, Callable[[], Any]]], dumps: Callable[[Any], str],
+             budget_seconds: float = 2.0) -> 'ResponseCatalog':
+        """
+        Encode payloads until the time budget runs out.
+
+        Args:
+            items: (key, payload factory) pairs, most important first
+            dumps: JSON encoder (use the app's, so bytes match jsonify)
+            budget_seconds: Time allowed for warming (0 = build an empty catalog)
+        """
+        catalog = warm_catalog(
+            ((key, lambda build=build: encode_entry(build(), dumps)) for key, build in items),
+            deadline=time.monotonic() + budget_seconds
+        )
+        return cls(catalog, dumps)
+
+    def get(self, key: Hashable) -> Optional[CatalogEntry]:
+        return self.catalog.get(key)
+
+    def lookup(self, key: Hashable, build: Callable[[], Any]) -> CatalogEntry:
+        """Catalog entry for key, or build() encoded now if it wasn't warmed."""
+        entry = self.get(key)
+        return entry if entry is not None else encode_entry(build(), self.dumps)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.catalog
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.catalog.get_stats(),
+            'bytes': sum(len(entry.body) for entry in self.catalog.values())
+        }
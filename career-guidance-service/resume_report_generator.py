@@ -7,28 +7,40 @@ Uses reportlab library for PDF creation.
 Author: CareerNexus AI
 """
 
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from io import BytesIO
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
 from datetime import datetime
-from typing import Dict
+from typing import BinaryIO, Dict, Optional
 
-def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
+from pdf_output import PDFBuffer
+from report_templates import resume_report_styles, resume_table_styles, static_paragraph
+
+# Bump whenever the report layout or content changes (invalidates cached PDFs)
+REPORT_TEMPLATE_VERSION = '1'
+
+NEXT_STEPS = [
+    "Focus on the critical missing skills identified in this report",
+    "Build projects to demonstrate your existing and new skills",
+    "Update your resume with action-oriented language and quantifiable achievements",
+    "Tailor your resume for specific job descriptions",
+    "Get feedback from industry professionals in your target role"
+]
+
+def generate_resume_analysis_report(analysis_data: Dict, output: Optional[BinaryIO] = None):
     """
     Generate a comprehensive PDF report for resume analysis.
     
     Args:
         analysis_data: Dictionary containing all analysis results
+        output: Writable binary stream to build the PDF into (e.g. a
+            SpooledTemporaryFile or response stream); None returns bytes
         
     Returns:
-        PDF file as bytes
+        PDF file as bytes, or `output` when one was given
     """
-    # Create PDF buffer
-    buffer = BytesIO()
+    # Build straight into the caller's stream, or a buffer that doesn't copy
+    buffer = output if output is not None else PDFBuffer()
     
     # Create PDF document
     doc = SimpleDocTemplate(
@@ -43,39 +55,18 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
     # Container for PDF elements
     elements = []
     
-    # Define styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1a56db'),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#1e40af'),
-        spaceAfter=12,
-        spaceBefore=12,
-        fontName='Helvetica-Bold'
-    )
-    
-    normal_style = styles['BodyText']
-    normal_style.fontSize = 11
-    normal_style.spaceAfter = 6
+    # Shared styles (built once per process)
+    styles = resume_report_styles()
+    heading_style = styles['heading']
+    normal_style = styles['normal']
     
     # ============================================
     # TITLE PAGE
     # ============================================
     
     elements.append(Spacer(1, 0.5 * inch))
-    elements.append(Paragraph("Resume Analysis Report", title_style))
-    elements.append(Paragraph("CareerNexus AI", styles['Heading3']))
+    elements.append(static_paragraph("Resume Analysis Report", styles['title']))
+    elements.append(static_paragraph("CareerNexus AI", styles['subtitle']))
     elements.append(Spacer(1, 0.3 * inch))
     
     # Report info
@@ -89,7 +80,7 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
     # EXECUTIVE SUMMARY
     # ============================================
     
-    elements.append(Paragraph("Executive Summary", heading_style))
+    elements.append(static_paragraph("Executive Summary", heading_style))
     
     overall_score = analysis_data.get('overall_score', 0)
     ats_status = analysis_data.get('ats_status', 'Unknown')
@@ -109,7 +100,7 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
     # RESUME SCORE BREAKDOWN
     # ============================================
     
-    elements.append(Paragraph("Score Breakdown", heading_style))
+    elements.append(static_paragraph("Score Breakdown", heading_style))
     
     breakdown = analysis_data.get('breakdown', {})
     
@@ -131,16 +122,7 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
     ]
     
     breakdown_table = Table(breakdown_data, colWidths=[2.5*inch, 1*inch, 1*inch, 1.2*inch])
-    breakdown_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e40af')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f3f4f6')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-    ]))
+    breakdown_table.setStyle(resume_table_styles()['breakdown'])
     
     elements.append(breakdown_table)
     elements.append(Spacer(1, 0.3 * inch))
@@ -149,7 +131,7 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
     # CAREER ROLE MATCHING
     # ============================================
     
-    elements.append(Paragraph("Career Role Matching", heading_style))
+    elements.append(static_paragraph("Career Role Matching", heading_style))
     
     primary_role = analysis_data.get('primary_career', {})
     role_name = primary_role.get('role', 'Unknown')
@@ -177,7 +159,7 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
     # SKILLS ANALYSIS
     # ============================================
     
-    elements.append(Paragraph("Skills Analysis", heading_style))
+    elements.append(static_paragraph("Skills Analysis", heading_style))
     
     skills_found = analysis_data.get('skills', [])
     skills_count = len(skills_found)
@@ -200,7 +182,7 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
     skill_gap = analysis_data.get('skill_gap', {})
     
     if skill_gap:
-        elements.append(Paragraph("Skill Gap Analysis", heading_style))
+        elements.append(static_paragraph("Skill Gap Analysis", heading_style))
         
         matched_skills = skill_gap.get('matched_skills', [])
         missing_critical = skill_gap.get('missing_critical', [])
@@ -209,21 +191,21 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
         
         # Strengths
         if strength_areas:
-            elements.append(Paragraph("<b>Your Strengths:</b>", normal_style))
+            elements.append(static_paragraph("<b>Your Strengths:</b>", normal_style))
             for strength in strength_areas:
                 elements.append(Paragraph(f"✓ {strength}", normal_style))
             elements.append(Spacer(1, 0.1 * inch))
         
         # Critical missing skills
         if missing_critical:
-            elements.append(Paragraph("<b>Critical Skills to Learn:</b>", normal_style))
+            elements.append(static_paragraph("<b>Critical Skills to Learn:</b>", normal_style))
             for skill in missing_critical[:10]:  # Top 10
                 elements.append(Paragraph(f"• {skill}", normal_style))
             elements.append(Spacer(1, 0.1 * inch))
         
         # Nice-to-have skills
         if missing_nice_to_have:
-            elements.append(Paragraph("<b>Nice-to-Have Skills:</b>", normal_style))
+            elements.append(static_paragraph("<b>Nice-to-Have Skills:</b>", normal_style))
             for skill in missing_nice_to_have[:5]:  # Top 5
                 elements.append(Paragraph(f"• {skill}", normal_style))
     
@@ -233,7 +215,7 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
     # IMPROVEMENT SUGGESTIONS
     # ============================================
     
-    elements.append(Paragraph("Improvement Suggestions", heading_style))
+    elements.append(static_paragraph("Improvement Suggestions", heading_style))
     
     suggestions = analysis_data.get('improvement_suggestions', [])
     
@@ -241,7 +223,7 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
         for i, suggestion in enumerate(suggestions, 1):
             elements.append(Paragraph(f"<b>{i}.</b> {suggestion}", normal_style))
     else:
-        elements.append(Paragraph("Your resume is excellent! Keep it updated with new skills and experiences.", normal_style))
+        elements.append(static_paragraph("Your resume is excellent! Keep it updated with new skills and experiences.", normal_style))
     
     elements.append(Spacer(1, 0.3 * inch))
     
@@ -249,18 +231,10 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
     # RECOMMENDATIONS
     # ============================================
     
-    elements.append(Paragraph("Next Steps", heading_style))
-    
-    next_steps = [
-        "Focus on the critical missing skills identified in this report",
-        "Build projects to demonstrate your existing and new skills",
-        "Update your resume with action-oriented language and quantifiable achievements",
-        "Tailor your resume for specific job descriptions",
-        "Get feedback from industry professionals in your target role"
-    ]
+    elements.append(static_paragraph("Next Steps", heading_style))
     
-    for step in next_steps:
-        elements.append(Paragraph(f"• {step}", normal_style))
+    for step in NEXT_STEPS:
+        elements.append(static_paragraph(f"• {step}", normal_style))
     
     elements.append(Spacer(1, 0.5 * inch))
     
@@ -268,24 +242,16 @@ def generate_resume_analysis_report(analysis_data: Dict) -> bytes:
     # FOOTER
     # ============================================
     
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.grey,
-        alignment=TA_CENTER
-    )
+    footer_style = styles['footer']
     
     elements.append(Spacer(1, 0.5 * inch))
-    elements.append(Paragraph("─────────────────────────────────", footer_style))
-    elements.append(Paragraph("Generated by CareerNexus AI - Your Career Guidance Platform", footer_style))
-    elements.append(Paragraph("For more career guidance, visit our platform", footer_style))
+    elements.append(static_paragraph("─────────────────────────────────", footer_style))
+    elements.append(static_paragraph("Generated by CareerNexus AI - Your Career Guidance Platform", footer_style))
+    elements.append(static_paragraph("For more career guidance, visit our platform", footer_style))
     
     # Build PDF
     doc.build(elements)
     
-    # Get PDF bytes
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    
-    return pdf_bytes
+    if output is not None:
+        return output
+    return buffer.getvalue()
@@ -10,7 +10,11 @@ Calculates ATS-style resume scores based on:
 Author: CareerNexus AI
 """
 
-from typing import Dict, List
+import hashlib
+import json
+from typing import Dict, List, Sequence
+
+import numpy as np
 
 # ============================================
 # SCORING WEIGHTS
@@ -32,6 +36,43 @@ MIN_PROJECTS = 1
 ATS_POOR_THRESHOLD = 40
 ATS_AVERAGE_THRESHOLD = 70
 
+# Raw inputs stored with each analysis so it can be rescored without re-parsing
+SCORE_INPUT_FIELDS = [
+    'skills_count', 'keywords_count', 'projects_count',
+    'experience_count', 'word_count', 'has_contact_info'
+]
+
+# (status, message, color) per ATS band
+ATS_BANDS = {
+    'poor': ('Poor', 'Your resume needs significant improvement for ATS systems', 'red'),
+    'average': ('Average', 'Your resume is decent but could be optimized for ATS', 'yellow'),
+    'optimized': ('ATS-Optimized', 'Your resume is well-optimized for ATS systems!', 'green')
+}
+
+
+def round_half_even(values: np.ndarray, decimals: int = 2) -> np.ndarray:
+    """
+    Round an array exactly like Python's round(x, decimals).
+
+    np.round scales by 10**decimals before rounding, so values sitting on a
+    decimal tie (e.g. 63.665) can round differently from round(). Here the
+    scaled value is split into its rounded product plus the exact rounding
+    error (Dekker's two-product), which decides ties the way round() does.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scale = 10.0 ** decimals
+
+    product = values * scale
+    split = values * 134217729.0  # 2**27 + 1
+    high = split - (split - values)
+    low = values - high
+    error = (high * scale - product) + low * scale
+
+    base = np.floor(product)
+    fraction = product - base
+    round_up = (fraction > 0.5) | ((fraction == 0.5) & ((error > 0) | ((error == 0) & (base % 2 == 1))))
+    return (base + round_up) / scale
+
 
 class ResumeScorer:
     """
@@ -222,47 +263,98 @@ class ResumeScorer:
         
         overall_score = round(overall_score, 2)
         
-        # Determine ATS status
-        if overall_score < ATS_POOR_THRESHOLD:
-            ats_status = 'Poor'
-            ats_message = 'Your resume needs significant improvement for ATS systems'
-            ats_color = 'red'
-        elif overall_score < ATS_AVERAGE_THRESHOLD:
-            ats_status = 'Average'
-            ats_message = 'Your resume is decent but could be optimized for ATS'
-            ats_color = 'yellow'
-        else:
-            ats_status = 'ATS-Optimized'
-            ats_message = 'Your resume is well-optimized for ATS systems!'
-            ats_color = 'green'
+        ats_status, ats_message, ats_color = get_ats_band(overall_score)
         
         return {
             'overall_score': overall_score,
             'ats_status': ats_status,
             'ats_message': ats_message,
             'ats_color': ats_color,
-            'breakdown': {
-                'skill_relevance': {
-                    'score': skill_score,
-                    'weight': WEIGHTS['skill_relevance'] * 100,
-                    'contribution': round(skill_score * WEIGHTS['skill_relevance'], 2)
-                },
-                'keywords_ats': {
-                    'score': keywords_score,
-                    'weight': WEIGHTS['keywords_ats'] * 100,
-                    'contribution': round(keywords_score * WEIGHTS['keywords_ats'], 2)
-                },
-                'projects_experience': {
-                    'score': projects_exp_score,
-                    'weight': WEIGHTS['projects_experience'] * 100,
-                    'contribution': round(projects_exp_score * WEIGHTS['projects_experience'], 2)
-                },
-                'structure': {
-                    'score': structure_score,
-                    'weight': WEIGHTS['structure'] * 100,
-                    'contribution': round(structure_score * WEIGHTS['structure'], 2)
-                }
-            }
+            'breakdown': build_breakdown(skill_score, keywords_score, projects_exp_score, structure_score)
+        }
+    
+    def calculate_overall_scores_batch(
+        self,
+        skills_count: Sequence[int],
+        keywords_count: Sequence[int],
+        projects_count: Sequence[int],
+        experience_count: Sequence[int],
+        word_count: Sequence[int],
+        has_contact_info: Sequence[bool]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score N resumes at once from their component counts.
+        
+        Mirrors calculate_overall_score step for step (same float operations in
+        the same order, Python-compatible rounding), so every score is
+        identical to the scalar path. The structure section checks use the
+        same skill/keyword counts, as ResumeParser.parse() reports them.
+        
+        Args:
+            skills_count: Skills found per resume
+            keywords_count: ATS keywords found per resume
+            projects_count: Projects found per resume
+            experience_count: Experience entries found per resume
+            word_count: Word count per resume
+            has_contact_info: Whether each resume has email and phone
+            
+        Returns:
+            Dictionary of length-N arrays: skill_relevance, keywords_ats,
+            projects_experience, structure, overall_score, ats_status, ats_color
+        """
+        skills = np.asarray(skills_count, dtype=np.int64)
+        keywords = np.asarray(keywords_count, dtype=np.int64)
+        projects = np.asarray(projects_count, dtype=np.int64)
+        experience = np.asarray(experience_count, dtype=np.int64)
+        words = np.asarray(word_count, dtype=np.int64)
+        contact = np.asarray(has_contact_info, dtype=bool)
+        
+        # Skill relevance
+        skill_score = np.minimum(100, (skills / 20) * 100)
+        skill_penalty = np.where(skills < MIN_SKILLS, (MIN_SKILLS - skills) * 10, 0)
+        skill_score = np.where(skills == 0, 0, round_half_even(np.maximum(0, skill_score - skill_penalty)))
+        
+        # Keywords / ATS
+        keywords_score = np.minimum(100, (keywords / 15) * 100)
+        keyword_penalty = np.where(keywords < MIN_KEYWORDS, (MIN_KEYWORDS - keywords) * 5, 0)
+        keywords_score = np.where(keywords == 0, 0, round_half_even(np.maximum(0, keywords_score - keyword_penalty)))
+        
+        # Projects & experience
+        total = np.minimum(50, (projects / 3) * 50) + np.minimum(50, (experience / 3) * 50)
+        total = np.where((projects > 0) & (experience > 0), np.minimum(100, total * 1.1), total)
+        projects_exp_score = np.where((projects == 0) & (experience == 0), 0, round_half_even(total))
+        
+        # Structure
+        length_points = np.select(
+            [(words >= 200) & (words <= 800),
+             ((words >= 100) & (words < 200)) | ((words > 800) & (words <= 1200)),
+             words > 0],
+            [40, 25, 10],
+            0
+        )
+        structure_score = (
+            np.where(contact, 30, 0) + length_points +
+            np.where(skills > 0, 15, 0) + np.where(keywords > 0, 15, 0)
+        )
+        structure_score = np.minimum(100, structure_score).astype(np.float64)
+        
+        overall_score = round_half_even(
+            skill_score * WEIGHTS['skill_relevance'] +
+            keywords_score * WEIGHTS['keywords_ats'] +
+            projects_exp_score * WEIGHTS['projects_experience'] +
+            structure_score * WEIGHTS['structure']
+        )
+        
+        bands = [overall_score < ATS_POOR_THRESHOLD, overall_score < ATS_AVERAGE_THRESHOLD]
+        
+        return {
+            'skill_relevance': skill_score,
+            'keywords_ats': keywords_score,
+            'projects_experience': projects_exp_score,
+            'structure': structure_score,
+            'overall_score': overall_score,
+            'ats_status': np.select(bands, [ATS_BANDS['poor'][0], ATS_BANDS['average'][0]], ATS_BANDS['optimized'][0]),
+            'ats_color': np.select(bands, [ATS_BANDS['poor'][2], ATS_BANDS['average'][2]], ATS_BANDS['optimized'][2])
         }
     
     def get_improvement_suggestions(
@@ -341,6 +433,62 @@ def get_scoring_weights() -> Dict[str, float]:
     """Return the scoring weights used in calculations."""
     return WEIGHTS
 
+def get_ats_band(overall_score: float):
+    """Return (status, message, color) for an overall ATS score."""
+    if overall_score < ATS_POOR_THRESHOLD:
+        return ATS_BANDS['poor']
+    if overall_score < ATS_AVERAGE_THRESHOLD:
+        return ATS_BANDS['average']
+    return ATS_BANDS['optimized']
+
+def build_breakdown(
+    skill_score: float,
+    keywords_score: float,
+    projects_exp_score: float,
+    structure_score: float
+) -> Dict:
+    """Build the per-component breakdown (score, weight %, contribution)."""
+    scores = {
+        'skill_relevance': skill_score,
+        'keywords_ats': keywords_score,
+        'projects_experience': projects_exp_score,
+        'structure': structure_score
+    }
+    return {
+        name: {
+            'score': score,
+            'weight': WEIGHTS[name] * 100,
+            'contribution': round(score * WEIGHTS[name], 2)
+        }
+        for name, score in scores.items()
+    }
+
+def get_score_inputs(
+    found_skills: List[str],
+    found_keywords: List[str],
+    projects: List[str],
+    experience: List[str],
+    resume_stats: Dict
+) -> Dict:
+    """Return the counts calculate_overall_score depends on (SCORE_INPUT_FIELDS)."""
+    return {
+        'skills_count': len(found_skills),
+        'keywords_count': len(found_keywords),
+        'projects_count': len(projects),
+        'experience_count': len(experience),
+        'word_count': resume_stats.get('word_count', 0),
+        'has_contact_info': bool(resume_stats.get('has_contact_info', False))
+    }
+
+def get_scoring_version() -> str:
+    """Fingerprint of the weights and thresholds; changes whenever scores would."""
+    config = {
+        'weights': WEIGHTS,
+        'minimums': [MIN_SKILLS, MIN_KEYWORDS, MIN_PROJECTS],
+        'thresholds': [ATS_POOR_THRESHOLD, ATS_AVERAGE_THRESHOLD]
+    }
+    return hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()[:12]
+
 def get_ats_thresholds() -> Dict[str, int]:
     """Return ATS status thresholds."""
     return {
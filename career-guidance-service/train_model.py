@@ -2,22 +2,35 @@
 CareerNexus AI - ML Model Training Script
 This script trains a RandomForestClassifier to predict suitable careers
 based on student skills, interests, and academic performance.
+
+Usage:
+    python train_model.py                                  # built-in seed data
+    python train_model.py --data assessments.csv           # CSV, loaded in chunks
+    python train_model.py --data assessments.parquet --n-jobs 4 --test-size 0.1
 """
 
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
 import pandas as pd
+from pandas.api.types import union_categoricals
 import numpy as np
 import joblib
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, classification_report
-import os
 
-# Create models directory if it doesn't exist
-os.makedirs('models', exist_ok=True)
+from model_selection import compare_models, format_results_table, measure_latency
+from prediction_cache import MODEL_MANIFEST_FILE
 
 # ============================================
-# 1. TRAINING DATA - Sample Career Dataset
+# 1. TRAINING DATA - Schema & Seed Dataset
 # ============================================
 """
 Features:
@@ -27,7 +40,19 @@ Features:
 - Target: Career label
 """
 
-training_data = {
+FEATURE_COLUMNS = [
+    'Python', 'Java', 'SQL', 'ML', 'Communication', 'ProblemSolving',
+    'Data_Interest', 'Development_Interest', 'Management_Interest',
+    'Research_Interest', 'Design_Interest', 'CGPA'
+]
+TARGET_COLUMN = 'Career'
+
+# Explicit dtypes so large files never fall back to object/float64 inference
+COLUMN_DTYPES = {column: 'float32' for column in FEATURE_COLUMNS}
+COLUMN_DTYPES[TARGET_COLUMN] = 'category'
+
+# Seed dataset used when no --data file is given
+SEED_TRAINING_DATA = {
     'Python': [4, 5, 3, 4, 5, 2, 4, 3, 5, 2, 4, 5, 3, 4, 2],
     'Java': [3, 4, 5, 3, 2, 5, 3, 5, 2, 4, 3, 4, 5, 2, 5],
     'SQL': [4, 3, 5, 5, 3, 5, 4, 5, 2, 5, 4, 3, 4, 5, 5],
@@ -59,121 +84,350 @@ training_data = {
     ]
 }
 
-df = pd.DataFrame(training_data)
+# Default cap on worker processes so a retrain doesn't starve the host
+DEFAULT_MAX_JOBS = 4
 
-print("=" * 60)
-print("CareerNexus AI - Model Training")
-print("=" * 60)
-print(f"\nDataset shape: {df.shape}")
-print(f"\nFeatures: {list(df.columns[:-1])}")
-print(f"\nTarget variable (Career): {df['Career'].unique()}")
-print(f"\nClass distribution:\n{df['Career'].value_counts()}")
 
-# ============================================
-# 2. FEATURE ENCODING & SCALING
-# ============================================
-X = df.drop('Career', axis=1)
-y = df['Career']
+def load_seed_data():
+    """Return the built-in seed dataset as a DataFrame with training dtypes"""
+    return pd.DataFrame(SEED_TRAINING_DATA).astype(COLUMN_DTYPES)
 
-# Split data (note: removed stratify due to imbalanced classes with small dataset)
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42
-)
 
-# Scale features
-scaler = StandardScaler()
-X_train_scaled = scaler.fit_transform(X_train)
-X_test_scaled = scaler.transform(X_test)
+def load_dataset(path, chunksize=100_000):
+    """
+    Load assessment records from CSV or Parquet in chunks
 
-print("\n" + "=" * 60)
-print("Feature Scaling - StandardScaler")
-print("=" * 60)
-print(f"Training set shape: {X_train_scaled.shape}")
-print(f"Test set shape: {X_test_scaled.shape}")
+    Only the feature and target columns are read, with explicit dtypes,
+    so memory stays proportional to the 12 float32 features per row.
 
-# ============================================
-# 3. TRAIN RANDOM FOREST CLASSIFIER
-# ============================================
-"""
-RandomForestClassifier is ideal for career prediction because:
-1. Handles non-linear relationships between skills/interests and careers
-2. Provides feature importance (which skills matter most)
-3. Robust to outliers
-4. No need for feature scaling (but we do it anyway for consistency)
-5. Natural probability estimates for confidence scores
-"""
+    Args:
+        path: .csv/.csv.gz or .parquet file
+        chunksize: Rows per chunk
 
-rf_model = RandomForestClassifier(
-    n_estimators=100,           # Number of trees
-    max_depth=10,               # Maximum depth to prevent overfitting
-    min_samples_split=2,        # Minimum samples to split a node
-    min_samples_leaf=1,         # Minimum samples in leaf node
-    random_state=42,
-    n_jobs=-1                   # Use all processors
-)
+    Returns:
+        DataFrame with FEATURE_COLUMNS + TARGET_COLUMN
+    """
+    columns = FEATURE_COLUMNS + [TARGET_COLUMN]
+    lower = path.lower()
 
-# Train the model
-rf_model.fit(X_train_scaled, y_train)
+    if lower.endswith('.parquet') or lower.endswith('.pq'):
+        import pyarrow.parquet as pq
 
-# ============================================
-# 4. MODEL EVALUATION
-# ============================================
-y_pred_train = rf_model.predict(X_train_scaled)
-y_pred_test = rf_model.predict(X_test_scaled)
+        parquet_file = pq.ParquetFile(path)
+        reader = (
+            batch.to_pandas().astype(COLUMN_DTYPES)
+            for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns)
+        )
+    elif lower.endswith('.csv') or lower.endswith('.csv.gz'):
+        reader = pd.read_csv(path, usecols=columns, dtype=COLUMN_DTYPES, chunksize=chunksize)
+    else:
+        raise ValueError(f"Unsupported data file (expected .csv or .parquet): {path}")
 
-train_accuracy = accuracy_score(y_train, y_pred_train)
-test_accuracy = accuracy_score(y_test, y_pred_test)
+    # Rows without a career can't be used for training
+    chunks = [chunk.dropna(subset=[TARGET_COLUMN]) for chunk in reader]
 
-print("\n" + "=" * 60)
-print("Model Performance")
-print("=" * 60)
-print(f"Training Accuracy: {train_accuracy:.2%}")
-print(f"Test Accuracy: {test_accuracy:.2%}")
-print(f"\nClassification Report (Test Set):\n")
-print(classification_report(y_test, y_pred_test))
+    # Chunks may carry different category sets; union them so the target
+    # stays categorical (concatenating would fall back to object dtype)
+    target = union_categoricals([chunk[TARGET_COLUMN] for chunk in chunks]).remove_unused_categories()
+    df = pd.concat([chunk[FEATURE_COLUMNS] for chunk in chunks], ignore_index=True)
+    df[TARGET_COLUMN] = target
+    return df[columns]
 
-# ============================================
-# 5. FEATURE IMPORTANCE
-# ============================================
-feature_importance = pd.DataFrame({
-    'Feature': X.columns,
-    'Importance': rf_model.feature_importances_
-}).sort_values('Importance', ascending=False)
 
-print("\n" + "=" * 60)
-print("Feature Importance (What matters most?)")
-print("=" * 60)
-print(feature_importance.to_string(index=False))
+def stratified_split(X, y, test_size, random_state):
+    """
+    Split into train/test sets, stratified by career when possible
 
-# ============================================
-# 6. SAVE MODELS USING JOBLIB
-# ============================================
-"""
-joblib is used for model persistence because:
-1. Efficient for large numpy arrays
-2. Preserves sklearn object structure
-3. Handles nested objects well
-4. Fast loading/saving
-"""
+    Stratification needs at least 2 samples per career; with tiny datasets
+    (such as the seed data) it falls back to a plain random split.
+    """
+    class_counts = y.value_counts()
+    class_counts = class_counts[class_counts > 0]
+    n_test = int(np.ceil(len(y) * test_size))
+    can_stratify = class_counts.min() >= 2 and n_test >= len(class_counts)
+
+    if not can_stratify:
+        print("\n⚠ Too few samples per career to stratify - using a non-stratified split")
+
+    return train_test_split(
+        X, y,
+        test_size=test_size,
+        random_state=random_state,
+        stratify=y if can_stratify else None
+    )
+
+
+def peak_rss_mb():
+    """Return the process's peak resident set size in MB (None if unavailable)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def save_artifact(obj, path):
+    """Write an artifact atomically so the service never loads a half-written file"""
+    tmp_path = f"{path}.tmp"
+    joblib.dump(obj, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def write_manifest(output_dir, filenames):
+    """
+    Write the bundle manifest atomically, after every artifact is saved
+    The service fingerprints only this file, so it reloads once per complete bundle
+    """
+    manifest = {
+        'created_at': datetime.now().isoformat(),
+        'files': {
+            name: os.path.getsize(os.path.join(output_dir, name))
+            for name in filenames
+        }
+    }
+    path = os.path.join(output_dir, MODEL_MANIFEST_FILE)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+def parse_args(argv=None):
+    """Parse command-line options for the training pipeline"""
+    parser = argparse.ArgumentParser(description='Train the CareerNexus AI career prediction model')
+    parser.add_argument('--data', help='CSV or Parquet file of assessment records (default: built-in seed data)')
+    parser.add_argument('--output-dir', default='models', help='Directory for model artifacts')
+    parser.add_argument('--chunksize', type=int, default=100_000, help='Rows per chunk when loading data')
+    parser.add_argument('--test-size', type=float, default=0.2, help='Fraction of rows held out for testing')
+    parser.add_argument('--n-estimators', type=int, default=100, help='Number of trees')
+    parser.add_argument('--max-depth', type=int, default=10, help='Maximum tree depth')
+    parser.add_argument('--n-jobs', type=int, default=min(DEFAULT_MAX_JOBS, os.cpu_count() or 1),
+                        help=f'Worker processes for training (default: min({DEFAULT_MAX_JOBS}, CPU count))')
+    parser.add_argument('--random-state', type=int, default=42, help='Random seed')
+    parser.add_argument('--latency-rows', type=int, default=200, help='Rows used to measure single-row latency')
+    parser.add_argument('--select', action='store_true',
+                        help='Compare cheaper models and export the fastest one meeting --accuracy-floor')
+    parser.add_argument('--accuracy-floor', type=float, default=None,
+                        help='Minimum validation accuracy for --select (default: forest accuracy - 0.01)')
+    parser.add_argument('--validation-size', type=float, default=0.2,
+                        help='Fraction of training rows held out to compare models for --select')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    # ============================================
+    # LOAD DATA
+    # ============================================
+    load_start = time.perf_counter()
+    df = load_dataset(args.data, args.chunksize) if args.data else load_seed_data()
+    load_seconds = time.perf_counter() - load_start
+
+    print("=" * 60)
+    print("CareerNexus AI - Model Training")
+    print("=" * 60)
+    print(f"\nData source: {args.data or 'built-in seed data'}")
+    print(f"Dataset shape: {df.shape} (loaded in {load_seconds:.2f}s)")
+    print(f"Memory usage: {df.memory_usage(deep=True).sum() / 1024 / 1024:.1f} MB")
+    print(f"\nFeatures: {FEATURE_COLUMNS}")
+    print(f"\nClass distribution:\n{df[TARGET_COLUMN].value_counts()}")
+
+    # ============================================
+    # 2. FEATURE ENCODING & SCALING
+    # ============================================
+    # Plain float32 arrays: the service passes arrays (not DataFrames) to the scaler
+    X = df[FEATURE_COLUMNS].to_numpy(dtype=np.float32)
+    y = df[TARGET_COLUMN]
+    del df
+
+    X_train, X_test, y_train, y_test = stratified_split(X, y, args.test_size, args.random_state)
+
+    # Scale features
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train).astype(np.float32)
+    X_test_scaled = scaler.transform(X_test).astype(np.float32)
+
+    print("\n" + "=" * 60)
+    print("Feature Scaling - StandardScaler")
+    print("=" * 60)
+    print(f"Training set shape: {X_train_scaled.shape}")
+    print(f"Test set shape: {X_test_scaled.shape}")
+
+    # ============================================
+    # 3. TRAIN RANDOM FOREST CLASSIFIER
+    # ============================================
+    """
+    RandomForestClassifier is ideal for career prediction because:
+    1. Handles non-linear relationships between skills/interests and careers
+    2. Provides feature importance (which skills matter most)
+    3. Robust to outliers
+    4. No need for feature scaling (but we do it anyway for consistency)
+    5. Natural probability estimates for confidence scores
+    """
+
+    rf_model = RandomForestClassifier(
+        n_estimators=args.n_estimators,   # Number of trees
+        max_depth=args.max_depth,         # Maximum depth to prevent overfitting
+        min_samples_split=2,              # Minimum samples to split a node
+        min_samples_leaf=1,               # Minimum samples in leaf node
+        random_state=args.random_state,
+        n_jobs=args.n_jobs                # Bounded worker count
+    )
+
+    # Train the model, tracking wall time and peak Python/NumPy allocations
+    tracemalloc.start()
+    train_start = time.perf_counter()
+    rf_model.fit(X_train_scaled, y_train)
+    train_seconds = time.perf_counter() - train_start
+    _, train_peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("\n" + "=" * 60)
+    print("Training Cost")
+    print("=" * 60)
+    print(f"Training time: {train_seconds:.2f}s (n_jobs={args.n_jobs})")
+    print(f"Peak traced memory during fit: {train_peak_bytes / 1024 / 1024:.1f} MB")
+    print(f"Peak process RSS: {peak_rss_mb()} MB")
+
+    # ============================================
+    # 4. MODEL EVALUATION
+    # ============================================
+    y_pred_train = rf_model.predict(X_train_scaled)
+    y_pred_test = rf_model.predict(X_test_scaled)
+
+    train_accuracy = accuracy_score(y_train, y_pred_train)
+    test_accuracy = accuracy_score(y_test, y_pred_test)
+
+    # Single-row latency (how /api/assess calls the model) and batch throughput
+    latency = measure_latency(rf_model, X_test_scaled, args.latency_rows)
+    batch_start = time.perf_counter()
+    rf_model.predict_proba(X_test_scaled)
+    batch_us_per_row = (time.perf_counter() - batch_start) / max(1, len(X_test_scaled)) * 1e6
+
+    print("\n" + "=" * 60)
+    print("Model Performance")
+    print("=" * 60)
+    print(f"Training Accuracy: {train_accuracy:.2%}")
+    print(f"Test Accuracy: {test_accuracy:.2%}")
+    print(f"Single-row latency: p50 {latency['p50_ms']}ms, p99 {latency['p99_ms']}ms")
+    print(f"Batch inference: {batch_us_per_row:.1f}µs per row")
+    print(f"\nClassification Report (Test Set):\n")
+    print(classification_report(y_test, y_pred_test, zero_division=0))
+
+    # ============================================
+    # 5. FEATURE IMPORTANCE
+    # ============================================
+    feature_importance = pd.DataFrame({
+        'Feature': FEATURE_COLUMNS,
+        'Importance': rf_model.feature_importances_
+    }).sort_values('Importance', ascending=False)
+
+    print("\n" + "=" * 60)
+    print("Feature Importance (What matters most?)")
+    print("=" * 60)
+    print(feature_importance.to_string(index=False))
+
+    # ============================================
+    # 6. LATENCY-BUDGETED MODEL SELECTION (--select)
+    # ============================================
+    serving_model = rf_model
+    selection = None
+
+    if args.select:
+        serving_model, comparison, selection = compare_models(
+            rf_model, X_train_scaled, y_train, X_test_scaled, y_test,
+            accuracy_floor=args.accuracy_floor,
+            validation_size=args.validation_size,
+            random_state=args.random_state,
+            n_jobs=args.n_jobs,
+            latency_rows=args.latency_rows
+        )
+        selection['candidates'] = comparison
+
+        print("\n" + "=" * 60)
+        print("Model Selection (accuracy vs. single-row latency)")
+        print("=" * 60)
+        print(format_results_table(comparison, selection['selected']))
+        print(f"\nServing model: {selection['selected']} ({selection['reason']})")
+        print(f"Serving model test accuracy: {selection['test_accuracy']:.2%}")
+
+    # ============================================
+    # 7. SAVE MODELS USING JOBLIB
+    # ============================================
+    """
+    joblib is used for model persistence because:
+    1. Efficient for large numpy arrays
+    2. Preserves sklearn object structure
+    3. Handles nested objects well
+    4. Fast loading/saving
+    """
+
+    model_path = os.path.join(args.output_dir, 'career_rf_model.pkl')
+    # The service always loads career_rf_model.pkl, whichever model is serving
+    save_artifact(serving_model, model_path)
+    print(f"\n✓ Model saved: {model_path}")
+
+    scaler_path = os.path.join(args.output_dir, 'scaler.pkl')
+    save_artifact(scaler, scaler_path)
+    print(f"✓ Scaler saved: {scaler_path}")
+
+    feature_names_path = os.path.join(args.output_dir, 'feature_names.pkl')
+    save_artifact(FEATURE_COLUMNS, feature_names_path)
+    print(f"✓ Feature names saved: {feature_names_path}")
+
+    classes_path = os.path.join(args.output_dir, 'career_classes.pkl')
+    save_artifact(serving_model.classes_, classes_path)
+    print(f"✓ Career classes saved: {classes_path}")
+
+    # Written last: the service only picks up the new bundle once this appears
+    manifest_path = write_manifest(args.output_dir, [
+        os.path.basename(path)
+        for path in (model_path, scaler_path, feature_names_path, classes_path)
+    ])
+    print(f"✓ Bundle manifest saved: {manifest_path}")
 
-# Save the trained model
-joblib.dump(rf_model, 'models/career_rf_model.pkl')
-print("\n✓ Model saved: models/career_rf_model.pkl")
+    # Training report so the cost of each retrain can be tracked over time
+    report = {
+        'trained_at': datetime.now().isoformat(),
+        'data_source': args.data or 'seed',
+        'rows': int(len(y)),
+        'train_rows': int(len(y_train)),
+        'test_rows': int(len(y_test)),
+        'params': {
+            'n_estimators': args.n_estimators,
+            'max_depth': args.max_depth,
+            'n_jobs': args.n_jobs,
+            'random_state': args.random_state
+        },
+        'load_seconds': round(load_seconds, 3),
+        'train_seconds': round(train_seconds, 3),
+        'train_peak_traced_mb': round(train_peak_bytes / 1024 / 1024, 1),
+        'peak_rss_mb': peak_rss_mb(),
+        'train_accuracy': round(float(train_accuracy), 4),
+        'test_accuracy': round(float(test_accuracy), 4),
+        'latency': latency,
+        'batch_us_per_row': round(batch_us_per_row, 2),
+        'serving_model': type(serving_model).__name__,
+        'model_selection': selection
+    }
+    report_path = os.path.join(args.output_dir, 'training_report.json')
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✓ Training report saved: {report_path}")
 
-# Save the scaler
-joblib.dump(scaler, 'models/scaler.pkl')
-print("✓ Scaler saved: models/scaler.pkl")
+    print("\n" + "=" * 60)
+    print("Training Complete! ✓")
+    print("=" * 60)
+    print(f"\nModel can now be used for career predictions.")
+    print(f"Next step: Run app.py to start the Flask server")
 
-# Save feature names
-joblib.dump(X.columns.tolist(), 'models/feature_names.pkl')
-print("✓ Feature names saved: models/feature_names.pkl")
+    return report
 
-# Save label encoder (careers)
-joblib.dump(rf_model.classes_, 'models/career_classes.pkl')
-print("✓ Career classes saved: models/career_classes.pkl")
 
-print("\n" + "=" * 60)
-print("Training Complete! ✓")
-print("=" * 60)
-print(f"\nModel can now be used for career predictions.")
-print(f"Next step: Run app.py to start the Flask server")
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,257 @@
+"""
+Uploads Janitor Module
+======================
+Expiry sweeper for the uploads/ directory.
+
+Resume PDFs are saved as uploads/<uuid>_<name>.pdf while they are parsed
+and analyses may be kept as uploads/analysis_<id>.json; anything left
+behind by a failed request stays forever otherwise. The janitor:
+- walks the directory incrementally with os.scandir, in batches
+- deletes temporary uploads and analysis files past their retention TTL
+- enforces a byte quota on the files it may delete (protected files such
+  as the analysis database don't count) by evicting the oldest first,
+  skipping files young enough to still be in use by a request
+- reports how many files and bytes it reclaimed
+
+It runs as a daemon thread inside the Flask app (pausing between batches
+so request threads keep the GIL) or once from the command line.
+
+Usage:
+    python uploads_janitor.py --dir uploads --temp-ttl-hours 1 --max-mb 1024
+    python uploads_janitor.py --dry-run
+
+Author: CareerNexus AI
+"""
+
+import argparse
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+DEFAULT_UPLOAD_DIR = 'uploads'
+DEFAULT_TEMP_TTL_HOURS = 1
+DEFAULT_ANALYSIS_TTL_HOURS = 24 * 30
+DEFAULT_MAX_MB = 1024
+DEFAULT_INTERVAL = 600
+DEFAULT_BATCH_SIZE = 500
+
+# Files younger than this are never evicted for the quota (an upload may
+# still be being parsed); TTL expiry is unaffected
+DEFAULT_MIN_AGE_MINUTES = 10
+
+# Pause between scandir batches so a large sweep never hogs the GIL
+BATCH_PAUSE_SECONDS = 0.01
+
+
+def _is_analysis_file(name: str) -> bool:
+    return name.startswith('analysis_') and name.endswith('.json')
+
+
+def sweep_uploads(directory: str = DEFAULT_UPLOAD_DIR,
+                  temp_ttl_seconds: Optional[float] = DEFAULT_TEMP_TTL_HOURS * 3600,
+                  analysis_ttl_seconds: Optional[float] = DEFAULT_ANALYSIS_TTL_HOURS * 3600,
+                  max_bytes: Optional[int] = DEFAULT_MAX_MB * 1024 * 1024,
+                  protected: Iterable[str] = (),
+                  min_age_seconds: float = DEFAULT_MIN_AGE_MINUTES * 60,
+                  batch_size: int = DEFAULT_BATCH_SIZE,
+                  dry_run: bool = False) -> Dict:
+    """
+    Delete expired files, then evict oldest files until under the byte quota.
+
+    Args:
+        directory: Directory to sweep (not recursive)
+        temp_ttl_seconds: Retention for temporary uploads and other files
+        analysis_ttl_seconds: Retention for analysis_<id>.json files
+        max_bytes: Byte quota for deletable files (None = unlimited)
+        protected: File names never deleted (e.g. the analysis database);
+                   they don't count towards the quota
+        min_age_seconds: Files modified more recently are not evicted for the quota
+        batch_size: Entries examined per scandir batch
+        dry_run: Report what would be deleted without deleting
+
+    Returns:
+        Sweep report with counts and bytes scanned, expired, evicted and
+        remaining (excluding protected files, reported separately)
+    """
+    start = time.perf_counter()
+    now = time.time()
+    protected = set(protected)
+
+    report = {
+        'scanned': 0,
+        'expired_files': 0,
+        'evicted_files': 0,
+        'bytes_reclaimed': 0,
+        'bytes_remaining': 0,
+        'protected_bytes': 0,
+        'errors': 0,
+        'dry_run': dry_run
+    }
+
+    def remove(path: str, size: int) -> bool:
+        if not dry_run:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                return False
+            except OSError:
+                report['errors'] += 1
+                return False
+        report['bytes_reclaimed'] += size
+        return True
+
+    if not os.path.isdir(directory):
+        report['seconds'] = 0.0
+        return report
+
+    # (mtime, size, path) of files kept after the TTL pass, for quota eviction
+    survivors = []
+    protected_bytes = 0
+
+    with os.scandir(directory) as entries:
+        for index, entry in enumerate(entries, start=1):
+            if index % batch_size == 0:
+                time.sleep(BATCH_PAUSE_SECONDS)
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                report['errors'] += 1
+                continue
+
+            report['scanned'] += 1
+            if entry.name in protected:
+                protected_bytes += stat.st_size
+                continue
+
+            ttl = analysis_ttl_seconds if _is_analysis_file(entry.name) else temp_ttl_seconds
+            if ttl and now - stat.st_mtime > ttl:
+                if remove(entry.path, stat.st_size):
+                    report['expired_files'] += 1
+                continue
+
+            survivors.append((stat.st_mtime, stat.st_size, entry.path))
+
+    # Protected files can't be evicted, so they are left out of the quota
+    total_bytes = sum(size for _, size, _ in survivors)
+
+    if max_bytes is not None and total_bytes > max_bytes:
+        survivors.sort()
+        for index, (mtime, size, path) in enumerate(survivors, start=1):
+            # Oldest first, so every remaining file is too young as well
+            if total_bytes <= max_bytes or now - mtime < min_age_seconds:
+                break
+            if index % batch_size == 0:
+                time.sleep(BATCH_PAUSE_SECONDS)
+            if remove(path, size):
+                report['evicted_files'] += 1
+                total_bytes -= size
+
+    report['bytes_remaining'] = total_bytes
+    report['protected_bytes'] = protected_bytes
+    report['seconds'] = round(time.perf_counter() - start, 3)
+    return report
+
+
+class UploadsJanitor(threading.Thread):
+    """
+    Daemon thread that sweeps the uploads directory every `interval` seconds.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, **sweep_options):
+        super().__init__(name='uploads-janitor', daemon=True)
+        self.interval = interval
+        self.sweep_options = sweep_options
+        self.last_report: Optional[Dict] = None
+        self.totals = {'sweeps': 0, 'files_reclaimed': 0, 'bytes_reclaimed': 0}
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def from_env(cls, protected: Iterable[str] = ()) -> 'UploadsJanitor':
+        """
+        Build a janitor from UPLOADS_JANITOR_INTERVAL, UPLOADS_TEMP_TTL_HOURS,
+        ANALYSIS_TTL_HOURS, UPLOADS_MAX_MB (0 disables a TTL or the quota)
+        and UPLOADS_MIN_AGE_MINUTES.
+        """
+        temp_ttl = float(os.getenv('UPLOADS_TEMP_TTL_HOURS', DEFAULT_TEMP_TTL_HOURS))
+        analysis_ttl = float(os.getenv('ANALYSIS_TTL_HOURS', DEFAULT_ANALYSIS_TTL_HOURS))
+        max_mb = float(os.getenv('UPLOADS_MAX_MB', DEFAULT_MAX_MB))
+        return cls(
+            interval=float(os.getenv('UPLOADS_JANITOR_INTERVAL', DEFAULT_INTERVAL)),
+            directory=DEFAULT_UPLOAD_DIR,
+            temp_ttl_seconds=temp_ttl * 3600 if temp_ttl > 0 else None,
+            analysis_ttl_seconds=analysis_ttl * 3600 if analysis_ttl > 0 else None,
+            max_bytes=int(max_mb * 1024 * 1024) if max_mb > 0 else None,
+            protected=list(protected),
+            min_age_seconds=float(os.getenv('UPLOADS_MIN_AGE_MINUTES', DEFAULT_MIN_AGE_MINUTES)) * 60
+        )
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                report = sweep_uploads(**self.sweep_options)
+                self.last_report = dict(report, finished_at=time.time())
+                self.totals['sweeps'] += 1
+                self.totals['files_reclaimed'] += report['expired_files'] + report['evicted_files']
+                self.totals['bytes_reclaimed'] += report['bytes_reclaimed']
+                if report['expired_files'] or report['evicted_files']:
+                    print(f"✓ Uploads janitor reclaimed {report['expired_files'] + report['evicted_files']} files "
+                          f"({report['bytes_reclaimed'] / 1024 / 1024:.1f} MB)")
+            except Exception as e:
+                print(f"❌ Uploads janitor sweep failed: {e}")
+            self._stop_event.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def stats(self) -> Dict:
+        return {'interval': self.interval, 'last_sweep': self.last_report, **self.totals}
+
+
+def parse_args(argv=None):
+    """Parse command-line options for a one-off sweep"""
+    parser = argparse.ArgumentParser(description='Sweep expired and over-quota files from uploads/')
+    parser.add_argument('--dir', default=DEFAULT_UPLOAD_DIR, help='Directory to sweep')
+    parser.add_argument('--temp-ttl-hours', type=float, default=DEFAULT_TEMP_TTL_HOURS,
+                        help='Retention for temporary uploads (0 = keep)')
+    parser.add_argument('--analysis-ttl-hours', type=float, default=DEFAULT_ANALYSIS_TTL_HOURS,
+                        help='Retention for analysis_<id>.json files (0 = keep)')
+    parser.add_argument('--max-mb', type=float, default=DEFAULT_MAX_MB,
+                        help='Byte quota for deletable files (0 = unlimited)')
+    parser.add_argument('--min-age-minutes', type=float, default=DEFAULT_MIN_AGE_MINUTES,
+                        help='Never evict files younger than this for the quota')
+    parser.add_argument('--protect', action='append', default=['analyses.db', 'analyses.db-wal', 'analyses.db-shm'],
+                        help='File name never deleted (repeatable)')
+    parser.add_argument('--dry-run', action='store_true', help='Report without deleting')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = sweep_uploads(
+        args.dir,
+        temp_ttl_seconds=args.temp_ttl_hours * 3600 if args.temp_ttl_hours > 0 else None,
+        analysis_ttl_seconds=args.analysis_ttl_hours * 3600 if args.analysis_ttl_hours > 0 else None,
+        max_bytes=int(args.max_mb * 1024 * 1024) if args.max_mb > 0 else None,
+        protected=args.protect,
+        min_age_seconds=args.min_age_minutes * 60,
+        dry_run=args.dry_run
+    )
+
+    action = 'Would reclaim' if args.dry_run else 'Reclaimed'
+    print(f"Scanned {report['scanned']:,} files in {report['seconds']}s")
+    print(f"✓ {action} {report['expired_files']:,} expired + {report['evicted_files']:,} over-quota files "
+          f"({report['bytes_reclaimed'] / 1024 / 1024:.1f} MB); "
+          f"{report['bytes_remaining'] / 1024 / 1024:.1f} MB remaining")
+    if report['errors']:
+        print(f"❌ {report['errors']} files could not be removed")
+
+
+if __name__ == '__main__':
+    main()
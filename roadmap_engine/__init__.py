@@ -0,0 +1,31 @@
+"""
+ROADMAP ENGINE
+Shared career roadmap generation for the ai-service and backend blueprints
+
+PDF export lives in roadmap_engine.pdf (needs ReportLab) and is not
+imported here.
+"""
+
+from roadmap_engine.catalog import (
+    PHASE_UNLOCK_RULES, WARMUP_ROLES, WARMUP_PATHS, PhaseView, TaskView
+)
+from roadmap_engine.engine import (
+    HEALTH_BANDS, HealthBand,
+    generate_skill_gap_tasks, organize_into_phases, schedule_roadmap,
+    generate_roadmap_skeleton, roadmap_skeleton, warm_skeletons,
+    build_phases, build_schedule, progress_layout, apply_progress,
+    calculate_health_status, calculate_impact_preview
+)
+from roadmap_engine.scheduler import CycleError, Schedule, schedule_tasks
+from roadmap_engine.warmup import JSONTemplate, WarmCatalog, warm_catalog
+
+__all__ = [
+    'PHASE_UNLOCK_RULES', 'WARMUP_ROLES', 'WARMUP_PATHS', 'PhaseView', 'TaskView',
+    'HEALTH_BANDS', 'HealthBand',
+    'generate_skill_gap_tasks', 'organize_into_phases', 'schedule_roadmap',
+    'generate_roadmap_skeleton', 'roadmap_skeleton', 'warm_skeletons',
+    'build_phases', 'build_schedule', 'progress_layout', 'apply_progress',
+    'calculate_health_status', 'calculate_impact_preview',
+    'CycleError', 'Schedule', 'schedule_tasks',
+    'JSONTemplate', 'WarmCatalog', 'warm_catalog'
+]
@@ -0,0 +1,71 @@
+"""
+ROADMAP ENGINE BENCHMARK
+Measures roadmap generation and scheduling for both roadmap blueprints
+
+"generate" builds a skeleton from the templates every time (a cache miss),
+"cached" serves the same variant from the skeleton cache and materializes
+it to plain dicts, which is what a request sees after warm-up. "schedule"
+runs the DAG scheduler on synthetic roadmaps of increasing size.
+
+Usage (from the repository root):
+    python -m roadmap_engine.benchmark
+    python -m roadmap_engine.benchmark --iterations 5000
+"""
+
+import argparse
+import random
+import time
+
+from roadmap_engine.engine import build_phases, generate_roadmap_skeleton
+from roadmap_engine.scheduler import schedule_tasks
+
+SAMPLE_VARIANT = ('Data Analyst', ('Power BI', 'Advanced Excel', 'SQL', 'Machine Learning'), 'Fresher', 'placement')
+
+
+def microseconds_per_call(call, iterations: int) -> float:
+    """Run `call` `iterations` times and return the mean time in microseconds."""
+    call()  # import / cache warm-up, not timed
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def synthetic_dag(size: int, seed: int = 7):
+    """Durations and prerequisites for `size` tasks with up to 3 earlier prerequisites each."""
+    rng = random.Random(seed)
+    durations = {f'task-{i}': rng.randint(1, 30) for i in range(size)}
+    prerequisites = {
+        f'task-{i}': [f'task-{j}' for j in rng.sample(range(i), min(i, 3))] for i in range(1, size)
+    }
+    return durations, prerequisites
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark roadmap generation and scheduling')
+    parser.add_argument('--iterations', type=int, default=1000, help='Calls per measurement')
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("CareerNexus AI - Roadmap Engine Benchmark")
+    print("=" * 60)
+
+    generate = microseconds_per_call(lambda: generate_roadmap_skeleton(*SAMPLE_VARIANT), args.iterations)
+    cached = microseconds_per_call(
+        lambda: [phase.to_dict() for phase in build_phases(*SAMPLE_VARIANT)], args.iterations
+    )
+    print(f"{'Roadmap':<24}{'us/call':>12}")
+    print(f"{'generate':<24}{generate:>12.1f}")
+    print(f"{'cached':<24}{cached:>12.1f}")
+
+    print(f"\n{'Schedule (tasks)':<24}{'us/call':>12}")
+    for size in (10, 100, 500):
+        durations, prerequisites = synthetic_dag(size)
+        elapsed = microseconds_per_call(
+            lambda: schedule_tasks(durations, prerequisites), max(1, args.iterations // size)
+        )
+        print(f"{size:<24}{elapsed:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,502 @@
+"""
+ROADMAP TASK CATALOG
+Precompiled task and phase templates for roadmap generation
+
+Templates are split once at import into static fields (shared as-is) and
+the few string fields that contain placeholders, so generating a task only
+formats what actually varies. Generated phase structures are frozen and
+cached by the engine; callers get copy-on-write views (PhaseView /
+TaskView) whose writes land in a per-view overlay, so per-user status
+never leaks into the cached roadmap.
+"""
+
+from collections.abc import MutableMapping
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Tuple
+
+# ============================================================================
+# SKILL CATALOG
+# ============================================================================
+
+SKILL_CATALOG = {
+    'Power BI': {
+        'days': 21,
+        'xp': 300,
+        'resume_boost': 12,
+        'reason': 'Power BI is critical for Data Analyst roles - essential for visualization and reporting',
+        'impact': 'Resume score +10-15%. Direct match with job requirements.'
+    },
+    'Advanced Excel': {
+        'days': 14,
+        'xp': 250,
+        'resume_boost': 8,
+        'reason': 'Foundation tool for data manipulation and pivot tables',
+        'impact': 'Resume score +8%. Core skill expected in most analyst roles.'
+    },
+    'Machine Learning': {
+        'days': 28,
+        'xp': 400,
+        'resume_boost': 15,
+        'reason': 'Differentiator for senior analyst and data scientist roles',
+        'impact': 'Resume score +15%. Opens opportunities for advanced positions.'
+    },
+    'SQL': {
+        'days': 21,
+        'xp': 300,
+        'resume_boost': 10,
+        'reason': 'Backbone of data analysis - essential for database queries',
+        'impact': 'Resume score +10%. Required for 95% of data roles.'
+    },
+    'Python': {
+        'days': 28,
+        'xp': 350,
+        'resume_boost': 12,
+        'reason': 'Most in-demand programming language for data roles',
+        'impact': 'Resume score +12%. Highly valued in analytics teams.'
+    },
+    'Tableau': {
+        'days': 18,
+        'xp': 280,
+        'resume_boost': 10,
+        'reason': 'Industry-standard visualization tool competing with Power BI',
+        'impact': 'Resume score +10%. Increases versatility in visualization skills.'
+    },
+    'Statistics': {
+        'days': 35,
+        'xp': 400,
+        'resume_boost': 13,
+        'reason': 'Foundation for hypothesis testing and data insights',
+        'impact': 'Resume score +13%. Essential for analytical credibility.'
+    },
+    'Data Visualization': {
+        'days': 21,
+        'xp': 280,
+        'resume_boost': 11,
+        'reason': 'Critical skill for communicating insights to stakeholders',
+        'impact': 'Resume score +11%. Improves presentation impact.'
+    }
+}
+
+# Skills not in the catalog ({skill} and {career_role} are filled in)
+DEFAULT_SKILL = {
+    'days': 21,
+    'xp': 300,
+    'resume_boost': 10,
+    'reason': '{skill} is a valuable skill for {career_role} roles',
+    'impact': 'Resume score +10%. Fills gap in {skill} expertise.'
+}
+
+# ============================================================================
+# TASK TEMPLATES
+# ============================================================================
+
+SKILL_TASK = {
+    'id': 'skill-{skill_slug}',
+    'title': 'Master {skill} for {career_role}',
+    'description': 'Complete comprehensive training in {skill}. Learn through hands-on projects, online courses, and real-world applications.',
+    'priority': 'High',
+    'reason': '{reason}',
+    'impact': '{impact}',
+    'metric': 'resume',
+    'estimatedDays': 0,
+    'resources': [
+        '{skill} Official Documentation',
+        'Udemy/Coursera {skill} Courses',
+        'Real-world {skill} Projects',
+        'Practice Exercises & Quizzes'
+    ],
+    'xpReward': 0,
+    'status': 'pending',
+    'locked': False,
+    'resumeBoost': 0
+}
+
+PORTFOLIO_TASK = {
+    'id': 'portfolio-projects',
+    'title': 'Build {career_role} Portfolio Projects',
+    'description': 'Create 2-3 end-to-end {career_role} projects showcasing skill application. Include data analysis, visualizations, and insights.',
+    'priority': 'High',
+    'reason': 'Portfolio is strongest proof of skills - differentiator between candidates',
+    'impact': 'Resume score +20%. Interview confidence +30%. Portfolio projects are top hiring criteria.',
+    'metric': 'portfolio',
+    'estimatedDays': 28,
+    'resources': [
+        'GitHub Portfolio Setup',
+        'Public Dataset Sources (Kaggle, UCI)',
+        '{career_role} Case Study Repositories',
+        'Project Documentation Best Practices'
+    ],
+    'xpReward': 500,
+    'status': 'pending',
+    'locked': False,
+    'portfolioBoost': 25
+}
+
+RESUME_TASK = {
+    'id': 'resume-optimization',
+    'title': 'Optimize Resume for ATS & Hiring',
+    'description': 'Tailor resume to {career_role} role. Use ATS-friendly formatting, highlight achievements with metrics, and optimize for keyword matching.',
+    'priority': 'High',
+    'reason': 'Resume is first impression - must pass ATS screening and impress hiring managers',
+    'impact': 'Resume score +15%. 40% more interview callbacks with optimized resume.',
+    'metric': 'resume',
+    'estimatedDays': 5,
+    'resources': [
+        'ATS Resume Templates',
+        'LinkedIn Profile Optimization',
+        'Action Verb Best Practices',
+        'Achievement Quantification Guide'
+    ],
+    'xpReward': 200,
+    'status': 'pending',
+    'locked': False,
+    'resumeBoost': 15
+}
+
+INTERVIEW_TASK = {
+    'id': 'interview-preparation',
+    'title': 'Prepare for {career_role} Technical Interviews',
+    'description': 'Master interview questions specific to {career_role} roles. Practice case studies, technical problems, and behavioral scenarios.',
+    'priority': 'High',
+    'reason': 'Interview is decisive stage - must demonstrate competency and confidence',
+    'impact': 'Interview readiness +35%. Confidence score +25%. Pass 90%+ of interviews with preparation.',
+    'metric': 'interview',
+    'estimatedDays': 21,
+    'resources': [
+        '{career_role} Interview Questions Database',
+        'Case Study Walkthroughs',
+        'Mock Interview Sessions',
+        'Communication Skills Training'
+    ],
+    'xpReward': 400,
+    'status': 'pending',
+    'locked': False,
+    'interviewBoost': 35
+}
+
+# Interview prep takes longer for students
+INTERVIEW_DAYS_STUDENT = 30
+
+# Final task per execution path ('studies' is also the fallback)
+PATH_TASKS = {
+    'internship': {
+        'id': 'internship-targeting',
+        'title': 'Target & Secure Internship',
+        'description': 'Create list of target companies, customize applications, practice interviews, and execute internship search strategy.',
+        'priority': 'High',
+        'reason': 'Internship provides real experience and first-resume entry point',
+        'impact': 'First professional experience +40%. CV foundation built.',
+        'metric': 'experience',
+        'estimatedDays': 60,
+        'resources': [
+            'Internship Portal Guides (LinkedIn, Unstop, AngelList)',
+            'Cover Letter Templates',
+            'Company Research Framework',
+            'Offer Negotiation Guide'
+        ],
+        'xpReward': 1000,
+        'status': 'pending',
+        'locked': False,
+        'experienceBoost': 40
+    },
+    'placement': {
+        'id': 'job-execution',
+        'title': 'Execute Job Search & Land Offer',
+        'description': 'Build targeting strategy for {career_role} roles, submit applications, pass interviews, and negotiate offer.',
+        'priority': 'High',
+        'reason': 'Job placement is end goal - requires systematic execution and persistence',
+        'impact': 'Successfully land job with 40%+ higher salary through preparation.',
+        'metric': 'experience',
+        'estimatedDays': 90,
+        'resources': [
+            'Job Portal Strategy (LinkedIn, Indeed, Naukri)',
+            'Company Target List Builder',
+            'Salary Negotiation Framework',
+            'Offer Comparison Tool'
+        ],
+        'xpReward': 2000,
+        'status': 'pending',
+        'locked': False,
+        'experienceBoost': 50
+    },
+    'studies': {
+        'id': 'further-studies',
+        'title': 'Pursue Higher Studies',
+        'description': 'Prepare for Master\'s or advanced certification in {career_role} specialization. Research programs, prepare applications.',
+        'priority': 'High',
+        'reason': 'Advanced education opens senior roles and specialization opportunities',
+        'impact': 'Career advancement +50%. Salary growth potential +30-40%.',
+        'metric': 'education',
+        'estimatedDays': 120,
+        'resources': [
+            'Program Research Framework',
+            'IELTS/GRE Preparation',
+            'SOP Writing Guide',
+            'Application Timeline Planner'
+        ],
+        'xpReward': 2000,
+        'status': 'pending',
+        'locked': False,
+        'educationBoost': 50
+    }
+}
+
+# ============================================================================
+# PHASE TEMPLATES
+# ============================================================================
+
+PHASE_TEMPLATES = (
+    {
+        'id': 'foundation',
+        'name': 'Foundation Phase',
+        'number': 1,
+        'duration': '3-4 weeks',
+        'description': 'Master core skills required for your target role. Build strong technical foundation.',
+        'icon': '🏗️',
+        'color': '#3B82F6',
+        'tasks': [],
+        'completedTasks': 0,
+        'locked': False,
+        'unlockCondition': None,
+        'progressPercent': 0
+    },
+    {
+        'id': 'portfolio',
+        'name': 'Portfolio Phase',
+        'number': 2,
+        'duration': '4 weeks',
+        'description': 'Build real-world projects to demonstrate skills. Create portfolio pieces.',
+        'icon': '📂',
+        'color': '#8B5CF6',
+        'tasks': [],
+        'completedTasks': 0,
+        'locked': True,
+        'unlockCondition': 'Complete 50% of Foundation Phase',
+        'progressPercent': 0
+    },
+    {
+        'id': 'industry',
+        'name': 'Industry Readiness',
+        'number': 3,
+        'duration': '3 weeks',
+        'description': 'Prepare for interviews and industry standards. Polish communication skills.',
+        'icon': '🚀',
+        'color': '#EC4899',
+        'tasks': [],
+        'completedTasks': 0,
+        'locked': True,
+        'unlockCondition': 'Complete 70% of Portfolio Phase',
+        'progressPercent': 0
+    },
+    {
+        'id': 'execution',
+        'name': 'Execution Phase',
+        'number': 4,
+        'duration': '2-3 months',
+        'description': 'Execute your path - job search, internships, or further studies.',
+        'icon': '⚡',
+        'color': '#10B981',
+        'tasks': [],
+        'completedTasks': 0,
+        'locked': True,
+        'unlockCondition': 'Complete 70% of Industry Readiness Phase',
+        'progressPercent': 0
+    }
+)
+
+
+# Phase -> (phase that gates it, percent of that phase's tasks to complete)
+PHASE_UNLOCK_RULES = {
+    'portfolio': ('foundation', 50),
+    'industry': ('portfolio', 70),
+    'execution': ('industry', 70)
+}
+
+
+# Task -> tasks that must finish before it starts. '@skills' is every
+# skill-gap task and '@execution' the path's final task; skill tasks
+# themselves are scheduled one after another in gap order. Edges only
+# point to tasks in the same or an earlier phase (see organize_into_phases),
+# so no task is scheduled before a phase that is still locked.
+TASK_PREREQUISITES = {
+    'portfolio-projects': ('@skills',),
+    'interview-preparation': ('@skills',),
+    'resume-optimization': ('@skills',),
+    '@execution': ('resume-optimization', 'interview-preparation')
+}
+
+
+# ============================================================================
+# WARM-UP VARIANTS
+# ============================================================================
+
+# Precomputed at startup (see engine.warm_skeletons), most requested first
+WARMUP_ROLES = (
+    'Data Analyst',
+    'Data Scientist',
+    'ML Engineer',
+    'Business Analyst',
+    'Full Stack Developer',
+    'Frontend Developer',
+    'Project Manager'
+)
+
+WARMUP_PATHS = ('placement', 'internship', 'studies')
+
+EXPERIENCE_LEVELS = ('Fresher', 'Student', 'Junior', 'Mid-level')
+
+COMMON_SKILL_GAPS = (
+    ('Power BI', 'Advanced Excel', 'SQL', 'Machine Learning'),
+    ('SQL', 'Python'),
+    ('Python', 'SQL', 'Statistics'),
+    ('Statistics', 'Machine Learning'),
+    ('Tableau', 'Data Visualization'),
+    ('Power BI', 'Advanced Excel', 'Tableau')
+)
+
+
+# ============================================================================
+# TEMPLATE COMPILATION
+# ============================================================================
+
+def _has_fields(text: str) -> bool:
+    return any(field is not None for _, field, _, _ in Formatter().parse(text))
+
+
+class CompiledTemplate:
+    """
+    A task template split into its static fields and the fields that need
+    formatting; render() formats only the latter.
+    """
+
+    __slots__ = ('static', 'dynamic', 'dynamic_lists')
+
+    def __init__(self, template: Dict[str, Any]):
+        self.static: Dict[str, Any] = {}
+        self.dynamic: List[Tuple[str, str]] = []
+        self.dynamic_lists: List[Tuple[str, Tuple[Tuple[str, bool], ...]]] = []
+        for key, value in template.items():
+            if isinstance(value, str) and _has_fields(value):
+                self.dynamic.append((key, value))
+            elif isinstance(value, list) and any(isinstance(item, str) and _has_fields(item) for item in value):
+                self.dynamic_lists.append(
+                    (key, tuple((item, isinstance(item, str) and _has_fields(item)) for item in value))
+                )
+            # Key order of the original template is kept for identical JSON
+            self.static[key] = value
+
+    def render(self, **context) -> Dict[str, Any]:
+        task = dict(self.static)
+        for key, text in self.dynamic:
+            task[key] = text.format(**context)
+        for key, items in self.dynamic_lists:
+            task[key] = [item.format(**context) if needs_format else item for item, needs_format in items]
+        for key, value in task.items():
+            if isinstance(value, list) and value is self.static[key]:
+                task[key] = list(value)
+        return task
+
+
+COMPILED_SKILL_TASK = CompiledTemplate(SKILL_TASK)
+COMPILED_PORTFOLIO_TASK = CompiledTemplate(PORTFOLIO_TASK)
+COMPILED_RESUME_TASK = CompiledTemplate(RESUME_TASK)
+COMPILED_INTERVIEW_TASK = CompiledTemplate(INTERVIEW_TASK)
+COMPILED_PATH_TASKS = {path: CompiledTemplate(template) for path, template in PATH_TASKS.items()}
+COMPILED_DEFAULT_SKILL = CompiledTemplate(DEFAULT_SKILL)
+
+
+# ============================================================================
+# FROZEN ROADMAPS AND COPY-ON-WRITE VIEWS
+# ============================================================================
+
+def freeze(value: Any) -> Any:
+    """Read-only copy: dicts become mapping proxies, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class OverlayView(MutableMapping):
+    """
+    Copy-on-write view of a frozen mapping: reads fall through to the
+    shared base, writes go to this view's overlay only.
+
+    to_dict() is a shallow copy: nested values in the base are tuples and
+    proxies, so the result can be serialized (tuples as JSON arrays) but
+    not used to modify the cache.
+    """
+
+    __slots__ = ('_base', '_overlay')
+
+    def __init__(self, base: MappingProxyType):
+        self._base = base
+        self._overlay: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._overlay:
+            return self._overlay[key]
+        return self._base[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._overlay[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError('Fields cannot be removed from a cached roadmap view')
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._base
+        for key in self._overlay:
+            if key not in self._base:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._base) + sum(1 for key in self._overlay if key not in self._base)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self._base.copy()
+        data.update(self._overlay)
+        return data
+
+
+class TaskView(OverlayView):
+    """Copy-on-write view of a cached task"""
+
+    __slots__ = ()
+
+
+class PhaseView(OverlayView):
+    """Copy-on-write view of a cached phase; 'tasks' is a list of TaskViews"""
+
+    __slots__ = ('_tasks',)
+
+    def __init__(self, base: MappingProxyType):
+        super().__init__(base)
+        self._tasks = None
+
+    @property
+    def tasks(self) -> List[TaskView]:
+        # Created on first access; untouched phases materialize straight from the base
+        if self._tasks is None:
+            self._tasks = [TaskView(task) for task in self._base['tasks']]
+        return self._tasks
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'tasks' and key not in self._overlay:
+            return self.tasks
+        return super().__getitem__(key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        if 'tasks' not in self._overlay:
+            if self._tasks is None:
+                data['tasks'] = [task.copy() for task in self._base['tasks']]
+            else:
+                data['tasks'] = [task.to_dict() for task in self._tasks]
+        return data
+
+
+def phase_views(frozen_phases: Tuple[MappingProxyType, ...]) -> List[PhaseView]:
+    return [PhaseView(phase) for phase in frozen_phases]
@@ -0,0 +1,386 @@
+"""
+ROADMAP ENGINE
+Roadmap generation shared by the ai-service and backend roadmap blueprints
+
+Skill-gap tasks, phase organization, scheduling, health and impact
+calculations. Roadmap skeletons (phases + schedule) are generated once per
+variant (career role, missing skills, experience level, path) and served
+from the warm-up catalog or an LRU cache as frozen structures; callers get
+copy-on-write views. Blueprints only add their sample/user data, progress
+and response shape on top.
+"""
+
+import os
+from functools import lru_cache, partial
+from math import ceil
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from roadmap_engine.catalog import (
+    SKILL_CATALOG, PHASE_TEMPLATES, INTERVIEW_DAYS_STUDENT, PATH_TASKS, TASK_PREREQUISITES,
+    WARMUP_ROLES, WARMUP_PATHS, EXPERIENCE_LEVELS, COMMON_SKILL_GAPS,
+    COMPILED_DEFAULT_SKILL, COMPILED_SKILL_TASK, COMPILED_PORTFOLIO_TASK,
+    COMPILED_RESUME_TASK, COMPILED_INTERVIEW_TASK, COMPILED_PATH_TASKS,
+    PhaseView, freeze, phase_views
+)
+from roadmap_engine.scheduler import Schedule, schedule_tasks, resolve_prerequisites
+from roadmap_engine.warmup import WarmCatalog, warm_catalog
+
+# Roadmap variants (career, missing skills, experience level, path) kept in memory
+ROADMAP_CACHE_SIZE = int(os.getenv('ROADMAP_CACHE_SIZE', 256))
+
+# Precomputed skeletons, replaced as a whole by warm_skeletons()
+skeleton_catalog = WarmCatalog()
+
+# ============================================================================
+# TASKS AND PHASES
+# ============================================================================
+
+def generate_skill_gap_tasks(
+    career_role: str,
+    missing_skills: List[str],
+    strength_skills: List[str],
+    experience_level: str,
+    path: str = 'placement'
+) -> List[Dict[str, Any]]:
+    """
+    Generate skill-gap-driven learning tasks
+
+    Args:
+        career_role: Target career (e.g., 'Data Analyst')
+        missing_skills: List of skills to learn
+        strength_skills: List of existing strong skills
+        experience_level: 'Student', 'Fresher', 'Junior', 'Mid-level'
+        path: 'internship', 'placement', or 'studies'
+
+    Returns:
+        List of task dictionaries with metadata
+    """
+    tasks = []
+
+    # Generate task for each missing skill
+    for skill in missing_skills:
+        skill_info = SKILL_CATALOG.get(skill) or COMPILED_DEFAULT_SKILL.render(skill=skill, career_role=career_role)
+
+        task = COMPILED_SKILL_TASK.render(
+            skill=skill,
+            skill_slug=skill.lower().replace(' ', '-'),
+            career_role=career_role,
+            reason=skill_info['reason'],
+            impact=skill_info['impact']
+        )
+        task['estimatedDays'] = skill_info['days']
+        task['xpReward'] = skill_info['xp']
+        task['resumeBoost'] = skill_info['resume_boost']
+        tasks.append(task)
+
+    # Portfolio building, resume optimization and interview preparation
+    tasks.append(COMPILED_PORTFOLIO_TASK.render(career_role=career_role))
+    tasks.append(COMPILED_RESUME_TASK.render(career_role=career_role))
+
+    interview_task = COMPILED_INTERVIEW_TASK.render(career_role=career_role)
+    if experience_level == 'Student':
+        interview_task['estimatedDays'] = INTERVIEW_DAYS_STUDENT
+    tasks.append(interview_task)
+
+    # Add path-specific execution task
+    execution_template = COMPILED_PATH_TASKS.get(path, COMPILED_PATH_TASKS['studies'])
+    tasks.append(execution_template.render(career_role=career_role))
+
+    return tasks
+
+
+def organize_into_phases(
+    all_tasks: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Organize tasks into 4 sequential career phases with locking logic
+
+    Phases:
+    1. Foundation (0-30 days) - Learn core skills, locked: false
+    2. Portfolio (30-60 days) - Build projects, locked until Phase 1 50%
+    3. Industry Readiness (60-90 days) - Interview prep, locked until Phase 2 70%
+    4. Execution (90+ days) - Apply jobs, locked until Phase 3 70%
+    """
+    phases = [dict(template, tasks=[]) for template in PHASE_TEMPLATES]
+
+    # Distribute tasks into phases
+    for task in all_tasks:
+        if task['metric'] == 'resume':  # Skill and resume optimization tasks → Foundation
+            phases[0]['tasks'].append(task)
+        elif task['id'] == 'portfolio-projects':  # Portfolio → Portfolio Phase
+            phases[1]['tasks'].append(task)
+        elif task['id'] == 'interview-preparation':  # Interview → Industry Phase
+            phases[2]['tasks'].append(task)
+        else:  # Execution tasks → Execution Phase
+            phases[3]['tasks'].append(task)
+
+    return phases
+
+
+def schedule_roadmap(all_tasks: List[Dict[str, Any]]) -> Schedule:
+    """
+    Schedule tasks by their prerequisites (TASK_PREREQUISITES), using
+    estimatedDays as durations
+
+    Skill tasks are learned one at a time in the order given; portfolio
+    projects, resume optimization and interview preparation then overlap.
+    """
+    skill_ids = [task['id'] for task in all_tasks if task['id'].startswith('skill-')]
+    groups = {
+        'skills': skill_ids,
+        'execution': [template['id'] for template in PATH_TASKS.values()]
+    }
+    prerequisites = resolve_prerequisites(all_tasks, TASK_PREREQUISITES, groups)
+    for previous, current in zip(skill_ids, skill_ids[1:]):
+        if previous != current:
+            prerequisites.setdefault(current, []).append(previous)
+
+    durations = {task['id']: task['estimatedDays'] for task in all_tasks}
+    return schedule_tasks(durations, prerequisites)
+
+
+# ============================================================================
+# ROADMAP SKELETONS
+# ============================================================================
+
+def generate_roadmap_skeleton(
+    career_role: str,
+    missing_skills: Tuple[str, ...],
+    experience_level: str,
+    path: str
+) -> Tuple[Tuple[Any, ...], Any]:
+    """
+    Frozen phase structure and schedule summary for one roadmap variant
+    (shared by all callers)
+    """
+    tasks = generate_skill_gap_tasks(career_role, list(missing_skills), [], experience_level, path)
+    schedule = schedule_roadmap(tasks)
+    critical = set(schedule.critical_path)
+    for task in tasks:
+        task['startDay'] = schedule.start[task['id']]
+        task['endDay'] = schedule.finish[task['id']]
+        task['onCriticalPath'] = task['id'] in critical
+
+    summary = {
+        'totalDays': schedule.total_days,
+        'totalWeeks': ceil(schedule.total_days / 7),
+        'order': schedule.order,
+        'criticalPath': schedule.critical_path
+    }
+    return freeze(organize_into_phases(tasks)), freeze(summary)
+
+
+_cached_roadmap = lru_cache(maxsize=ROADMAP_CACHE_SIZE)(generate_roadmap_skeleton)
+
+
+def roadmap_skeleton(
+    career_role: str,
+    missing_skills: Tuple[str, ...],
+    experience_level: str,
+    path: str
+) -> Tuple[Tuple[Any, ...], Any]:
+    """Skeleton from the warm-up catalog, or generated and kept in the LRU cache"""
+    variant = (career_role, missing_skills, experience_level, path)
+    skeleton = skeleton_catalog.get(variant)
+    return skeleton if skeleton is not None else _cached_roadmap(*variant)
+
+
+def warm_skeletons(deadline: float) -> WarmCatalog:
+    """
+    Precompute skeletons for role x path x experience level x common skill
+    gaps until time.monotonic() passes `deadline`; the rest are generated
+    on demand. Warming bypasses (and so never evicts) the LRU cache.
+    """
+    global skeleton_catalog
+    skeleton_catalog = warm_catalog(
+        ((variant, partial(generate_roadmap_skeleton, *variant))
+         for variant in (
+             (role, skills, level, path)
+             for role in WARMUP_ROLES
+             for path in WARMUP_PATHS
+             for level in EXPERIENCE_LEVELS
+             for skills in COMMON_SKILL_GAPS
+         )),
+        deadline
+    )
+    return skeleton_catalog
+
+
+def build_phases(
+    career_role: str,
+    missing_skills: Sequence[str],
+    experience_level: str,
+    path: str
+) -> List[PhaseView]:
+    """
+    Phases with tasks for a roadmap variant, generated once per
+    (career_role, missing_skills, experience_level, path)
+
+    Returns copy-on-write views: setting fields (e.g. a task's status) on a
+    view or its tasks only affects that view. to_dict() gives plain dicts.
+    """
+    phases, _ = roadmap_skeleton(career_role, tuple(missing_skills), experience_level, path)
+    return phase_views(phases)
+
+
+def build_schedule(
+    career_role: str,
+    missing_skills: Sequence[str],
+    experience_level: str,
+    path: str
+) -> Dict[str, Any]:
+    """Schedule summary (total days/weeks, topological order, critical path) for a roadmap variant"""
+    _, summary = roadmap_skeleton(career_role, tuple(missing_skills), experience_level, path)
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in summary.items()}
+
+
+@lru_cache(maxsize=ROADMAP_CACHE_SIZE)
+def progress_layout(
+    career_role: str,
+    missing_skills: Tuple[str, ...],
+    experience_level: str,
+    path: str
+) -> Tuple[List[Tuple[str, List[Tuple[str, int]]]], Dict[str, Tuple[str, int]]]:
+    """
+    Task ids and XP per phase for a roadmap variant, plus task id → (phase id, XP)
+    """
+    phases, _ = roadmap_skeleton(career_role, missing_skills, experience_level, path)
+    layout = [(phase['id'], [(task['id'], task['xpReward']) for task in phase['tasks']]) for phase in phases]
+    index = {task_id: (phase_id, xp) for phase_id, tasks in layout for task_id, xp in tasks}
+    return layout, index
+
+
+def apply_progress(phases: List[PhaseView], progress: Dict[str, Any]) -> None:
+    """Overlay a user's completions, phase counters and unlocks onto phase views"""
+    completed_ids = progress['completedTaskIds']
+    for phase in phases:
+        counters = progress['phases'].get(phase['id'])
+        if counters is None:
+            continue
+        total = counters['totalTasks']
+        phase['completedTasks'] = counters['completedTasks']
+        phase['progressPercent'] = round(counters['completedTasks'] / total * 100, 1) if total else 0
+        phase['locked'] = not counters['unlocked']
+        if counters['completedTasks']:
+            for task in phase.tasks:
+                if task['id'] in completed_ids:
+                    task['status'] = 'completed'
+
+
+# ============================================================================
+# HEALTH AND IMPACT
+# ============================================================================
+
+class HealthBand(NamedTuple):
+    """
+    One health status and the scores that earn it. Unset thresholds are not
+    checked; completion must exceed min_completion. With match_any, meeting
+    any threshold is enough instead of all of them.
+    """
+    status: str
+    reason: str
+    min_readiness: Optional[float] = None
+    min_confidence: Optional[float] = None
+    min_completion: Optional[float] = None
+    match_any: bool = False
+
+
+# Checked in order; the last band has no thresholds and always matches
+HEALTH_BANDS = (
+    HealthBand('On Track', 'Excellent progress! Readiness at {readiness_score}% and completing tasks consistently.',
+               min_readiness=70, min_confidence=75, min_completion=60),
+    HealthBand('Needs Attention', 'Good start! Maintain momentum. Focus on completing more tasks to improve readiness.',
+               min_readiness=50, min_confidence=60, min_completion=30),
+    HealthBand('Off Track', 'Get started now! Complete initial tasks to build momentum and confidence.')
+)
+
+
+def calculate_health_status(
+    readiness_score: float,
+    confidence_score: float,
+    completed_tasks: int,
+    total_tasks: int,
+    bands: Sequence[HealthBand] = HEALTH_BANDS
+) -> Dict[str, Any]:
+    """
+    Calculate health status based on scores and progress
+
+    Args:
+        bands: Status bands, first match wins (each service may use its own)
+
+    Returns:
+        {
+            'status': str,
+            'completionRate': float,
+            'readinessScore': float,
+            'confidenceScore': float,
+            'reason': str
+        }
+    """
+    completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+
+    for band in bands:
+        checks = []
+        if band.min_readiness is not None:
+            checks.append(readiness_score >= band.min_readiness)
+        if band.min_confidence is not None:
+            checks.append(confidence_score >= band.min_confidence)
+        if band.min_completion is not None:
+            checks.append(completion_rate > band.min_completion)
+        if any(checks) if band.match_any else all(checks):
+            break
+    else:
+        band = bands[-1]
+
+    return {
+        'status': band.status,
+        'completionRate': round(completion_rate, 1),
+        'readinessScore': round(readiness_score, 1),
+        'confidenceScore': round(confidence_score, 1),
+        'reason': band.reason.format(readiness_score=readiness_score)
+    }
+
+
+def calculate_impact_preview(
+    missing_skills_count: int,
+    current_resume_score: float,
+    current_readiness_score: float,
+    schedule_days: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Calculate estimated impact if roadmap is completed
+
+    Args:
+        schedule_days: Total duration of the task schedule; timelineWeeks
+            falls back to an estimate from the skill count without it
+
+    Returns impact preview with before/after scores
+    """
+    skill_impact = min(missing_skills_count * 4 + 5, 25)
+    readiness_impact = min(15 + missing_skills_count * 3, 30)
+
+    estimated_resume = min(100, current_resume_score + skill_impact)
+    estimated_readiness = min(100, current_readiness_score + readiness_impact)
+
+    if schedule_days is not None:
+        timeline_weeks = ceil(schedule_days / 7)
+    else:
+        timeline_weeks = (missing_skills_count * 3 + 12) // 4
+    success_probability = min(95, 40 + (estimated_readiness / 100 * 50))
+
+    return {
+        'currentScores': {
+            'resume': round(current_resume_score, 1),
+            'readiness': round(current_readiness_score, 1)
+        },
+        'estimatedScores': {
+            'resume': round(estimated_resume, 1),
+            'readiness': round(estimated_readiness, 1)
+        },
+        'improvements': {
+            'resume': round(skill_impact, 1),
+            'readiness': round(readiness_impact, 1)
+        },
+        'timelineWeeks': timeline_weeks,
+        'successProbability': f'{round(success_probability)}%'
+    }
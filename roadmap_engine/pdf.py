@@ -0,0 +1,387 @@
+"""
+ROADMAP PDF EXPORT
+Renders a career roadmap (phases, health, impactPreview) as a PDF with ReportLab
+
+Rendered PDFs are cached by a hash of the roadmap content, so exporting an
+unchanged roadmap again is a dictionary lookup. Large roadmaps render in a
+worker process instead of the request thread; concurrent exports of the
+same roadmap share one render.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the PDF layout changes (invalidates cached PDFs)
+ROADMAP_PDF_VERSION = '2'
+
+# Fields that change on every request without changing the roadmap itself
+VOLATILE_FIELDS = ('generatedAt',)
+
+DEFAULT_CACHE_MB = 32
+DEFAULT_INLINE_MAX_TASKS = 40
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 30
+
+
+# ============================================================================
+# CONTENT HASH
+# ============================================================================
+
+def roadmap_content_hash(roadmap: Dict[str, Any]) -> str:
+    """
+    Hash of everything that ends up in the PDF
+
+    Key order and the generatedAt timestamp don't affect the hash; the
+    layout version does. Rendering uses no clock (see render_roadmap_pdf),
+    so equal hashes mean byte-identical PDFs.
+    """
+    content = {key: value for key, value in roadmap.items() if key not in VOLATILE_FIELDS}
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(f'{ROADMAP_PDF_VERSION}|{canonical}'.encode('utf-8')).hexdigest()[:32]
+
+
+def count_tasks(roadmap: Dict[str, Any]) -> int:
+    return sum(len(phase.get('tasks', [])) for phase in roadmap.get('phases', []))
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+@lru_cache(maxsize=None)
+def _styles() -> Dict[str, Any]:
+    """Paragraph and table styles, built once per process"""
+    sample = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle(
+            'RoadmapTitle', parent=sample['Heading1'], fontSize=24, alignment=TA_CENTER,
+            textColor=colors.HexColor('#4F46E5'), spaceAfter=6, fontName='Helvetica-Bold'
+        ),
+        'subtitle': ParagraphStyle(
+            'RoadmapSubtitle', parent=sample['Normal'], fontSize=11, alignment=TA_CENTER,
+            textColor=colors.HexColor('#4B5563'), spaceAfter=14
+        ),
+        'heading': ParagraphStyle(
+            'RoadmapHeading', parent=sample['Heading2'], fontSize=15, spaceBefore=12, spaceAfter=8,
+            textColor=colors.HexColor('#1F2937'), fontName='Helvetica-Bold'
+        ),
+        'body': ParagraphStyle('RoadmapBody', parent=sample['BodyText'], fontSize=10, spaceAfter=6),
+        'cell': ParagraphStyle('RoadmapCell', parent=sample['BodyText'], fontSize=9, leading=11),
+        'small': ParagraphStyle(
+            'RoadmapSmall', parent=sample['BodyText'], fontSize=8, leading=10, textColor=colors.HexColor('#6B7280')
+        ),
+        'footer': ParagraphStyle(
+            'RoadmapFooter', parent=sample['Normal'], fontSize=8, alignment=TA_CENTER, textColor=colors.grey
+        ),
+        'table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4F46E5')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#D1D5DB')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F9FAFB')])
+        ])
+    }
+
+
+def _text(value: Any) -> str:
+    """Paragraph-safe text: markup escaped, emoji dropped (not in the PDF base fonts)"""
+    text = ''.join(
+        ch for ch in str(value)
+        if not (0x2600 <= ord(ch) < 0x2800 or ord(ch) >= 0x1F000 or ord(ch) == 0xFE0F)
+    )
+    return escape(text.strip())
+
+
+def _impact_rows(impact: Dict[str, Any]) -> Tuple[List[List[str]], Optional[Any], Optional[Any]]:
+    """
+    Score rows, timeline weeks and success probability from either impact
+    preview shape (nested currentScores/estimatedScores, or flat
+    current*/estimated* fields)
+    """
+    rows = [['Metric', 'Current', 'After Roadmap', 'Change']]
+    for metric, label in (('resume', 'Resume Score'), ('readiness', 'Readiness Score')):
+        title = metric.capitalize()
+        current = impact.get('currentScores', {}).get(metric, impact.get(f'current{title}Score'))
+        estimated = impact.get('estimatedScores', {}).get(metric, impact.get(f'estimated{title}Score'))
+        change = impact.get('improvements', {}).get(metric, impact.get(f'{metric}Improvement'))
+        if current is None and estimated is None:
+            continue
+        if isinstance(change, (int, float)):
+            change = f'+{change}'
+        rows.append([label, str(current if current is not None else '-'),
+                     str(estimated if estimated is not None else '-'), str(change or '-')])
+
+    weeks = impact.get('timelineWeeks', impact.get('completionTimeWeeks'))
+    return rows, weeks, impact.get('successProbability')
+
+
+def render_roadmap_pdf(roadmap: Dict[str, Any]) -> bytes:
+    """
+    Render a roadmap as returned by get_roadmap into PDF bytes
+
+    Sections: career and path, roadmap health, impact preview and one
+    table of tasks per phase.
+    """
+    styles = _styles()
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer, pagesize=letter, title=f"Career Roadmap - {roadmap.get('career', '')}",
+        rightMargin=0.7 * inch, leftMargin=0.7 * inch, topMargin=0.7 * inch, bottomMargin=0.6 * inch,
+        invariant=True  # fixed creation date and document id: bytes depend on content only
+    )
+    elements = []
+
+    # Header
+    elements.append(Paragraph(f"Career Roadmap: {_text(roadmap.get('career', 'Your Career'))}", styles['title']))
+    subtitle = [f"{_text(roadmap.get('path', 'placement')).capitalize()} path"]
+    if roadmap.get('experienceLevel'):
+        subtitle.append(_text(roadmap['experienceLevel']))
+    if roadmap.get('confidence') is not None:
+        subtitle.append(f"{_text(roadmap['confidence'])}% career match")
+    elements.append(Paragraph(' | '.join(subtitle), styles['subtitle']))
+
+    # Health
+    health = roadmap.get('health') or {}
+    if health:
+        elements.append(Paragraph('Roadmap Health', styles['heading']))
+        elements.append(Paragraph(
+            f"<b>Status:</b> {_text(health.get('status', 'Unknown'))}<br/>"
+            f"<b>Completion:</b> {_text(health.get('completionRate', 0))}% | "
+            f"<b>Readiness:</b> {_text(health.get('readinessScore', '-'))} | "
+            f"<b>Confidence:</b> {_text(health.get('confidenceScore', '-'))}<br/>"
+            f"{_text(health.get('reason', ''))}",
+            styles['body']
+        ))
+
+    # Impact preview
+    impact = roadmap.get('impactPreview') or {}
+    if impact:
+        elements.append(Paragraph('Impact Preview', styles['heading']))
+        rows, weeks, probability = _impact_rows(impact)
+        if len(rows) > 1:
+            table = Table(rows, colWidths=[2.2 * inch, 1.4 * inch, 1.6 * inch, 1.4 * inch])
+            table.setStyle(styles['table'])
+            elements.append(table)
+            elements.append(Spacer(1, 0.1 * inch))
+        details = []
+        if weeks is not None:
+            details.append(f"<b>Estimated timeline:</b> {_text(weeks)} weeks")
+        if probability is not None:
+            details.append(f"<b>Success probability:</b> {_text(probability)}")
+        if details:
+            elements.append(Paragraph(' | '.join(details), styles['body']))
+
+    # Phases
+    for phase in roadmap.get('phases', []):
+        elements.append(Paragraph(
+            f"Phase {_text(phase.get('number', ''))}: {_text(phase.get('name', ''))}"
+            f" <font size=10 color='#6B7280'>({_text(phase.get('duration', ''))})</font>",
+            styles['heading']
+        ))
+        if phase.get('description'):
+            elements.append(Paragraph(_text(phase['description']), styles['body']))
+        unlock = phase.get('unlockCondition') or phase.get('unlockAt')
+        if phase.get('locked') and unlock:
+            elements.append(Paragraph(f"<i>Locked: {_text(unlock)}</i>", styles['small']))
+
+        tasks = phase.get('tasks', [])
+        if not tasks:
+            elements.append(Paragraph('No tasks in this phase yet.', styles['body']))
+            continue
+
+        rows = [['Task', 'Priority', 'Days', 'XP']]
+        for task in tasks:
+            detail = f"<b>{_text(task.get('title', ''))}</b>"
+            if task.get('reason'):
+                detail += f"<br/>{_text(task['reason'])}"
+            if task.get('resources'):
+                detail += f"<br/><font size=8 color='#6B7280'>Resources: " \
+                          f"{_text(', '.join(str(r) for r in task['resources']))}</font>"
+            rows.append([
+                Paragraph(detail, styles['cell']),
+                str(task.get('priority', '-')),
+                str(task.get('estimatedDays', '-')),
+                str(task.get('xpReward', 0))
+            ])
+        table = Table(rows, colWidths=[4.6 * inch, 0.8 * inch, 0.6 * inch, 0.7 * inch], repeatRows=1)
+        table.setStyle(styles['table'])
+        elements.append(table)
+
+    # Footer
+    stats = roadmap.get('stats') or {}
+    elements.append(Spacer(1, 0.3 * inch))
+    elements.append(Paragraph(
+        f"{_text(stats.get('totalTasks', count_tasks(roadmap)))} tasks | "
+        f"{_text(stats.get('totalXP', 0))} XP available | "
+        "Generated by CareerNexus AI",
+        styles['footer']
+    ))
+
+    doc.build(elements)
+    return buffer.getvalue()
+
+
+# ============================================================================
+# CACHED EXPORTER
+# ============================================================================
+
+def _forward_result(source: Future, target: Future) -> None:
+    """Copy a finished pool future's outcome onto the exporter's placeholder"""
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+
+class RoadmapPDFExporter:
+    """
+    Content-hash cache in front of render_roadmap_pdf
+
+    Roadmaps with at most inline_max_tasks tasks render on the calling
+    thread; bigger ones go to a process pool (created on first use, with
+    forkserver or spawn so the threaded server process is never forked).
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MB * 1024 * 1024,
+                 inline_max_tasks: int = DEFAULT_INLINE_MAX_TASKS,
+                 workers: int = DEFAULT_WORKERS):
+        self.max_bytes = max_bytes
+        self.inline_max_tasks = inline_max_tasks
+        self.workers = workers
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_bytes = 0
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.stats = {'hits': 0, 'misses': 0, 'inline_renders': 0, 'pool_renders': 0, 'failures': 0}
+
+    @classmethod
+    def from_env(cls) -> 'RoadmapPDFExporter':
+        """Configure from ROADMAP_PDF_CACHE_MB, ROADMAP_PDF_INLINE_TASKS and ROADMAP_PDF_WORKERS"""
+        return cls(
+            max_bytes=int(float(os.getenv('ROADMAP_PDF_CACHE_MB', DEFAULT_CACHE_MB)) * 1024 * 1024),
+            inline_max_tasks=int(os.getenv('ROADMAP_PDF_INLINE_TASKS', DEFAULT_INLINE_MAX_TASKS)),
+            workers=int(os.getenv('ROADMAP_PDF_WORKERS', DEFAULT_WORKERS))
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+                atexit.register(self._executor.shutdown, wait=False, cancel_futures=True)
+            return self._executor
+
+    def _store(self, key: str, pdf_bytes: bytes) -> None:
+        with self._lock:
+            if len(pdf_bytes) > self.max_bytes or key in self._cache:
+                return
+            self._cache[key] = pdf_bytes
+            self._cache_bytes += len(pdf_bytes)
+            while self._cache_bytes > self.max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+
+    def cached(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            pdf_bytes = self._cache.get(key)
+            if pdf_bytes is not None:
+                self._cache.move_to_end(key)
+                self.stats['hits'] += 1
+            return pdf_bytes
+
+    def export(self, roadmap: Dict[str, Any], timeout: float = DEFAULT_TIMEOUT) -> Tuple[str, bytes]:
+        """
+        PDF for a roadmap, from cache when its content was exported before
+
+        Returns:
+            (content hash, PDF bytes)
+
+        Raises:
+            TimeoutError: A pooled render is still running after `timeout`
+                seconds; it keeps running and a later export hits the cache
+        """
+        key = roadmap_content_hash(roadmap)
+        pdf_bytes = self.cached(key)
+        if pdf_bytes is not None:
+            return key, pdf_bytes
+
+        with self._lock:
+            self.stats['misses'] += 1
+
+        if count_tasks(roadmap) <= self.inline_max_tasks:
+            with self._lock:
+                self.stats['inline_renders'] += 1
+            pdf_bytes = render_roadmap_pdf(roadmap)
+            self._store(key, pdf_bytes)
+            return key, pdf_bytes
+
+        with self._lock:
+            # Concurrent exports of the same roadmap wait on one render; the
+            # placeholder is claimed under the lock, the pool is called outside it
+            future = self._in_flight.get(key)
+            submitted = future is None
+            if submitted:
+                future = self._in_flight[key] = Future()
+                self.stats['pool_renders'] += 1
+        if submitted:
+            future.add_done_callback(lambda done: self._finished(key, done))
+            try:
+                render = self._get_executor().submit(render_roadmap_pdf, roadmap)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                render.add_done_callback(lambda done: _forward_result(done, future))
+
+        try:
+            return key, future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise TimeoutError(f'Roadmap PDF still rendering after {timeout}s')
+        except Exception:
+            with self._lock:
+                self.stats['failures'] += 1
+            raise
+
+    def _finished(self, key: str, future: Future) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if not future.cancelled() and future.exception() is None:
+            self._store(key, future.result())
+        elif not future.cancelled():
+            logger.error(f"Roadmap PDF render failed: {future.exception()}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                'entries': len(self._cache),
+                'bytes': self._cache_bytes,
+                'maxBytes': self.max_bytes,
+                'rendering': len(self._in_flight)
+            }
@@ -0,0 +1,125 @@
+"""
+ROADMAP SCHEDULER
+Dependency-aware scheduling of roadmap tasks (critical path method)
+
+Tasks are nodes of a DAG weighted by estimatedDays, with prerequisite
+edges (skills before portfolio, interview prep before the path task,
+...). One topological pass computes earliest start/finish days, a reverse
+pass computes slack, and the zero-slack chain is the critical path. Both passes
+are O(tasks + edges), so roadmaps with hundreds of tasks schedule in well
+under a millisecond per hundred tasks.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Sequence
+
+
+class CycleError(ValueError):
+    """Raised when task prerequisites form a cycle"""
+
+
+class Schedule(NamedTuple):
+    order: List[str]
+    start: Dict[str, float]
+    finish: Dict[str, float]
+    slack: Dict[str, float]
+    critical_path: List[str]
+    total_days: float
+
+
+def schedule_tasks(durations: Mapping[str, float], prerequisites: Mapping[str, Iterable[str]]) -> Schedule:
+    """
+    Earliest-start schedule and critical path of a task DAG
+
+    Args:
+        durations: task id -> duration in days (insertion order breaks ties)
+        prerequisites: task id -> ids that must finish before it starts
+
+    Raises:
+        KeyError: A prerequisite names an unknown task
+        CycleError: The prerequisites are cyclic
+    """
+    successors: Dict[str, List[str]] = {task_id: [] for task_id in durations}
+    indegree = dict.fromkeys(durations, 0)
+    for task_id, required in prerequisites.items():
+        if task_id not in durations:
+            raise KeyError(f'Unknown task {task_id}')
+        for prerequisite in required:
+            if prerequisite not in durations:
+                raise KeyError(f'Unknown prerequisite {prerequisite} for task {task_id}')
+            successors[prerequisite].append(task_id)
+            indegree[task_id] += 1
+
+    # Forward pass (Kahn's algorithm): earliest start = latest prerequisite finish
+    start = dict.fromkeys(durations, 0)
+    ready = deque(task_id for task_id, count in indegree.items() if count == 0)
+    order = []
+    while ready:
+        task_id = ready.popleft()
+        order.append(task_id)
+        finish_day = start[task_id] + durations[task_id]
+        for successor in successors[task_id]:
+            if finish_day > start[successor]:
+                start[successor] = finish_day
+            indegree[successor] -= 1
+            if indegree[successor] == 0:
+                ready.append(successor)
+
+    if len(order) != len(durations):
+        blocked = sorted(task_id for task_id, count in indegree.items() if count > 0)
+        raise CycleError(f'Task prerequisites form a cycle involving: {", ".join(blocked)}')
+
+    finish = {task_id: start[task_id] + durations[task_id] for task_id in order}
+    total_days = max(finish.values(), default=0)
+
+    # Backward pass: latest finish that doesn't delay the whole roadmap
+    latest_finish: Dict[str, float] = {}
+    for task_id in reversed(order):
+        latest_finish[task_id] = min(
+            (latest_finish[successor] - durations[successor] for successor in successors[task_id]),
+            default=total_days
+        )
+    slack = {task_id: latest_finish[task_id] - finish[task_id] for task_id in order}
+
+    # Follow zero-slack tasks that start exactly when their predecessor ends
+    critical_path = []
+    current = next((task_id for task_id in order if start[task_id] == 0 and slack[task_id] == 0), None)
+    while current is not None:
+        critical_path.append(current)
+        current = next(
+            (successor for successor in successors[current]
+             if slack[successor] == 0 and start[successor] == finish[current]),
+            None
+        )
+
+    return Schedule(order, start, finish, slack, critical_path, total_days)
+
+
+def resolve_prerequisites(tasks: Sequence[Dict[str, Any]], rules: Mapping[str, Sequence[str]],
+                          groups: Mapping[str, Iterable[str]]) -> Dict[str, List[str]]:
+    """
+    Prerequisite edges for a task list from rule templates
+
+    Rule keys and values are task ids or '@group' names; a group expands
+    to the ids in `groups` that are present in `tasks`. A task's own
+    'prerequisites' field is added on top.
+    """
+    present = [task['id'] for task in tasks]
+    present_set = set(present)
+
+    def expand(name: str) -> List[str]:
+        if name.startswith('@'):
+            return [task_id for task_id in groups.get(name[1:], ()) if task_id in present_set]
+        return [name] if name in present_set else []
+
+    prerequisites: Dict[str, List[str]] = {}
+    for target, required in rules.items():
+        required_ids = [task_id for name in required for task_id in expand(name)]
+        for task_id in expand(target):
+            prerequisites.setdefault(task_id, []).extend(
+                prerequisite for prerequisite in required_ids if prerequisite != task_id
+            )
+    for task in tasks:
+        for prerequisite in task.get('prerequisites', ()):
+            prerequisites.setdefault(task['id'], []).append(prerequisite)
+    return prerequisites
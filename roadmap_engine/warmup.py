@@ -0,0 +1,102 @@
+"""
+ROADMAP WARM-UP
+Immutable catalogs of precomputed roadmaps, filled at startup on a time budget
+
+Roadmap variants come from a small space (role x path x experience level x
+common skill gaps), so the likely ones are built once when the service
+starts. Whatever isn't ready when the budget runs out is a catalog miss and
+is generated on demand as before, so warming never delays readiness.
+
+Responses are stored pre-serialized. The one field that changes per
+request (generatedAt) is left as a gap between two byte strings that is
+filled when the response is served, so hits skip jsonify as well.
+"""
+
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+
+class WarmCatalog:
+    """Read-only key -> value mapping built within a time budget, with hit/miss counts"""
+
+    __slots__ = ('_entries', 'pending', 'warm_seconds', 'hits', 'misses', '_lock')
+
+    def __init__(self, entries: Optional[Dict[Hashable, Any]] = None, pending: int = 0, warm_seconds: float = 0.0):
+        self._entries = MappingProxyType(dict(entries or {}))
+        self.pending = pending
+        self.warm_seconds = warm_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        value = self._entries.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def values(self):
+        return self._entries.values()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {
+            'entries': len(self._entries),
+            'pending': self.pending,
+            'warmSeconds': round(self.warm_seconds, 4),
+            'hits': hits,
+            'misses': misses
+        }
+
+
+def warm_catalog(items: Iterable[Tuple[Hashable, Callable[[], Any]]], deadline: float) -> WarmCatalog:
+    """
+    Build entries from (key, factory) pairs until time.monotonic() passes
+    `deadline`; the rest are counted as pending
+    """
+    started = time.monotonic()
+    entries: Dict[Hashable, Any] = {}
+    pending = 0
+    for key, build in items:
+        if time.monotonic() >= deadline:
+            pending += 1
+            continue
+        entries[key] = build()
+    return WarmCatalog(entries, pending, time.monotonic() - started)
+
+
+class JSONTemplate:
+    """
+    Pre-serialized JSON body with a single value left open
+
+    The payload is encoded with a sentinel in place of the open value and
+    split around it; render() joins the two halves with the encoded value.
+    """
+
+    __slots__ = ('head', 'tail', '_dumps')
+
+    SENTINEL = '\x00roadmap-warmup\x00'
+
+    def __init__(self, payload: Any, dumps: Callable[[Any], str]):
+        text = f"{dumps(payload)}\n"
+        parts = text.split(dumps(self.SENTINEL))
+        if len(parts) != 2:
+            raise ValueError('Payload must contain the sentinel exactly once')
+        self.head = parts[0].encode('utf-8')
+        self.tail = parts[1].encode('utf-8')
+        self._dumps = dumps
+
+    def render(self, value: Any) -> bytes:
+        return b''.join((self.head, self._dumps(value).encode('utf-8'), self.tail))